@@ -133,8 +133,13 @@ def main():
     # Example 6: Get render download links
     print("\n=== Getting Render Download Links ===")
     try:
-        # For this example, let's assume the render is completed
-        # In a real app, you would poll for status or use a webhook
+        # Wait for the render to finish (polls with increasing intervals)
+        final_status = client.render.wait_for_render(
+            render_id="render_abc123",  # Replace with actual ID
+            timeout=600
+        )
+        print(f"Render finished with status: {final_status.get('status')}")
+        
         links = client.render.get_render_download_links(
             render_id="render_abc123"  # Replace with actual ID
         )
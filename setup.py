@@ -18,8 +18,16 @@ setup(
     package_dir={'': 'src'},
     url='https://github.com/Kawai-Senpai/Storylinez-SDK',
     install_requires=[
+        'requests',
+        'urllib3>=1.26',  # Retry(allowed_methods=...) and Retry.DEFAULT_ALLOWED_METHODS
         'python-dotenv',
         'ultraprint>=3.3.0',
     ],
+    extras_require={
+        'async': ['httpx[http2]'],
+        'fast': ['orjson'],
+        'brotli': ['brotli'],
+        'stream': ['ijson'],
+    },
     python_requires='>=3.6',
 )
@@ -14,6 +14,12 @@ from .utils import UtilsClient
 from .settings import SettingsClient
 from .user import UserClient
 from .tools import ToolsClient
+from .async_render import AsyncRenderClient
+from .async_search import AsyncSearchClient
+from .async_stock import AsyncStockClient
+from .async_settings import AsyncSettingsClient
+from .async_storage import AsyncStorageClient
+from .async_storyboard import AsyncStoryboardClient
 
 __all__ = [
     'StorylinezClient', 
@@ -31,5 +37,11 @@ __all__ = [
     'UtilsClient',
     'SettingsClient',
     'UserClient',
-    'ToolsClient'
+    'ToolsClient',
+    'AsyncRenderClient',
+    'AsyncSearchClient',
+    'AsyncStockClient',
+    'AsyncSettingsClient',
+    'AsyncStorageClient',
+    'AsyncStoryboardClient'
 ]
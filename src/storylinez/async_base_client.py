@@ -0,0 +1,161 @@
+import asyncio
+from typing import Dict, Any, Optional, AsyncIterator, Awaitable, Callable
+from .base_client import BaseClient, httpx, _HTTP2_AVAILABLE, _json_dumps, _json_loads, _has_more_pages
+
+class AsyncBaseClient:
+    """
+    Base class for asyncio clients built on httpx.AsyncClient.
+
+    A single AsyncClient is shared by all requests made through the instance, so many
+    concurrent calls reuse a small pool of connections (multiplexed over HTTP/2 when
+    the 'h2' package is installed).
+    """
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str, default_org_id: str = None):
+        if httpx is None:
+            raise ImportError(
+                "The async clients require httpx. Install it with: pip install 'storylinez[async]'"
+            )
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.base_url = base_url.rstrip('/')
+        self.default_org_id = default_org_id
+        self._client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0)
+        )
+
+    _require_org_id = BaseClient._require_org_id
+    _build_edit = BaseClient._build_edit
+
+    def _get_headers(self) -> Dict[str, str]:
+        return {
+            "X-API-Key": self.api_key,
+            "X-API-Secret": self.api_secret,
+            "Content-Type": "application/json",
+        }
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def _iter_pages(self, fetch: Callable[[int], Awaitable[Dict]], items_key: str, page: int,
+                          limit: int) -> AsyncIterator[Dict]:
+        """Yield the items of a page/limit listing, fetching each next page concurrently (see BaseClient._iter_pages)."""
+        result = await fetch(page)
+        while True:
+            items = result.get(items_key) or []
+            task = None
+            if _has_more_pages(result, items, page, limit):
+                task = asyncio.ensure_future(fetch(page + 1))
+            try:
+                for item in items:
+                    yield item
+            except GeneratorExit:
+                if task is not None:
+                    task.cancel()  # Iteration stopped early
+                raise
+            if task is None:
+                return
+            result = await task
+            page += 1
+
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        params: Dict = None,
+        json_data: Dict = None,
+        json: Dict = None,
+        data: Any = None,
+        files: Dict = None,
+        headers: Dict = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        validator: Optional[Dict] = None,
+        coalesce: bool = True
+    ) -> Dict:
+        """
+        Make an HTTP request with support for JSON payloads.
+
+        Mirrors BaseClient._make_request, but awaits the response and backs off with
+        asyncio.sleep so other requests keep running while one is retried.
+
+        Args:
+            method (str): HTTP method (GET, POST, etc.).
+            url (str): The URL to send the request to.
+            params (Dict, optional): Query parameters.
+            json_data (Dict, optional): JSON data to send in the request body. Takes precedence over 'json' if both are provided.
+            json (Dict, optional): Alternative keyword for JSON data. Used if 'json_data' is not provided.
+            data (Any, optional): Data to send in the request body (for non-JSON payloads).
+            files (Dict, optional): Files to upload.
+            headers (Dict, optional): Additional headers.
+            max_retries (int, optional): Maximum number of retries for network errors.
+            retry_delay (float, optional): Initial delay between retries in seconds.
+            validator (Dict, optional): Cache entry for a conditional request. Its "etag" is sent as
+                If-None-Match; a 304 response returns a copy of its "body", and a response carrying
+                an ETag stores the new etag and body in it.
+            coalesce (bool, optional): Accepted for compatibility with BaseClient._make_request;
+                this client never merges concurrent requests.
+
+        Returns:
+            Dict: The JSON response from the API.
+
+        Raises:
+            Exception: If the request fails after retries or returns an error status.
+        """
+        request_headers = self._get_headers()
+        if headers:
+            request_headers.update(headers)
+        if validator and validator.get("etag"):
+            request_headers["If-None-Match"] = validator["etag"]
+
+        # Prefer json_data if both are provided
+        json_payload = json_data if json_data is not None else json
+        content = None
+        if json_payload is not None and data is None and files is None:
+            content = _json_dumps(json_payload)
+            json_payload = None
+
+        retries = 0
+        while True:
+            try:
+                response = await self._client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_payload,
+                    content=content,
+                    data=data,
+                    files=files,
+                    headers=request_headers
+                )
+            except httpx.TransportError as e:
+                retries += 1
+                if retries > max_retries:
+                    raise Exception(f"Maximum retry attempts reached after network errors: {str(e)}")
+
+                # Exponential backoff
+                await asyncio.sleep(retry_delay * (2 ** (retries - 1)))
+                continue
+
+            if response.status_code >= 400:
+                error_message = f"API request failed with status {response.status_code}"
+                try:
+                    error_data = _json_loads(response.content)
+                    if "error" in error_data:
+                        error_message = f"{error_message}: {error_data['error']}"
+                except Exception:
+                    if response.text:
+                        error_message = f"{error_message}: {response.text}"
+                raise Exception(error_message)
+            if validator is not None:
+                return BaseClient._apply_validator(validator, response)
+            return _json_loads(response.content)
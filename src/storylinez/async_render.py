@@ -0,0 +1,317 @@
+import asyncio
+import random
+import time
+import uuid
+from typing import Dict, List, Optional, Any, Callable
+from .async_base_client import AsyncBaseClient
+from .base_client import _BOOL_STR
+from .render import (
+    RenderClient, TERMINAL_RENDER_STATUSES, _RESERVED_RENDER_KEYS, _RENDER_ENDPOINTS,
+    _STATUS_FIELDS, _LINK_FIELDS
+)
+
+class AsyncRenderClient(AsyncBaseClient):
+    """
+    Asyncio client for the Storylinez Render API.
+
+    Mirrors RenderClient for workflows that orchestrate many renders at once, e.g.
+    await asyncio.gather(*(client.wait_for_render(render_id=rid) for rid in render_ids)).
+    Render settings are validated exactly as in RenderClient.
+    """
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None):
+        """
+        Initialize the AsyncRenderClient.
+
+        Args:
+            api_key: Your Storylinez API Key
+            api_secret: Your Storylinez API Secret
+            base_url: Base URL for the API (defaults to production)
+            default_org_id: Default organization ID to use for all API calls (optional)
+        """
+        super().__init__(api_key, api_secret, base_url, default_org_id)
+        self.render_url = f"{self.base_url}/render"
+        self._urls = {endpoint: f"{self.render_url}/{endpoint}" for endpoint in _RENDER_ENDPOINTS}
+
+    @staticmethod
+    def _require_ids(render_id: Optional[str], project_id: Optional[str]) -> Dict[str, str]:
+        """Return the identifying fields for a request, requiring at least one of them"""
+        if not render_id and not project_id:
+            raise ValueError("Either render_id or project_id must be provided")
+        ids = {}
+        if render_id:
+            ids["render_id"] = render_id
+        if project_id:
+            ids["project_id"] = project_id
+        return ids
+
+    # Render Creation and Management
+
+    async def create_render(self, project_id: str, **settings) -> Dict:
+        """
+        Create a new render for a project. The project must have an existing sequence.
+
+        Args:
+            project_id: ID of the project to create the render for
+            **settings: Render settings, as accepted by RenderClient.create_render
+
+        Returns:
+            Dictionary with the created render details and job information
+        """
+        if not project_id:
+            raise ValueError("project_id is required")
+
+        RenderClient._warn_unknown_settings(settings.keys())
+        data = {"project_id": project_id}
+        data.update(RenderClient._normalize_settings(settings))
+
+        return await self._make_request("POST", self._urls["create"], json_data=data,
+                                        headers={"Idempotency-Key": str(uuid.uuid4())})
+
+    async def get_render(
+        self,
+        render_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        include_results: bool = True,
+        include_sequence: bool = False,
+        include_subtitles: bool = False,
+        generate_download_link: bool = False,
+        generate_streamable_link: bool = False,
+        generate_thumbnail_stream_link: bool = False,
+        fields: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        Get details of a render by either render ID or project ID.
+
+        Args:
+            render_id: ID of the render to retrieve (either this or project_id must be provided)
+            project_id: ID of the project to retrieve the render for (either this or render_id must be provided)
+            include_results: Whether to include job results
+            include_sequence: Whether to include the full sequence data
+            include_subtitles: Whether to include subtitles data
+            generate_download_link: Whether to generate a temporary download link
+            generate_streamable_link: Whether to generate a temporary streamable link
+            generate_thumbnail_stream_link: Whether to generate a thumbnail streamable link
+            fields: Optional list of top-level fields to return; the server omits everything else
+
+        Returns:
+            Dictionary with render details
+        """
+        params = {
+            "include_results": _BOOL_STR[bool(include_results)],
+            "include_sequence": _BOOL_STR[bool(include_sequence)],
+            "include_subtitles": _BOOL_STR[bool(include_subtitles)],
+            "generate_download_link": _BOOL_STR[bool(generate_download_link)],
+            "generate_streamable_link": _BOOL_STR[bool(generate_streamable_link)],
+            "generate_thumbnail_stream_link": _BOOL_STR[bool(generate_thumbnail_stream_link)]
+        }
+        params.update(self._require_ids(render_id, project_id))
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        return await self._make_request("GET", self._urls["get"], params=params)
+
+    async def redo_render(self, render_id: Optional[str] = None, project_id: Optional[str] = None, **settings) -> Dict:
+        """
+        Regenerate a render with the same or updated settings.
+
+        Args:
+            render_id: ID of the render to regenerate (either this or project_id must be provided)
+            project_id: ID of the project whose render to regenerate (either this or render_id must be provided)
+            **settings: Optional setting overrides, as accepted by RenderClient.redo_render
+
+        Returns:
+            Dictionary with the regeneration job details
+        """
+        data = self._require_ids(render_id, project_id)
+        RenderClient._warn_unknown_settings(settings.keys())
+        data.update(RenderClient._normalize_settings(
+            {key: value for key, value in settings.items() if key not in _RESERVED_RENDER_KEYS}
+        ))
+
+        return await self._make_request("POST", self._urls["redo"], json_data=data,
+                                        headers={"Idempotency-Key": str(uuid.uuid4())})
+
+    async def update_render_settings(self, render_id: Optional[str] = None, project_id: Optional[str] = None, **settings) -> Dict:
+        """
+        Update render settings without regenerating.
+
+        Args:
+            render_id: ID of the render to update (either this or project_id must be provided)
+            project_id: ID of the project whose render to update (either this or render_id must be provided)
+            **settings: Settings to update, as accepted by RenderClient.update_render_settings
+
+        Returns:
+            Dictionary with update confirmation
+        """
+        data = self._require_ids(render_id, project_id)
+        RenderClient._warn_unknown_settings(settings.keys())
+        updates = RenderClient._normalize_settings(
+            {key: value for key, value in settings.items() if key not in _RESERVED_RENDER_KEYS}
+        )
+        if not updates:
+            raise ValueError("At least one setting must be provided to update")
+        data.update(updates)
+
+        return await self._make_request("PUT", self._urls["update"], json_data=data)
+
+    async def update_render(
+        self,
+        render_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        fields_to_update: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        Update a render with the latest sequence data from its source project.
+
+        Args:
+            render_id: ID of the render to update (either this or project_id must be provided)
+            project_id: ID of the project whose render to update (either this or render_id must be provided)
+            fields_to_update: Optional list of specific fields to update from the source data
+
+        Returns:
+            Dictionary with update confirmation
+        """
+        data = self._require_ids(render_id, project_id)
+        if fields_to_update:
+            if not isinstance(fields_to_update, list):
+                raise TypeError("fields_to_update must be a list of strings")
+            data["fields_to_update"] = fields_to_update
+
+        return await self._make_request("PUT", self._urls["selfupdate"], json_data=data)
+
+    async def get_render_status(self, render_id: Optional[str] = None, project_id: Optional[str] = None) -> Dict:
+        """
+        Get the current status of a render job.
+
+        Args:
+            render_id: ID of the render to check (either this or project_id must be provided)
+            project_id: ID of the project whose render to check (either this or render_id must be provided)
+
+        Returns:
+            Dictionary with render status information, as returned by RenderClient.get_render_status
+        """
+        result = await self.get_render(render_id, project_id, include_results=True,
+                                       include_sequence=False, include_subtitles=False,
+                                       fields=_STATUS_FIELDS)
+        return RenderClient._status_from_render(result)
+
+    async def get_render_download_links(
+        self,
+        render_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        render_data: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Get download and streaming links for a completed render.
+
+        Args:
+            render_id: ID of the render (either this or project_id must be provided)
+            project_id: ID of the project whose render to access (either this or render_id must be provided)
+            render_data: Optional get_render response that already contains the links
+
+        Returns:
+            Dictionary with download and streaming URLs, as returned by RenderClient.get_render_download_links
+
+        Raises:
+            Exception: If the render is not yet complete
+        """
+        if RenderClient._has_download_links(render_data):
+            result = render_data
+        else:
+            result = await self.get_render(
+                render_id, project_id,
+                include_results=True,
+                generate_download_link=True,
+                generate_streamable_link=True,
+                generate_thumbnail_stream_link=True,
+                fields=_LINK_FIELDS
+            )
+        return RenderClient._links_from_render(result)
+
+    # Bulk operations
+
+    async def get_render_statuses(self, render_ids: List[str], max_concurrency: int = 8) -> Dict[str, Dict]:
+        """
+        Get the status of several renders concurrently.
+
+        Args:
+            render_ids: List of render IDs to check
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Dictionary mapping each render ID to its status.
+            Renders that could not be fetched map to a dictionary with an "error" key.
+        """
+        if not isinstance(render_ids, list):
+            raise TypeError("render_ids must be a list of strings")
+        unique_ids = list(dict.fromkeys(rid for rid in render_ids if rid))
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(render_id: str) -> Dict:
+            async with semaphore:
+                try:
+                    return await self.get_render_status(render_id=render_id)
+                except Exception as e:
+                    return {"render_id": render_id, "error": str(e)}
+
+        results = await asyncio.gather(*(run(render_id) for render_id in unique_ids))
+        return dict(zip(unique_ids, results))
+
+    # Advanced workflows
+
+    async def wait_for_render(
+        self,
+        render_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        timeout: float = 1800,
+        initial_interval: float = 2.0,
+        max_interval: float = 30.0,
+        on_progress: Optional[Callable[[Dict], Any]] = None
+    ) -> Dict:
+        """
+        Wait for a render job to reach a terminal state (COMPLETED, FAILED or CANCELLED).
+
+        Uses the same backoff schedule as RenderClient.wait_for_render, but sleeps with
+        asyncio.sleep so other renders can be awaited in the meantime.
+
+        Args:
+            render_id: ID of the render to wait for (either this or project_id must be provided)
+            project_id: ID of the project whose render to wait for (either this or render_id must be provided)
+            timeout: Maximum time to wait in seconds
+            initial_interval: Delay before the second status check in seconds
+            max_interval: Upper bound for the delay between status checks in seconds
+            on_progress: Optional callback (plain function or coroutine function) invoked with each status dictionary
+
+        Returns:
+            The final status dictionary
+
+        Raises:
+            ValueError: If neither render_id nor project_id is provided
+            TimeoutError: If the render doesn't reach a terminal state within the timeout
+        """
+        self._require_ids(render_id, project_id)
+
+        deadline = time.time() + timeout
+        attempt = 0
+        while True:
+            status_result = await self.get_render_status(render_id=render_id, project_id=project_id)
+
+            if on_progress:
+                try:
+                    callback_result = on_progress(status_result)
+                    if asyncio.iscoroutine(callback_result):
+                        await callback_result
+                except Exception:
+                    pass  # Don't let callback errors break the polling
+
+            if status_result.get("status") in TERMINAL_RENDER_STATUSES:
+                return status_result
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutError(f"Render did not complete within the timeout of {timeout} seconds")
+
+            delay = min(max_interval, initial_interval * (1.5 ** attempt)) + random.uniform(0, 0.5)
+            await asyncio.sleep(min(delay, remaining))
+            attempt += 1
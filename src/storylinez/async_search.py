@@ -0,0 +1,207 @@
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, AsyncIterator, Awaitable, Callable
+from .async_base_client import AsyncBaseClient
+from .base_client import BaseClient, _PREFETCH_MAX_PAGES, _PREFETCH_MAX_AGE
+from .search import (
+    SearchClient, _has_next_page, _is_cursor_page, _next_cursor, _split_batch_spec, _BATCH_SEARCH_METHODS,
+    _CURSOR_SEARCH_METHODS, _SEARCH_SUBPATHS, _SEARCH_CACHE_MAX_ENTRIES
+)
+
+# Methods shared verbatim with SearchClient. They validate their arguments and then
+# return self._search(...), which in this class is a coroutine.
+_SHARED_METHODS = (
+    "_validate_common_params", "_validate_media_types", "_validate_hues", "_build_search_params",
+    "_parse_hex_to_hue", "_search_validator", "_search_by_tags",
+    "search_video_scenes", "search_video_objects", "search_audio_content", "search_combined",
+    "search_audio_by_genre", "search_audio_by_mood", "search_audio_by_instrument",
+    "search_audio_by_transcription", "search_image_by_objects", "search_image_by_color",
+    "search_image_by_text", "search_by_tags", "search_video_by_tags", "search_audio_by_tags",
+    "search_image_by_tags", "iter_tag_search", "find_similar_content", "search_topics"
+)
+
+class AsyncSearchClient(AsyncBaseClient):
+    """
+    Asyncio client for the Storylinez Search API.
+
+    Offers the same search methods as SearchClient, with identical arguments and
+    validation, but each one must be awaited. Searches across media types can then run
+    concurrently, e.g.
+    await asyncio.gather(client.search_video_scenes("beach"), client.search_image_by_text("sale")).
+    """
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None):
+        """
+        Initialize the AsyncSearchClient.
+
+        Args:
+            api_key: Your Storylinez API Key
+            api_secret: Your Storylinez API Secret
+            base_url: Base URL for the API (defaults to production)
+            default_org_id: Default organization ID to use for all API calls (optional)
+        """
+        super().__init__(api_key, api_secret, base_url, default_org_id)
+        self.search_url = f"{self.base_url}/search"
+        self._search_urls = {subpath: f"{self.search_url}/files/{subpath}" for subpath in _SEARCH_SUBPATHS}
+        self._search_cache = OrderedDict()  # request key -> (stored_at, response)
+        self._search_etags = OrderedDict()  # request key -> {"etag": ..., "body": ...}
+        self._prefetched = OrderedDict()  # request key -> (started_at, task)
+
+    async def _search(self, subpath: str, data: Dict, media_source: str, folder_path: Optional[str], page: int,
+                      page_size: int, generate_thumbnail: bool, generate_streamable: bool, generate_download: bool,
+                      org_id: Optional[str], prefetch_next: bool, cache_ttl: float, extra_params: Dict) -> Dict:
+        """Run a search against /search/files/<subpath>; the async counterpart of SearchClient._search."""
+        params = self._build_search_params(media_source, folder_path, page, page_size, generate_thumbnail,
+                                           generate_streamable, generate_download, org_id, extra_params)
+        url = self._search_urls[subpath]
+
+        cache_key = BaseClient._request_key("POST", url, params, data)
+        if cache_ttl > 0:
+            entry = self._search_cache.get(cache_key)
+            if entry is not None and time.monotonic() - entry[0] < cache_ttl:
+                return copy.deepcopy(entry[1])
+
+        result = None
+        prefetched = self._prefetched.pop(cache_key, None)
+        if prefetched is not None and time.time() - prefetched[0] <= _PREFETCH_MAX_AGE:
+            try:
+                result = await prefetched[1]
+            except Exception:
+                result = None  # Prefetch failed, retry in the foreground
+        if result is None:
+            result = await self._make_request("POST", url, params=params, json_data=data,
+                                              validator=self._search_validator(cache_key))
+
+        page = params.get("page")
+        if (prefetch_next and page is not None and not _is_cursor_page(result)
+                and _has_next_page(result, page, page_size)):
+            next_params = dict(params, page=page + 1)
+            next_key = BaseClient._request_key("POST", url, next_params, data)
+            if next_key not in self._prefetched:
+                task = asyncio.ensure_future(self._make_request("POST", url, params=next_params, json_data=data))
+                self._prefetched[next_key] = (time.time(), task)
+                while len(self._prefetched) > _PREFETCH_MAX_PAGES:
+                    _, (_, stale_task) = self._prefetched.popitem(last=False)
+                    stale_task.cancel()
+
+        if cache_ttl > 0:
+            self._search_cache.pop(cache_key, None)
+            self._search_cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
+            while len(self._search_cache) > _SEARCH_CACHE_MAX_ENTRIES:
+                self._search_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    async def _map_result(pending: Awaitable[Dict], transform: Callable[[Dict], Dict]) -> Dict:
+        """Await a _search result and apply a post-processing step to it."""
+        return transform(await pending)
+
+    async def search_all_by_tags(self, tags: List[str], media_types: List[str] = None, **kwargs) -> Dict[str, Dict]:
+        """
+        Run the per-media-type tag searches concurrently.
+
+        Args:
+            tags: List of tags to search for
+            media_types: Media types to search ['video', 'audio', 'image'] (defaults to all)
+            **kwargs: Arguments shared by search_video_by_tags, search_audio_by_tags and search_image_by_tags
+
+        Returns:
+            Dictionary mapping each media type to its search results
+        """
+        media_types = self._validate_media_types(media_types)
+        results = await asyncio.gather(*(
+            getattr(self, f"search_{media_type}_by_tags")(tags, **kwargs) for media_type in media_types
+        ))
+        return dict(zip(media_types, results))
+
+    async def iter_results(self, method: str, page: int = 1, **kwargs) -> AsyncIterator[Dict]:
+        """
+        Iterate over every result of a search, prefetching the next page while the current one is consumed.
+
+        Args:
+            method: Name of the search method to page through (e.g. "search_video_scenes")
+            page: Page to start from
+            **kwargs: Arguments for the search method, except page and prefetch_next
+
+        Yields:
+            Individual result dictionaries, in the order the API returns them
+        """
+        if method not in _BATCH_SEARCH_METHODS:
+            raise ValueError(f"Unsupported search method: {method}. Valid methods are: {', '.join(sorted(_BATCH_SEARCH_METHODS))}")
+        search = getattr(self, method)
+        page_size = kwargs.get("page_size", 20)
+        cursor = None
+
+        while True:
+            if cursor:
+                result = await search(cursor=cursor, **kwargs)
+            else:
+                result = await search(page=page, prefetch_next=True, **kwargs)
+            for item in result.get("results") or []:
+                yield item
+
+            if method in _CURSOR_SEARCH_METHODS and _is_cursor_page(result):
+                cursor = _next_cursor(result)
+                if not cursor:
+                    return
+                continue
+            if not _has_next_page(result, page, page_size):
+                return
+            page += 1
+
+    async def search_batch(self, searches: List[Dict], max_concurrency: int = 8) -> List[Dict]:
+        """
+        Run several searches concurrently.
+        
+        Args:
+            searches: List of search specifications, as accepted by SearchClient.search_batch
+            max_concurrency: Maximum number of searches in flight at once
+            
+        Returns:
+            List of search results in the same order as `searches`.
+            A search that failed is represented by a dictionary with an "error" key.
+        """
+        if not isinstance(searches, list):
+            raise TypeError("searches must be a list of dictionaries")
+        calls = [_split_batch_spec(spec) for spec in searches]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(method: str, kwargs: Dict) -> Dict:
+            async with semaphore:
+                try:
+                    return await getattr(self, method)(**kwargs)
+                except Exception as e:
+                    return {"error": str(e)}
+
+        return list(await asyncio.gather(*(run(method, kwargs) for method, kwargs in calls)))
+
+    def invalidate_search_cache(self) -> None:
+        """Drop all cached search responses (see the cache_ttl parameter of the search methods)."""
+        self._search_cache.clear()
+        self._search_etags.clear()
+
+    async def aclose(self) -> None:
+        """Cancel outstanding prefetches and close the underlying HTTP client."""
+        for _, task in self._prefetched.values():
+            task.cancel()
+        self._prefetched.clear()
+        await super().aclose()
+
+for _name in _SHARED_METHODS:
+    setattr(AsyncSearchClient, _name, SearchClient.__dict__[_name])
+del _name
+
+def _make_result_iterator(method: str):
+    """Create an iter_<method> shortcut for AsyncSearchClient.iter_results."""
+    def iterate(self, **kwargs):
+        return self.iter_results(method, **kwargs)
+    iterate.__name__ = f"iter_{method}"
+    iterate.__qualname__ = f"AsyncSearchClient.iter_{method}"
+    iterate.__doc__ = f"Iterate over every result of {method}; shorthand for iter_results(\"{method}\", ...)."
+    return iterate
+
+for _method in _BATCH_SEARCH_METHODS:
+    setattr(AsyncSearchClient, f"iter_{_method}", _make_result_iterator(_method))
+del _method
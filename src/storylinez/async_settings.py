@@ -0,0 +1,159 @@
+import asyncio
+from typing import Dict, List, Optional
+from .async_base_client import AsyncBaseClient
+from .settings import SettingsClient, _SETTINGS_PRESETS, _SETTINGS_SUBPATHS, _unique_job_ids
+
+# Methods shared verbatim with SettingsClient. They validate their arguments and then
+# return self._make_request(...) or self._send_settings_change(...), which in this class
+# return a coroutine.
+_SHARED_METHODS = (
+    "save_settings", "update_settings", "reset_settings", "update_theme",
+    "update_ai_defaults", "add_job", "list_jobs", "iter_jobs", "delete_job", "fetch_job_results"
+)
+
+class AsyncSettingsClient(AsyncBaseClient):
+    """
+    Asyncio client for the Storylinez Settings API.
+
+    Offers the same methods as SettingsClient, with identical arguments and validation,
+    but each one must be awaited.
+    """
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None):
+        """
+        Initialize the AsyncSettingsClient.
+
+        Args:
+            api_key: Your Storylinez API Key
+            api_secret: Your Storylinez API Secret
+            base_url: Base URL for the API (defaults to production)
+            default_org_id: Default organization ID to use for all API calls (optional)
+        """
+        super().__init__(api_key, api_secret, base_url, default_org_id)
+        self.settings_url = f"{self.base_url}/settings"
+        self._settings_urls = {subpath: f"{self.settings_url}/{subpath}" for subpath in _SETTINGS_SUBPATHS}
+
+    def _send_settings_change(self, method: str, path: str, data: Dict, updates: Optional[Dict] = None):
+        """Send a request that modifies settings (no local cache to update in this client)."""
+        return self._make_request(method, self._settings_urls[path], json_data=data)
+
+    async def get_settings(self) -> Dict:
+        """
+        Get all settings for the current user.
+
+        Returns:
+            Dictionary containing user settings (AI parameters, link preferences, UI preferences)
+        """
+        return await self._make_request("GET", self._settings_urls["get"])
+
+    # Bulk job management
+
+    @staticmethod
+    async def _fan_out(call, items: List, max_concurrency: int) -> List[Dict]:
+        """Await call(item) for every item concurrently; failures become {"error": ...} entries."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(item) -> Dict:
+            async with semaphore:
+                try:
+                    return await call(item)
+                except Exception as e:
+                    return {"error": str(e)}
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+    async def add_jobs(self, jobs: List[Dict], max_concurrency: int = 8) -> List[Dict]:
+        """Add several temporary jobs concurrently; see SettingsClient.add_jobs."""
+        if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+            raise TypeError("jobs must be a list of dictionaries")
+        return await self._fan_out(lambda job: self.add_job(**job), jobs, max_concurrency)
+
+    async def delete_jobs(self, job_ids: List[str], org_id: Optional[str] = None,
+                          max_concurrency: int = 8) -> Dict[str, Dict]:
+        """Delete several temporary jobs concurrently; see SettingsClient.delete_jobs."""
+        unique_ids = _unique_job_ids(job_ids)
+        org_id = self._require_org_id(org_id)
+        results = await self._fan_out(lambda job_id: self.delete_job(job_id, org_id), unique_ids, max_concurrency)
+        return dict(zip(unique_ids, results))
+
+    async def fetch_jobs_results(self, job_ids: List[str], org_id: Optional[str] = None,
+                                 max_concurrency: int = 8) -> Dict[str, Dict]:
+        """Fetch the results of several temporary jobs concurrently; see SettingsClient.fetch_jobs_results."""
+        unique_ids = _unique_job_ids(job_ids)
+        org_id = self._require_org_id(org_id)
+        results = await self._fan_out(lambda job_id: self.fetch_job_results(job_id, org_id), unique_ids, max_concurrency)
+        return dict(zip(unique_ids, results))
+
+    # Helper methods for common workflows
+
+    async def apply_preset(self, preset_name: str) -> Dict:
+        """
+        Apply a predefined settings preset; see SettingsClient.apply_preset.
+
+        Args:
+            preset_name: Name of the preset to apply
+
+        Returns:
+            Dictionary containing confirmation message and updated settings
+        """
+        if preset_name not in _SETTINGS_PRESETS:
+            raise ValueError(f"Invalid preset name. Must be one of: {', '.join(_SETTINGS_PRESETS.keys())}")
+
+        print(f"Applying '{preset_name}' preset...")
+        result = await self.update_settings(**_SETTINGS_PRESETS[preset_name])
+        print(f"Preset '{preset_name}' applied successfully.")
+        return result
+
+    async def toggle_theme(self) -> Dict:
+        """
+        Toggle between dark mode and light mode.
+
+        Returns:
+            Dictionary containing confirmation message and new theme setting
+        """
+        settings = await self.get_settings()
+        current_dark_mode = settings.get('ui_preferences', {}).get('dark_mode', False)
+        new_dark_mode = not current_dark_mode
+
+        print(f"Toggling theme from {'dark' if current_dark_mode else 'light'} to {'dark' if new_dark_mode else 'light'} mode...")
+        return await self.update_theme(dark_mode=new_dark_mode)
+
+    async def backup_settings(self, filename: Optional[str] = None) -> str:
+        """
+        Back up current settings to a JSON file; see SettingsClient.backup_settings.
+
+        Args:
+            filename: Optional filename for the backup (default: storylinez_settings_YYYY-MM-DD.json)
+
+        Returns:
+            Path to the saved backup file
+        """
+        settings = await self.get_settings()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, SettingsClient._write_backup, settings, filename)
+
+    async def restore_settings(self, filename: str) -> Dict:
+        """
+        Restore settings from a backup file; see SettingsClient.restore_settings.
+
+        Args:
+            filename: Path to the backup JSON file
+
+        Returns:
+            Dictionary containing confirmation message and restored settings
+        """
+        loop = asyncio.get_running_loop()
+        settings = await loop.run_in_executor(None, SettingsClient._read_backup, filename)
+
+        print(f"Restoring settings from {filename}...")
+        result = await self.save_settings(
+            ai_params=settings.get("ai_params"),
+            link_preferences=settings.get("link_preferences"),
+            ui_preferences=settings.get("ui_preferences")
+        )
+        print("Settings restored successfully!")
+        return result
+
+for _name in _SHARED_METHODS:
+    setattr(AsyncSettingsClient, _name, SettingsClient.__dict__[_name])
+del _name
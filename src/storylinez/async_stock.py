@@ -0,0 +1,193 @@
+import asyncio
+from typing import Dict, List
+from .async_base_client import AsyncBaseClient
+from .base_client import _merge_batches
+from .stock import StockClient, _STOCK_SUBPATHS
+
+# Methods shared verbatim with StockClient. They validate their arguments and then
+# return self._make_request(...) or self._cached_request(...), which in this class
+# return a coroutine.
+_SHARED_METHODS = (
+    "search", "get_by_id", "list_media", "_list_media_params", "get_by_ids", "iter_media", "like", "dislike", "remove_interaction"
+)
+
+class AsyncStockClient(AsyncBaseClient):
+    """
+    Asyncio client for the Storylinez Stock Media API.
+
+    Offers the same methods as StockClient, with identical arguments and validation,
+    but each one must be awaited, so independent lookups can share one HTTP/2 connection:
+    await asyncio.gather(client.search(["sunset"]), client.get_by_id("id1", "videos")).
+    """
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None):
+        """
+        Initialize the AsyncStockClient.
+
+        Args:
+            api_key: Your Storylinez API Key
+            api_secret: Your Storylinez API Secret
+            base_url: Base URL for the API (defaults to production)
+            default_org_id: Default organization ID to use for all API calls (optional)
+        """
+        super().__init__(api_key, api_secret, base_url, default_org_id)
+        self.stock_url = f"{self.base_url}/stock"
+        self._stock_urls = {subpath: f"{self.stock_url}/{subpath}" for subpath in _STOCK_SUBPATHS}
+
+    def _cached_request(self, method: str, url: str, params: Dict, data: Dict = None):
+        """Send a read-only request (this client keeps no response cache)."""
+        return self._make_request(method, url, params=params, json_data=data)
+
+    # Utility methods for common workflows
+
+    async def search_videos(self, query: str, num_results: int = 5, orientation: str = None,
+                            detailed: bool = False, generate_thumbnail: bool = True,
+                            generate_streamable: bool = True) -> List[Dict]:
+        """Search only for videos; see StockClient.search_videos."""
+        results = await self.search(
+            queries=[query],
+            collections=['videos'],
+            detailed=detailed,
+            generate_thumbnail=generate_thumbnail,
+            generate_streamable=generate_streamable,
+            num_results_videos=num_results,
+            orientation=orientation
+        )
+        return results.get('videos', [])
+
+    async def search_audios(self, query: str, num_results: int = 5,
+                            detailed: bool = False, generate_thumbnail: bool = True,
+                            generate_streamable: bool = True) -> List[Dict]:
+        """Search only for audio; see StockClient.search_audios."""
+        results = await self.search(
+            queries=[query],
+            collections=['audios'],
+            detailed=detailed,
+            generate_thumbnail=generate_thumbnail,
+            generate_streamable=generate_streamable,
+            num_results_audios=num_results
+        )
+        return results.get('audios', [])
+
+    async def search_images(self, query: str, num_results: int = 5,
+                            detailed: bool = False, generate_thumbnail: bool = True) -> List[Dict]:
+        """Search only for images; see StockClient.search_images."""
+        results = await self.search(
+            queries=[query],
+            collections=['images'],
+            detailed=detailed,
+            generate_thumbnail=generate_thumbnail,
+            num_results_images=num_results
+        )
+        return results.get('images', [])
+
+    async def find_similar_media(self, stock_id: str, media_type: str, num_results: int = 5) -> Dict:
+        """
+        Find media similar to a specific stock item; see StockClient.find_similar_media.
+
+        Args:
+            stock_id: ID of the reference stock item
+            media_type: Type of the reference media ('videos', 'audios', or 'images')
+            num_results: Number of similar items to find per media type
+
+        Returns:
+            Dictionary containing search results grouped by media type
+        """
+        item = await self.get_by_id(stock_id=stock_id, media_type=media_type, detailed=True)
+        return await self.search(
+            queries=[StockClient._description_of(item)],
+            detailed=False,
+            generate_thumbnail=True,
+            num_results_videos=num_results,
+            num_results_audios=num_results,
+            num_results_images=num_results
+        )
+
+    async def batch_get_items(self, ids_by_media_type: Dict[str, List[str]],
+                              detailed: bool = True, generate_thumbnail: bool = True) -> Dict[str, List[Dict]]:
+        """
+        Batch fetch items by media type; see StockClient.batch_get_items.
+
+        Args:
+            ids_by_media_type: Dictionary mapping media types to lists of IDs
+            detailed: Whether to include full analysis data
+            generate_thumbnail: Whether to generate thumbnail URLs
+
+        Returns:
+            Dictionary of items grouped by media type
+        """
+        flat_ids, flat_media_types = StockClient._flatten_ids_by_media_type(ids_by_media_type)
+        if not flat_ids:
+            return {'videos': [], 'audios': [], 'images': []}
+
+        result = await self.get_many(
+            ids=flat_ids,
+            media_types=flat_media_types,
+            detailed=detailed,
+            generate_thumbnail=generate_thumbnail
+        )
+        return StockClient._group_items_by_media_type(result)
+
+    async def get_many(self, ids: List[str], media_types: List[str], chunk_size: int = 100,
+                       max_concurrency: int = 8, **kwargs) -> Dict:
+        """
+        Get any number of stock media items with concurrent get_by_ids batches; see StockClient.get_many.
+
+        Args:
+            ids: List of stock item IDs
+            media_types: Corresponding media types for each ID ('videos', 'audios', 'images')
+            chunk_size: Number of items per get_by_ids request (at most 100)
+            max_concurrency: Maximum number of batches in flight at once
+            **kwargs: Additional arguments for get_by_ids
+
+        Returns:
+            Dictionary with the same shape as a get_by_ids response, with the "items" of all
+            batches in request order
+        """
+        if not ids:
+            raise ValueError("ids list cannot be empty")
+        batches = StockClient._shard_ids(ids, media_types, chunk_size)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(batch_ids: List[str], batch_media_types: List[str]) -> Dict:
+            async with semaphore:
+                return await self.get_by_ids(batch_ids, batch_media_types, **kwargs)
+
+        results = await asyncio.gather(*(run(batch_ids, batch_media_types) for batch_ids, batch_media_types in batches))
+        return _merge_batches(list(results))
+
+    async def gather_get_by_id(self, ids: List[str], media_types: List[str],
+                               max_concurrency: int = 8, **kwargs) -> List[Dict]:
+        """
+        Fetch several stock items concurrently with individual get_by_id calls.
+
+        Prefer get_many when the items are needed together, as it uses one request per 100
+        items; this is for callers that want per-item error handling.
+
+        Args:
+            ids: List of stock item IDs
+            media_types: Corresponding media types for each ID ('videos', 'audios', 'images')
+            max_concurrency: Maximum number of requests in flight at once
+            **kwargs: Additional arguments for get_by_id (detailed, generate_thumbnail, ...)
+
+        Returns:
+            List of items in the same order as `ids`.
+            Items that could not be fetched are represented by a dictionary with an "error" key.
+        """
+        if len(ids) != len(media_types):
+            raise ValueError("The ids and media_types lists must be the same length")
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(stock_id: str, media_type: str) -> Dict:
+            async with semaphore:
+                try:
+                    return await self.get_by_id(stock_id, media_type, **kwargs)
+                except Exception as e:
+                    return {"id": stock_id, "error": str(e)}
+
+        return list(await asyncio.gather(*(run(stock_id, media_type)
+                                           for stock_id, media_type in zip(ids, media_types))))
+
+for _name in _SHARED_METHODS:
+    setattr(AsyncStockClient, _name, StockClient.__dict__[_name])
+del _name
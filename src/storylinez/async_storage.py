@@ -0,0 +1,408 @@
+import asyncio
+import os
+import mimetypes
+from collections import OrderedDict
+from typing import Dict, List, BinaryIO, AsyncIterator
+from .async_base_client import AsyncBaseClient
+from .base_client import BaseClient, _merge_batches
+from .storage import StorageClient, _ALLOWED_FORMATS, _STORAGE_SUBPATHS, _file_sha256
+
+# Methods shared verbatim with StorageClient. They validate their arguments and then
+# return self._make_request(...), self._cached_get(...) or self._send_change(...), which
+# in this class return a coroutine.
+_SHARED_METHODS = (
+    "_validate_file_extension", "_validate_path", "_validate_file_exists",
+    "_convert_bool_to_str", "_storage_validator", "generate_upload_link", "mark_upload_complete",
+    "get_folder_contents", "_folder_contents_params", "create_folder", "delete_folder", "rename_folder", "get_folder_tree",
+    "list_folders", "search_files_by_name", "vector_search", "get_file_analysis", "delete_file",
+    "rename_file", "move_file", "get_download_link", "get_original_download_link", "reprocess_file",
+    "get_files_by_ids", "get_storage_usage"
+)
+
+# Size of the chunks read from disk while streaming a PUT upload
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+class AsyncStorageClient(AsyncBaseClient):
+    """
+    Asyncio client for the Storylinez Storage API.
+
+    Offers the metadata and upload methods of StorageClient, with identical arguments and
+    validation, but each one must be awaited, so many folder listings, file lookups or
+    uploads can run concurrently:
+    await asyncio.gather(client.list_folders("/a"), client.get_files_by_ids(["id1", "id2"])).
+    """
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None):
+        """
+        Initialize the AsyncStorageClient.
+
+        Args:
+            api_key: Your Storylinez API Key
+            api_secret: Your Storylinez API Secret
+            base_url: Base URL for the API (defaults to production)
+            default_org_id: Default organization ID to use for all API calls (optional)
+        """
+        super().__init__(api_key, api_secret, base_url, default_org_id)
+        self.storage_url = f"{self.base_url}/storage"
+        self._storage_urls = {subpath: f"{self.storage_url}/{subpath}" for subpath in _STORAGE_SUBPATHS}
+        self.allowed_formats = {kind: list(extensions) for kind, extensions in _ALLOWED_FORMATS.items()}
+        self._storage_etags = OrderedDict()  # request key -> {"etag": ..., "body": ...}
+
+    def _cached_get(self, name: str, subpath: str, params: Dict, cacheable=None):
+        """Send a read-only GET, revalidating unsigned listings by ETag (this client keeps no response cache)."""
+        url = self._storage_urls[subpath]
+        validator = None
+        if params.get("generate_streamable") != "true" and params.get("generate_download") != "true":
+            validator = self._storage_validator(BaseClient._request_key("GET", url, params))
+        return self._make_request("GET", url, params=params, validator=validator)
+
+    def _send_change(self, method: str, subpath: str, **kwargs):
+        """Send a request that modifies storage (no local cache to invalidate in this client)."""
+        return self._make_request(method, self._storage_urls[subpath], **kwargs)
+
+    @staticmethod
+    async def _read_chunks(file_data: BinaryIO) -> AsyncIterator[bytes]:
+        """Read a file object in chunks on the default executor, so disk reads do not block the loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(None, file_data.read, _UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    async def _send_to_upload_link(self, upload_link, filename: str, file_data: BinaryIO,
+                                   content_type: str, size: int, checksum: str = None) -> None:
+        """Upload file_data to a pre-signed S3 POST form or PUT URL returned by generate_upload_link."""
+        if isinstance(upload_link, dict):
+            # S3 presigned POST format: {"url": "...", "fields": {...}}
+            s3_url = upload_link.get("url")
+            s3_fields = upload_link.get("fields", {})
+            if not s3_url:
+                raise Exception("Invalid upload link format: missing URL")
+            if checksum:
+                s3_fields = dict(s3_fields, **{'x-amz-checksum-sha256': checksum})
+            files = {'file': (filename, file_data, s3_fields.get('Content-Type', content_type))}
+            upload_response = await self._client.post(s3_url, data=s3_fields, files=files)
+        else:
+            # S3 rejects chunked PUTs, so the length is sent up front
+            headers = {'Content-Type': content_type, 'Content-Length': str(size)}
+            if checksum:
+                headers['x-amz-checksum-sha256'] = checksum
+            upload_response = await self._client.put(upload_link, content=self._read_chunks(file_data), headers=headers)
+
+        if upload_response.status_code not in [200, 204]:
+            raise Exception(f"File upload failed with status {upload_response.status_code}: {upload_response.text}")
+
+    async def upload_file(self,
+                          file_path: str,
+                          folder_path: str = "/",
+                          context: str = "",
+                          tags: List[str] = None,
+                          analyze_audio: bool = True,
+                          auto_company_details: bool = True,
+                          company_details_id: str = "",
+                          deepthink: bool = False,
+                          overdrive: bool = False,
+                          web_search: bool = False,
+                          eco: bool = False,
+                          temperature: float = 0.7,
+                          org_id: str = None,
+                          upload_info: Dict = None,
+                          verify_integrity: bool = False,
+                          **kwargs) -> Dict:
+        """
+        Upload a file to Storylinez storage; see StorageClient.upload_file.
+
+        The file is streamed from disk in chunks instead of being read into memory.
+
+        Args:
+            file_path: Path to the file on local disk
+            folder_path: Target folder path (defaults to root)
+            context: Context for AI processing
+            tags: Tags for categorization
+            analyze_audio: Whether to analyze audio in media files
+            auto_company_details: Whether to use company details for analysis
+            company_details_id: ID of company details to use
+            deepthink: Enable deep analysis
+            overdrive: Use more computational resources
+            web_search: Enable web search for analysis
+            eco: Use eco-friendly processing
+            temperature: AI temperature (0.0-1.0)
+            org_id: Organization ID (uses default if not provided)
+            upload_info: Response of generate_upload_link for this file, if it was requested in advance
+            verify_integrity: Send the file's SHA-256 checksum with the upload (x-amz-checksum-sha256),
+                              hashed on the default executor
+            **kwargs: Additional parameters for backwards compatibility
+
+        Returns:
+            Dictionary with file details
+        """
+        org_id = self._require_org_id(org_id)
+        file_size = self._validate_file_exists(file_path)
+        filename = os.path.basename(file_path)
+        folder_path = self._validate_path(folder_path)
+
+        if not 0.0 <= temperature <= 1.0:
+            raise ValueError("Temperature must be between 0.0 and 1.0")
+
+        if upload_info is None:
+            upload_info = await self.generate_upload_link(
+                filename=filename,
+                file_size=file_size,
+                folder_path=folder_path,
+                org_id=org_id
+            )
+        upload_link = upload_info.get("upload_link")
+        upload_id = upload_info.get("upload_id")
+        if not upload_link or not upload_id:
+            raise Exception("Failed to generate upload link")
+
+        checksum = None
+        if verify_integrity and file_size > 0:
+            checksum = await asyncio.get_running_loop().run_in_executor(None, _file_sha256, file_path)
+        content_type = kwargs.get("content_type") or mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        with open(file_path, 'rb') as file_data:
+            await self._send_to_upload_link(upload_link, filename, file_data, content_type, file_size, checksum)
+
+        completion_data = {
+            "org_id": org_id,
+            "upload_id": upload_id,
+            "filename": filename,
+            "folder_path": folder_path,
+            "context": context,
+            "tags": tags or [],
+            "analyze_audio": analyze_audio,
+            "auto_company_details": auto_company_details,
+            "company_details_id": company_details_id,
+            "deepthink": deepthink,
+            "overdrive": overdrive,
+            "web_search": web_search,
+            "eco": eco,
+            "temperature": temperature
+        }
+        for key, value in kwargs.items():
+            if key not in completion_data:
+                completion_data[key] = value
+
+        return await self._make_request("POST", self._storage_urls["upload/complete"], json_data=completion_data)
+
+    async def upload_file_data(self,
+                               file_data: BinaryIO,
+                               filename: str,
+                               folder_path: str = "/",
+                               content_type: str = None,
+                               file_size: int = None,
+                               context: str = "",
+                               tags: List[str] = None,
+                               analyze_audio: bool = True,
+                               auto_company_details: bool = True,
+                               company_details_id: str = "",
+                               deepthink: bool = False,
+                               overdrive: bool = False,
+                               web_search: bool = False,
+                               eco: bool = False,
+                               temperature: float = 0.7,
+                               org_id: str = None) -> Dict:
+        """
+        Upload file data from a seekable file-like object; see StorageClient.upload_file_data.
+
+        Args:
+            file_data: File-like object containing binary data, uploaded from its current position
+            filename: Name for the uploaded file
+            folder_path: Target folder path (defaults to root)
+            content_type: MIME type of the file (auto-detected if not provided)
+            file_size: Size of data in bytes (will seek and calculate if None)
+            context: Context for AI processing
+            tags: Tags for categorization
+            analyze_audio: Whether to analyze audio in media files
+            auto_company_details: Whether to use company details for analysis
+            company_details_id: ID of company details to use
+            deepthink: Enable deep analysis
+            overdrive: Use more computational resources
+            web_search: Enable web search for analysis
+            eco: Use eco-friendly processing
+            temperature: AI temperature (0.0-1.0)
+            org_id: Organization ID (uses default if not provided)
+
+        Returns:
+            Dictionary with file details
+        """
+        org_id = self._require_org_id(org_id)
+
+        if not filename or not filename.strip():
+            raise ValueError("Filename is required")
+        self._validate_file_extension(filename)
+
+        current_pos = file_data.tell()
+        file_data.seek(0, os.SEEK_END)
+        end_pos = file_data.tell()
+        file_data.seek(current_pos)
+        if file_size is None:
+            file_size = end_pos
+
+        if content_type is None:
+            content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+        if not 0.0 <= temperature <= 1.0:
+            raise ValueError("Temperature must be between 0.0 and 1.0")
+
+        folder_path = self._validate_path(folder_path)
+
+        upload_info = await self.generate_upload_link(
+            filename=filename,
+            file_size=file_size,
+            folder_path=folder_path,
+            org_id=org_id
+        )
+        upload_link = upload_info.get("upload_link")
+        upload_id = upload_info.get("upload_id")
+        if not upload_link or not upload_id:
+            raise Exception("Failed to generate upload link")
+
+        await self._send_to_upload_link(upload_link, filename, file_data, content_type, end_pos - current_pos)
+
+        completion_data = {
+            "org_id": org_id,
+            "upload_id": upload_id,
+            "filename": filename,
+            "mimetype": content_type,
+            "folder_path": folder_path,
+            "context": context,
+            "tags": tags or [],
+            "analyze_audio": analyze_audio,
+            "auto_company_details": auto_company_details,
+            "company_details_id": company_details_id,
+            "deepthink": deepthink,
+            "overdrive": overdrive,
+            "web_search": web_search,
+            "eco": eco,
+            "temperature": temperature
+        }
+
+        return await self._make_request("POST", self._storage_urls["upload/complete"], json_data=completion_data)
+
+    async def upload_files(self, file_paths: List[str], max_concurrency: int = 4, **kwargs) -> List[Dict]:
+        """
+        Upload several files concurrently with upload_file.
+
+        Args:
+            file_paths: Paths of the files on local disk
+            max_concurrency: Maximum number of uploads in flight at once
+            **kwargs: Arguments for upload_file shared by every file (folder_path, context, tags, ...)
+
+        Returns:
+            List of upload results in the same order as `file_paths`.
+            A file that could not be uploaded is represented by a dictionary with an "error" key.
+        """
+        if not isinstance(file_paths, list):
+            raise TypeError("file_paths must be a list of strings")
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(file_path: str) -> Dict:
+            async with semaphore:
+                try:
+                    return await self.upload_file(file_path, **kwargs)
+                except Exception as e:
+                    return {"file_path": file_path, "error": str(e)}
+
+        return list(await asyncio.gather(*(run(file_path) for file_path in file_paths)))
+
+    async def upload_files_prefetch(self, file_paths: List[str], folder_path: str = "/", org_id: str = None,
+                                    **kwargs) -> List[Dict]:
+        """
+        Upload files one after another, requesting each file's upload link while the previous
+        file is still being transferred; see StorageClient.upload_files_prefetch.
+
+        Args:
+            file_paths: Paths of the files on local disk
+            folder_path: Target folder path (defaults to root)
+            org_id: Organization ID (uses default if not provided)
+            **kwargs: Arguments for upload_file shared by every file (context, tags, ...)
+
+        Returns:
+            List of upload results in the same order as `file_paths`.
+            A file that could not be uploaded is represented by a dictionary with an "error" key.
+        """
+        if not isinstance(file_paths, list):
+            raise TypeError("file_paths must be a list of strings")
+        org_id = self._require_org_id(org_id)
+        folder_path = self._validate_path(folder_path)
+
+        async def presign(file_path: str) -> Dict:
+            return await self.generate_upload_link(
+                filename=os.path.basename(file_path),
+                file_size=self._validate_file_exists(file_path),
+                folder_path=folder_path,
+                org_id=org_id
+            )
+
+        results = []
+        pending = None
+        try:
+            for index, file_path in enumerate(file_paths):
+                current, pending = pending, None
+                if index + 1 < len(file_paths):
+                    pending = asyncio.ensure_future(presign(file_paths[index + 1]))
+                try:
+                    upload_info = await (current if current is not None else presign(file_path))
+                    results.append(await self.upload_file(file_path, folder_path=folder_path, org_id=org_id,
+                                                          upload_info=upload_info, **kwargs))
+                except Exception as e:
+                    results.append({"file_path": file_path, "error": str(e)})
+        finally:
+            if pending is not None:
+                pending.cancel()  # Cancelled while uploading
+        return results
+
+    async def get_many_files(self, file_ids: List[str], chunk_size: int = 100, max_concurrency: int = 4,
+                             **kwargs) -> Dict:
+        """
+        Get details for any number of files with concurrent get_files_by_ids batches; see StorageClient.get_many_files.
+
+        Args:
+            file_ids: List of file IDs to retrieve
+            chunk_size: Number of files per get_files_by_ids request (at most 100)
+            max_concurrency: Maximum number of batches in flight at once
+            **kwargs: Additional arguments for get_files_by_ids (detailed, generate_thumbnail, org_id, ...)
+
+        Returns:
+            Dictionary with the same shape as a get_files_by_ids response, with the list fields of
+            all batches concatenated in request order
+        """
+        batches = StorageClient._file_id_batches(file_ids, chunk_size)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(batch: List[str]) -> Dict:
+            async with semaphore:
+                return await self.get_files_by_ids(batch, **kwargs)
+
+        return _merge_batches(list(await asyncio.gather(*(run(batch) for batch in batches))))
+
+    async def search_batch(self, searches: List[Dict], max_concurrency: int = 8) -> List[Dict]:
+        """
+        Run several filename and vector searches concurrently; see StorageClient.search_batch.
+
+        Args:
+            searches: List of search specifications, as accepted by StorageClient.search_batch
+            max_concurrency: Maximum number of searches in flight at once
+
+        Returns:
+            List of search results in the same order as `searches`.
+            A search that failed is represented by a dictionary with an "error" key.
+        """
+        calls, positions = StorageClient._search_batch_calls(searches)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(method: str, kwargs: Dict) -> Dict:
+            async with semaphore:
+                try:
+                    return await getattr(self, method)(**kwargs)
+                except Exception as e:
+                    return {"error": str(e)}
+
+        results = list(await asyncio.gather(*(run(method, kwargs) for method, kwargs in calls)))
+        return StorageClient._spread_results(results, positions)
+
+for _name in _SHARED_METHODS:
+    setattr(AsyncStorageClient, _name, StorageClient.__dict__[_name])
+del _name
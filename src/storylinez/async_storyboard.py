@@ -0,0 +1,161 @@
+import asyncio
+from typing import Dict, List
+from .async_base_client import AsyncBaseClient
+from .base_client import _json_loads
+from .storyboard import StoryboardClient
+
+# Methods shared verbatim with StoryboardClient. They validate their arguments and then
+# return self._cached_get(...) or self._send_change(...), which in this class return a coroutine.
+_SHARED_METHODS = (
+    "create_storyboard", "get_storyboard", "update_storyboard", "update_storyboard_values",
+    "redo_storyboard", "reorder_storyboard_items", "edit_storyboard_item", "change_storyboard_media",
+    "get_storyboard_history", "get_storyboard_media", "_reorder_payload", "_edit_item_payload",
+    "_change_media_payload", "_prepare_edits"
+)
+
+class AsyncStoryboardClient(AsyncBaseClient):
+    """
+    Asyncio client for the Storylinez Storyboard API.
+
+    Offers the storyboard request methods of StoryboardClient, with identical arguments and
+    validation, but each one must be awaited, so storyboards for many projects can be created
+    or fetched at once:
+    await asyncio.gather(*(client.get_storyboard_media(storyboard_id=sid) for sid in storyboard_ids)).
+    """
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinez.com", default_org_id: str = None):
+        """
+        Initialize the AsyncStoryboardClient.
+
+        Args:
+            api_key: Your Storylinez API Key
+            api_secret: Your Storylinez API Secret
+            base_url: Base URL for the API (defaults to production)
+            default_org_id: Default organization ID to use for all API calls (optional)
+        """
+        super().__init__(api_key, api_secret, base_url, default_org_id)
+        self.storyboard_url = f"{self.base_url}/storyboard"
+
+    def _cached_get(self, url: str, params: Dict):
+        """Send a read-only GET (this client keeps no response cache)."""
+        return self._make_request("GET", url, params=params)
+
+    def _send_change(self, method: str, url: str, **kwargs):
+        """Send a request that modifies a storyboard (no local cache to invalidate in this client)."""
+        return self._make_request(method, url, **kwargs)
+
+    async def apply_storyboard_edits(self, storyboard_id: str, edits: List[Dict]) -> List[Dict]:
+        """
+        Apply several manual edits to a storyboard in one call; see StoryboardClient.apply_storyboard_edits.
+
+        Args:
+            storyboard_id: ID of the storyboard to modify
+            edits: List of edits, as accepted by StoryboardClient.apply_storyboard_edits
+
+        Returns:
+            List with the response of each edit sent, in order
+        """
+        results = []
+        for index, (op, url, data) in enumerate(self._prepare_edits(storyboard_id, edits)):
+            try:
+                results.append(await self._make_request("PUT", url, json_data=data))
+            except Exception as e:
+                raise Exception(f"Edit {index} ({op}) failed after {index} edit(s) were applied: {e}") from e
+        return results
+
+    async def get_storyboards(self, storyboard_ids: List[str], max_concurrency: int = 8, **kwargs) -> Dict[str, Dict]:
+        """
+        Get several storyboards concurrently; see StoryboardClient.get_storyboards.
+
+        Args:
+            storyboard_ids: IDs of the storyboards to retrieve (duplicates are fetched once)
+            max_concurrency: Maximum number of requests in flight at once
+            **kwargs: Arguments for get_storyboard shared by every call (include_results, include_details, ...)
+
+        Returns:
+            Dictionary mapping each storyboard ID to its get_storyboard response.
+            A storyboard that could not be retrieved maps to a dictionary with an "error" key.
+        """
+        if not isinstance(storyboard_ids, list):
+            raise TypeError("storyboard_ids must be a list of strings")
+        unique_ids = list(dict.fromkeys(storyboard_ids))
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(storyboard_id: str) -> Dict:
+            async with semaphore:
+                try:
+                    return await self.get_storyboard(storyboard_id=storyboard_id, **kwargs)
+                except Exception as e:
+                    return {"error": str(e)}
+
+        return dict(zip(unique_ids, await asyncio.gather(*(fetch(storyboard_id) for storyboard_id in unique_ids))))
+
+    async def wait_for_generation_complete(self, job_id: str, polling_interval: int = 5, timeout: int = 300) -> Dict:
+        """
+        Wait for a storyboard generation job to complete; see StoryboardClient.wait_for_generation_complete.
+
+        Args:
+            job_id: The job ID returned from create_storyboard or redo_storyboard
+            polling_interval: Time in seconds between status checks
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The completed job result
+
+        Raises:
+            TimeoutError: If the job doesn't complete within the timeout period
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while loop.time() < deadline:
+            response = await self._client.get(
+                f"{self.base_url}/build/getjob",
+                params={'job_id': job_id},
+                headers=self._get_headers()
+            )
+
+            if response.status_code == 200:
+                job_data = _json_loads(response.content)
+                status = job_data.get('status')
+
+                if status == "COMPLETED":
+                    return job_data
+                elif status in ["FAILED", "ERROR"]:
+                    raise Exception(f"Job failed with status: {status}, message: {job_data.get('message', 'No message')}")
+
+            await asyncio.sleep(polling_interval)
+
+        raise TimeoutError(f"Job {job_id} did not complete within {timeout} seconds")
+
+    async def create_storyboard_and_wait(self, project_id: str, polling_interval: int = 5, timeout: int = 300,
+                                         **kwargs) -> Dict:
+        """
+        Create a new storyboard and wait for its completion; see StoryboardClient.create_storyboard_and_wait.
+
+        Args:
+            project_id: ID of the project to create the storyboard for
+            polling_interval: Time in seconds between status checks
+            timeout: Maximum time to wait in seconds
+            **kwargs: Additional parameters to pass to create_storyboard
+
+        Returns:
+            Dictionary with the complete storyboard information
+        """
+        result = await self.create_storyboard(project_id=project_id, **kwargs)
+        job_id = result.get("job_id")
+
+        if not job_id:
+            raise ValueError("No job_id found in create_storyboard response")
+
+        await self.wait_for_generation_complete(job_id=job_id, polling_interval=polling_interval, timeout=timeout)
+
+        storyboard_id = result.get("storyboard", {}).get("storyboard_id")
+        if not storyboard_id:
+            raise ValueError("No storyboard_id found in create_storyboard response")
+
+        return await self.get_storyboard(storyboard_id=storyboard_id, include_results=True)
+
+for _name in _SHARED_METHODS:
+    setattr(AsyncStoryboardClient, _name, StoryboardClient.__dict__[_name])
+del _name
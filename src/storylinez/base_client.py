@@ -1,14 +1,566 @@
 import requests
 import time
-from typing import Dict, Any
+import gzip
+import copy
+import json as _json
+import threading
+import calendar
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional, Iterator, List, Tuple, Union
+from urllib.parse import urlsplit, parse_qs
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx  # Optional HTTP/2 transport (pip install storylinez[async])
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    import orjson  # Optional, much faster JSON encoding/decoding (pip install storylinez[fast])
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional incremental JSON parser for streamed listings (pip install storylinez[stream])
+except ImportError:
+    ijson = None
+
+if orjson is not None:
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+
+    def _json_key(obj: Any):
+        """Canonical (key-sorted) encoding of a request body for cache and single-flight keys."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        except orjson.JSONEncodeError:
+            return _json.dumps(obj, sort_keys=True, default=str)  # e.g. integers beyond 64 bits
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return _json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = _json.loads
+
+    def _json_key(obj: Any):
+        """Canonical (key-sorted) encoding of a request body for cache and single-flight keys."""
+        return _json.dumps(obj, sort_keys=True, default=str)
+
+class _InFlightCall:
+    """A request being made on behalf of every caller that asked for the same thing"""
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+# Prefetched pages kept per client, and how long (seconds) one stays usable
+_PREFETCH_MAX_PAGES = 8
+_PREFETCH_MAX_AGE = 60.0
+
+def _has_more_pages(result: Dict, items: List, page: int, limit: int) -> bool:
+    """Tell from a page/limit listing response whether a page after `page` exists."""
+    if result.get("total_pages") is not None:
+        return page < result["total_pages"]
+    if result.get("total") is not None:
+        return page * limit < result["total"]
+    return len(items) >= limit
+
+def _items_by_prefix(events: Iterator[tuple], prefixes: Tuple[str, ...]) -> Iterator[Tuple[str, Any]]:
+    """Build the elements found at any of several ijson prefixes from parse events, in document order."""
+    events = iter(events)
+    for prefix, event, value in events:
+        if prefix not in prefixes:
+            continue
+        if event not in ("start_map", "start_array"):
+            yield prefix, value
+            continue
+        builder = ijson.ObjectBuilder()
+        depth = 0
+        while True:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+                if depth == 0:
+                    break
+            _, event, value = next(events)
+        yield prefix, builder.value
+
+# Count fields of a batched lookup response, summed when batches are merged
+_BATCH_COUNT_FIELDS = frozenset(("count", "total", "total_count", "found_count", "not_found_count"))
+
+def _merge_batches(results: List[Dict]) -> Dict:
+    """
+    Merge the responses of a batched lookup.
+    
+    List fields (such as items) are concatenated in order and integer count fields (count,
+    total, ...) are summed; any other field keeps its value from the first batch.
+    """
+    merged = dict(results[0])
+    for result in results[1:]:
+        for key, value in result.items():
+            if isinstance(value, list) and isinstance(merged.get(key), list):
+                merged[key] = merged[key] + value
+            elif (key in _BATCH_COUNT_FIELDS and isinstance(value, int) and not isinstance(value, bool)
+                  and isinstance(merged.get(key), int)):
+                merged[key] += value
+    return merged
+
+# apply_*_edits operations of the sequence and storyboard clients:
+# op -> (payload builder method, endpoint relative to the client's resource URL)
+_EDIT_OPS = {
+    "reorder": ("_reorder_payload", "reorder"),
+    "edit": ("_edit_item_payload", "edit/item"),
+    "change_media": ("_change_media_payload", "change_media")
+}
+
+def _edit_supersedes(previous: Tuple[str, str, Dict], current: Tuple[str, str, Dict]) -> bool:
+    """Whether prepared edit `current` fully replaces `previous`, so `previous` need not be sent"""
+    (prev_op, _, prev_data), (op, _, data) = previous, current
+    same_item = (prev_data.get("item_type"), prev_data.get("item_index")) == (data.get("item_type"), data.get("item_index"))
+    if not same_item or prev_op != op:
+        return False
+    if op == "edit":
+        # A full item replacement overrides any earlier edit of that item
+        return bool(data.get("updated_item")) and not (data.get("file_id") or data.get("stock_id"))
+    return op == "change_media"
+
+# A cached response is only served while all of its signed URLs stay valid this many more seconds
+_SIGNED_URL_MIN_VALIDITY = 60.0
+
+# Query-string form of boolean flags
+_BOOL_STR = {True: "true", False: "false"}
+
+_MISSING_ORG_MSG = ("Organization ID is required."
+                    " Either provide org_id parameter or set a default_org_id when initializing the client.")
+
+def _url_expiry(url: str) -> Optional[float]:
+    """Expiry (epoch seconds) of a signed URL, from its Expires or X-Amz-Date/X-Amz-Expires parameters."""
+    query = parse_qs(urlsplit(url).query)
+    try:
+        if "Expires" in query:
+            return float(query["Expires"][0])
+        if "X-Amz-Expires" in query and "X-Amz-Date" in query:
+            signed_at = calendar.timegm(time.strptime(query["X-Amz-Date"][0], "%Y%m%dT%H%M%SZ"))
+            return signed_at + float(query["X-Amz-Expires"][0])
+    except ValueError:
+        pass
+    return None
+
+def _signed_urls_expiry(response: Any) -> Optional[float]:
+    """Earliest expiry of the signed URLs anywhere in a response, or None if it contains none."""
+    earliest = None
+    pending = [response]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, dict):
+            pending.extend(value.values())
+        elif isinstance(value, list):
+            pending.extend(value)
+        elif isinstance(value, str) and value.startswith("http") and "?" in value:
+            expiry = _url_expiry(value)
+            if expiry is not None and (earliest is None or expiry < earliest):
+                earliest = expiry
+    return earliest
 
 class BaseClient:
-    def __init__(self, api_key: str, api_secret: str, base_url: str, default_org_id: str = None):
+    __slots__ = ("api_key", "api_secret", "base_url", "default_org_id", "_session", "_s3_session", "_http2_client",
+                 "compression_threshold", "_prefetch_pool", "_prefetched", "_prefetch_lock",
+                 "_inflight", "_inflight_lock")
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str, default_org_id: str = None,
+                 transport: str = "requests"):
+        if transport not in ("requests", "httpx"):
+            raise ValueError("transport must be either 'requests' or 'httpx'")
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = base_url.rstrip('/')
         self.default_org_id = default_org_id
+        self._session = self._create_session()
+        self._s3_session = None  # Created on first upload
+        # With transport="httpx", JSON API calls share one HTTP/2 connection (file uploads and
+        # downloads still go through the requests session)
+        self._http2_client = self._create_http2_client() if transport == "httpx" else None
+        # Gzip JSON request bodies larger than this many bytes (None disables request compression)
+        self.compression_threshold = None
+        self._prefetch_pool = None  # Created on first use
+        self._prefetched = OrderedDict()
+        self._prefetch_lock = threading.Lock()
+        self._inflight: Dict[tuple, _InFlightCall] = {}
+        self._inflight_lock = threading.Lock()
 
+    @staticmethod
+    def _create_adapter(allowed_methods=Retry.DEFAULT_ALLOWED_METHODS) -> HTTPAdapter:
+        """
+        Create a pooled transport adapter.
+
+        Rate limiting (429, honouring Retry-After) and gateway errors (502/503/504) on
+        allowed_methods are retried by the adapter over the pooled connection, with jittered
+        backoff on urllib3 2.x; connection and read errors are left to the retry loop in
+        _make_request.
+        """
+        retry_options = dict(
+            total=3,
+            connect=0,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=allowed_methods,
+            raise_on_status=False
+        )
+        try:
+            retry = Retry(backoff_jitter=0.3, **retry_options)
+        except TypeError:  # urllib3 < 2.0 has no jitter option
+            retry = Retry(**retry_options)
+        return HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=retry)
+
+    @classmethod
+    def _create_session(cls) -> requests.Session:
+        """
+        Create a pooled HTTP session so repeated calls reuse open connections.
+
+        Responses are requested gzip/deflate-compressed, plus brotli ('br') when the
+        optional 'brotli' package is installed (urllib3 adds it to Accept-Encoding itself).
+        """
+        adapter = cls._create_adapter()
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def _create_http2_client():
+        """Create an httpx client that multiplexes concurrent requests over HTTP/2 when 'h2' is installed."""
+        if httpx is None:
+            raise ImportError(
+                "transport='httpx' requires httpx. Install it with: pip install 'storylinez[async]'"
+            )
+        return httpx.Client(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+            timeout=httpx.Timeout(30.0)
+        )
+
+    def _upload_session(self) -> requests.Session:
+        """
+        Return the pooled session used for transfers to pre-signed storage URLs.
+
+        It is kept apart from the API session because it talks to a different host and must
+        not retry: an upload body may be a file object that has already been read.
+        """
+        with self._prefetch_lock:
+            if self._s3_session is None:
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+                self._s3_session = requests.Session()
+                self._s3_session.mount("https://", adapter)
+                self._s3_session.mount("http://", adapter)
+            return self._s3_session
+
+    def _mount_idempotent_endpoints(self, *urls: str) -> None:
+        """
+        Let the adapter also retry POSTs to the given endpoints.
+
+        Only use this for endpoints that merely read data despite using POST, or that are
+        called with an Idempotency-Key header so the server can discard duplicates of a
+        request it already processed.
+        """
+        adapter = self._create_adapter(allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"})
+        for url in urls:
+            self._session.mount(url, adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=False)
+            self._prefetch_pool = None
+        if self._http2_client is not None:
+            self._http2_client.close()
+        if self._s3_session is not None:
+            self._s3_session.close()
+            self._s3_session = None
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _request_key(method: str, url: str, params: Dict = None, json_data: Any = None) -> tuple:
+        """Build a hashable key identifying a request by its method, URL, query and body"""
+        query = tuple(sorted((key, str(value)) for key, value in (params or {}).items()))
+        body = _json_key(json_data) if json_data is not None else None
+        return (method, url, query, body)
+
+    def _single_flight(self, key: tuple, fetch: Callable[[], Dict]) -> Dict:
+        """
+        Run fetch() once for concurrent callers sharing the same key.
+
+        The first caller performs the request; callers arriving while it is in flight
+        wait for it and each receive their own copy of its result (or its exception).
+        """
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                self._inflight[key] = call
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            result = fetch()
+            # Snapshot before waking the waiters, so changes the leader's caller makes cannot reach them
+            call.result = copy.deepcopy(result)
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+
+    def _swr_request(self, cache: OrderedDict, lock: threading.Lock, refreshing: set, ttl: float,
+                     stale_ttl: float, max_entries: int, method: str, url: str, params: Dict,
+                     data: Dict = None) -> Dict:
+        """
+        Send a read-only request through a stale-while-revalidate response cache.
+        
+        Responses younger than ttl are returned directly. Older ones, up to stale_ttl, are
+        returned too, but trigger a background refresh. A response containing signed URLs is
+        only served while every one of them remains valid for at least _SIGNED_URL_MIN_VALIDITY
+        seconds; streamable or download URLs whose expiry cannot be determined are never cached.
+        
+        Args:
+            cache: The client's cache, mapping request key -> (stored_at, response, signed URL expiry or None)
+            lock: Lock guarding cache and refreshing
+            refreshing: Request keys with a background refresh in progress
+            ttl: Seconds a response is reused as-is (0 disables caching)
+            stale_ttl: Age in seconds up to which an older response is returned while it is refreshed
+            max_entries: Maximum number of responses kept in cache
+            method, url, params, data: The request, as passed to _make_request
+        """
+        if ttl <= 0:
+            return self._make_request(method, url, params=params, json_data=data)
+        
+        key = self._request_key(method, url, params, data)
+        signed = params.get("generate_streamable") == "true" or params.get("generate_download") == "true"
+        refresh = False
+        with lock:
+            entry = cache.get(key)
+            if entry is not None:
+                age = time.monotonic() - entry[0]
+                if entry[2] is not None and entry[2] - time.time() < _SIGNED_URL_MIN_VALIDITY:
+                    del cache[key]  # Its links are about to expire
+                    entry = None
+                elif age < max(ttl, stale_ttl):
+                    cache.move_to_end(key)
+                    if age >= ttl and key not in refreshing:
+                        refreshing.add(key)
+                        refresh = True
+                    cached = copy.deepcopy(entry[1])
+                else:
+                    entry = None
+        
+        def fetch() -> Dict:
+            try:
+                result = self._make_request(method, url, params=params, json_data=data)
+                expiry = _signed_urls_expiry(result)
+                if signed and expiry is None:
+                    return result
+                with lock:
+                    cache.pop(key, None)
+                    cache[key] = (time.monotonic(), copy.deepcopy(result), expiry)
+                    while len(cache) > max_entries:
+                        cache.popitem(last=False)
+                return result
+            finally:
+                with lock:
+                    refreshing.discard(key)
+        
+        if entry is None:
+            return self._single_flight(key, fetch)
+        if refresh:
+            with self._prefetch_lock:
+                self._background_pool().submit(fetch)
+        return cached
+    
+    @staticmethod
+    def _fan_out(call: Callable[[Any], Dict], items: List, max_workers: int, error_key: str = None) -> List[Dict]:
+        """
+        Run call(item) for every item concurrently over the shared connection pool.
+        
+        Results keep the order of `items`. A failing call becomes an {"error": ...} entry,
+        also carrying {error_key: item} when error_key is given, so one failure doesn't
+        discard the other results.
+        """
+        def run(item) -> Dict:
+            try:
+                return call(item)
+            except Exception as e:
+                return {error_key: item, "error": str(e)} if error_key else {"error": str(e)}
+        
+        if len(items) <= 1:
+            return [run(item) for item in items]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+            return list(executor.map(run, items))
+    
+    def _background_pool(self) -> ThreadPoolExecutor:
+        """Return the small thread pool used for background requests (call with _prefetch_lock held)."""
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=4)
+        return self._prefetch_pool
+
+    def _request_page(
+        self,
+        method: str,
+        url: str,
+        params: Dict,
+        json_data: Dict = None,
+        prefetch_next: bool = False,
+        has_next_page: Optional[Callable[[Dict], bool]] = None,
+        validator: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Make a request for one page of a paginated endpoint.
+
+        If this exact page was prefetched recently, its result is used instead of a new
+        request. With prefetch_next, the following page (params["page"] + 1) is requested
+        in the background so a subsequent call for it returns without waiting.
+
+        Args:
+            method: HTTP method
+            url: The URL to send the request to
+            params: Query parameters, including "page"
+            json_data: JSON request body
+            prefetch_next: Whether to prefetch the following page
+            has_next_page: Optional predicate on the result; no prefetch happens if it returns False
+            validator: Optional ETag cache entry for the requested page (see _make_request)
+
+        Returns:
+            The JSON response for the requested page
+        """
+        key = self._request_key(method, url, params, json_data)
+        with self._prefetch_lock:
+            entry = self._prefetched.pop(key, None)
+
+        result = None
+        if entry is not None:
+            started_at, future = entry
+            if time.time() - started_at <= _PREFETCH_MAX_AGE:
+                try:
+                    result = future.result()
+                except Exception:
+                    result = None  # Prefetch failed, retry in the foreground
+        if result is None:
+            result = self._make_request(method, url, params=params, json_data=json_data, validator=validator)
+
+        if prefetch_next and (has_next_page is None or has_next_page(result)):
+            next_params = dict(params)
+            next_params["page"] = int(params.get("page", 1)) + 1
+            next_key = self._request_key(method, url, next_params, json_data)
+            with self._prefetch_lock:
+                if next_key not in self._prefetched:
+                    future = self._background_pool().submit(
+                        self._make_request, method, url, params=next_params, json_data=json_data
+                    )
+                    self._prefetched[next_key] = (time.time(), future)
+                    while len(self._prefetched) > _PREFETCH_MAX_PAGES:
+                        _, (_, stale_future) = self._prefetched.popitem(last=False)
+                        stale_future.cancel()
+
+        return result
+
+    @staticmethod
+    def _apply_validator(validator: Dict, response) -> Dict:
+        """Resolve a conditional request's response against its cache entry (see _make_request)."""
+        if response.status_code == 304 and "body" in validator:
+            return copy.deepcopy(validator["body"])
+        result = _json_loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            validator["etag"] = etag
+            validator["body"] = copy.deepcopy(result)
+        return result
+
+    def _iter_pages(self, fetch: Callable[[int], Dict], items_key: str, page: int, limit: int) -> Iterator[Dict]:
+        """
+        Yield the items of a page/limit listing, requesting each next page in the background.
+
+        Args:
+            fetch: Function returning the response for a page number
+            items_key: Key of the item list in each response
+            page: Page to start from
+            limit: Page size the listing was requested with
+
+        Yields:
+            Individual items, in the order the API returns them
+        """
+        result = fetch(page)
+        while True:
+            items = result.get(items_key) or []
+            future = None
+            if _has_more_pages(result, items, page, limit):
+                with self._prefetch_lock:
+                    future = self._background_pool().submit(fetch, page + 1)
+            try:
+                yield from items
+            except GeneratorExit:
+                if future is not None:
+                    future.cancel()  # Iteration stopped early
+                raise
+            if future is None:
+                return
+            result = future.result()
+            page += 1
+
+    def _require_org_id(self, org_id: str = None) -> str:
+        """Return org_id, or the default organization ID when it is not given."""
+        org_id = org_id or self.default_org_id
+        if not org_id:
+            raise ValueError(_MISSING_ORG_MSG)
+        return org_id
+
+    def _build_edit(self, resource_url: str, resource_id: str, edit: Dict, index: int = 0) -> Tuple[str, str, Dict]:
+        """Validate one apply_*_edits entry and return its prepared (op, url, request body)"""
+        if not isinstance(edit, dict) or edit.get("op") not in _EDIT_OPS:
+            raise ValueError(f"Edit {index} must be a dictionary with 'op' set to one of: {', '.join(_EDIT_OPS)}")
+        builder, endpoint = _EDIT_OPS[edit["op"]]
+        arguments = {key: value for key, value in edit.items() if key != "op"}
+        return edit["op"], f"{resource_url}/{endpoint}", getattr(self, builder)(resource_id, **arguments)
+    
+    def _send_edits(self, prepared: List[Tuple[str, str, Dict]], invalidate: Callable[[], None]) -> List[Dict]:
+        """Send prepared edits in order, then call invalidate() to drop cached reads they may have made stale"""
+        results = []
+        try:
+            for index, (op, url, data) in enumerate(prepared):
+                try:
+                    results.append(self._make_request("PUT", url, json_data=data))
+                except Exception as e:
+                    raise Exception(f"Edit {index} ({op}) failed after {index} edit(s) were applied: {e}") from e
+        finally:
+            if prepared:
+                invalidate()
+        return results
+    
     def _get_headers(self) -> Dict[str, str]:
         return {
             "X-API-Key": self.api_key,
@@ -16,6 +568,57 @@ class BaseClient:
             "Content-Type": "application/json",
         }
 
+    def _stream_items(self, method: str, url: str, prefix: Union[str, Tuple[str, ...]], params: Dict = None,
+                      json_data: Dict = None) -> Iterator[Any]:
+        """
+        Yield the elements of one array in a JSON response while it is still being downloaded.
+
+        The body is parsed incrementally with ijson, so items are available as soon as they
+        arrive and the full response is never held in memory. No retries are attempted once
+        items have been yielded.
+
+        Args:
+            method: HTTP method
+            url: The URL to send the request to
+            prefix: ijson path of the array elements, e.g. "results.item". Given a tuple of paths,
+                    the elements of all those arrays are yielded as (path, element) pairs in a
+                    single pass over the body.
+            params: Query parameters
+            json_data: JSON request body
+
+        Raises:
+            ImportError: If ijson is not installed
+            Exception: If the API returns an error status
+        """
+        if ijson is None:
+            raise ImportError("Streaming responses requires ijson. Install it with: pip install 'storylinez[stream]'")
+        response = self._session.request(
+            method=method,
+            url=url,
+            params=params,
+            data=_json_dumps(json_data) if json_data is not None else None,
+            headers=self._get_headers(),
+            stream=True
+        )
+        try:
+            if response.status_code >= 400:
+                error_message = f"API request failed with status {response.status_code}"
+                try:
+                    error_data = _json_loads(response.content)
+                    if "error" in error_data:
+                        error_message = f"{error_message}: {error_data['error']}"
+                except Exception:
+                    if response.text:
+                        error_message = f"{error_message}: {response.text}"
+                raise Exception(error_message)
+            response.raw.decode_content = True  # Let urllib3 undo gzip/deflate
+            if isinstance(prefix, str):
+                yield from ijson.items(response.raw, prefix, use_float=True)
+            else:
+                yield from _items_by_prefix(ijson.parse(response.raw, use_float=True), prefix)
+        finally:
+            response.close()
+
     def _make_request(
         self,
         method: str,
@@ -27,7 +630,9 @@ class BaseClient:
         files: Dict = None,
         headers: Dict = None,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        validator: Optional[Dict] = None,
+        coalesce: bool = True
     ) -> Dict:
         """
         Make an HTTP request with support for JSON payloads.
@@ -43,6 +648,12 @@ class BaseClient:
             headers (Dict, optional): Additional headers.
             max_retries (int, optional): Maximum number of retries for network errors.
             retry_delay (float, optional): Initial delay between retries in seconds.
+            validator (Dict, optional): Cache entry for a conditional request. Its "etag" is sent as
+                If-None-Match; a 304 response returns a copy of its "body", and a response carrying
+                an ETag stores the new etag and body in it.
+            coalesce (bool, optional): Let concurrent identical GETs share one round trip. Pass False
+                for GETs that create server-side state (such as upload links), where every caller
+                needs its own response.
 
         Returns:
             Dict: The JSON response from the API.
@@ -50,41 +661,82 @@ class BaseClient:
         Raises:
             Exception: If the request fails after retries or returns an error status.
         """
+        if coalesce and method == "GET" and data is None and files is None and not headers:
+            # Concurrent identical GETs share one round trip. The key is namespaced so that a
+            # caller already inside _single_flight for the same request does not wait on itself.
+            key = ("request",) + self._request_key(method, url, params)
+            return self._single_flight(key, lambda: self._send_request(
+                method, url, params, json_data, json, data, files, headers, max_retries, retry_delay, validator
+            ))
+        return self._send_request(
+            method, url, params, json_data, json, data, files, headers, max_retries, retry_delay, validator
+        )
+
+    def _send_request(self, method: str, url: str, params: Optional[Dict], json_data: Optional[Dict],
+                      json: Optional[Dict], data: Any, files: Optional[Dict], headers: Optional[Dict],
+                      max_retries: int, retry_delay: float, validator: Optional[Dict]) -> Dict:
+        """Send one request with retries; the implementation of _make_request."""
         request_headers = self._get_headers()
         if headers:
             request_headers.update(headers)
+        if validator and validator.get("etag"):
+            request_headers["If-None-Match"] = validator["etag"]
 
         # Prefer json_data if both are provided
         json_payload = json_data if json_data is not None else json
 
+        # Serialize JSON bodies ourselves so the faster encoder is used when available
+        if json_payload is not None and data is None and files is None:
+            data = _json_dumps(json_payload)
+            json_payload = None
+            if self.compression_threshold is not None and len(data) > self.compression_threshold:
+                data = gzip.compress(data, compresslevel=1)
+                request_headers["Content-Encoding"] = "gzip"
+
+        use_http2_client = self._http2_client is not None and files is None and isinstance(data, (bytes, type(None)))
+        network_errors = (
+            (httpx.TransportError,) if use_http2_client else
+            (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.RequestException)
+        )
+
         retries = 0
         while True:
             try:
-                response = requests.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json_payload,
-                    data=data,
-                    files=files,
-                    headers=request_headers
-                )
+                if use_http2_client:
+                    response = self._http2_client.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        json=json_payload,
+                        content=data,
+                        headers=request_headers
+                    )
+                else:
+                    response = self._session.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        json=json_payload,
+                        data=data,
+                        files=files,
+                        headers=request_headers
+                    )
                 
                 if response.status_code >= 400:
                     error_message = f"API request failed with status {response.status_code}"
                     try:
-                        error_data = response.json()
+                        error_data = _json_loads(response.content)
                         if "error" in error_data:
                             error_message = f"{error_message}: {error_data['error']}"
                     except:
                         if response.text:
                             error_message = f"{error_message}: {response.text}"
                     raise Exception(error_message)
-                return response.json()
+                if validator is not None:
+                    return self._apply_validator(validator, response)
+                return _json_loads(response.content)
                 
-            except (requests.exceptions.ConnectionError, 
-                    requests.exceptions.Timeout, 
-                    requests.exceptions.RequestException) as e:
+            except network_errors as e:
                 retries += 1
                 if retries > max_retries:
                     raise Exception(f"Maximum retry attempts reached after network errors: {str(e)}")
@@ -111,9 +111,7 @@ class BrandClient(BaseClient):
         Raises:
             ValueError: If required parameters are missing or invalid
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         if not filename:
             raise ValueError("Filename is required.")
@@ -128,7 +126,7 @@ class BrandClient(BaseClient):
             "filename": filename
         }
         
-        return self._make_request("GET", "logo-upload-url", params=params)
+        return self._make_request("GET", "logo-upload-url", params=params, coalesce=False)
     
     def upload_logo(
         self, 
@@ -161,9 +159,7 @@ class BrandClient(BaseClient):
             FileNotFoundError: If the file doesn't exist
             Exception: If upload fails
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         # Validate file exists
         if not os.path.isfile(file_path):
@@ -371,9 +367,7 @@ class BrandClient(BaseClient):
         Raises:
             ValueError: If required parameters are missing or invalid
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         if not name:
             raise ValueError("Brand name is required.")
@@ -505,9 +499,7 @@ class BrandClient(BaseClient):
         Raises:
             ValueError: If org_id is not provided
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         if page < 1:
             raise ValueError("Page must be greater than or equal to 1")
@@ -563,9 +555,7 @@ class BrandClient(BaseClient):
         Raises:
             ValueError: If org_id is not provided
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         params = {"org_id": org_id}
         return self._make_request("GET", "get_default", params=params)
@@ -880,9 +870,7 @@ class BrandClient(BaseClient):
         Raises:
             ValueError: If brand_id is not provided or org_id is missing
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         if not brand_id:
             raise ValueError("brand_id is required.")
@@ -1017,9 +1005,7 @@ class BrandClient(BaseClient):
             ValueError: If required parameters are missing or logo format is invalid
             FileNotFoundError: If the logo file doesn't exist
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         # Validate logo file exists
         if not os.path.isfile(logo_path):
@@ -1088,9 +1074,7 @@ class BrandClient(BaseClient):
         Raises:
             ValueError: If org_id is not provided
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         try:
             # Try to get default brand
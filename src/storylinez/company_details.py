@@ -61,9 +61,7 @@ class CompanyDetailsClient(BaseClient):
         Raises:
             ValueError: If company_name is empty or org_id is not provided
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         if not company_name or not isinstance(company_name, str):
             raise ValueError("company_name is required and must be a string")
@@ -123,9 +121,7 @@ class CompanyDetailsClient(BaseClient):
         Raises:
             ValueError: If page or limit are invalid or org_id is not provided
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Input validation with helpful messages
         if not isinstance(page, int) or page < 1:
@@ -217,9 +213,7 @@ class CompanyDetailsClient(BaseClient):
         Raises:
             ValueError: If org_id is not provided
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         params = {"org_id": org_id}
         
@@ -381,9 +375,7 @@ class CompanyDetailsClient(BaseClient):
         Raises:
             ValueError: If company_details_id or org_id is not provided
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         if not company_details_id:
             raise ValueError("company_details_id is required")
@@ -430,9 +422,7 @@ class CompanyDetailsClient(BaseClient):
         Raises:
             ValueError: If org_id is not provided or page/limit are invalid
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         # Input validation
         if not isinstance(page, int) or page < 1:
@@ -507,9 +497,7 @@ class CompanyDetailsClient(BaseClient):
         Raises:
             ValueError: If org_id is not provided, or if company_name is not provided and create_if_missing is True
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         try:
             # First, try to get the default company
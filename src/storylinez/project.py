@@ -45,9 +45,7 @@ class ProjectClient(BaseClient):
             - Folder names must be unique within an organization
             - Use clear, descriptive names to organize projects effectively
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         if not name or not name.strip():
             raise ValueError("Folder name cannot be empty")
@@ -77,9 +75,7 @@ class ProjectClient(BaseClient):
         Raises:
             ValueError: If organization ID is not provided
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         params = {
             "org_id": org_id
@@ -186,9 +182,7 @@ class ProjectClient(BaseClient):
         Raises:
             ValueError: If parameters are invalid or org_id is missing
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         # Validate pagination parameters
         if page < 1:
@@ -289,9 +283,7 @@ class ProjectClient(BaseClient):
             - If company_details_id or brand_id are omitted, organization defaults will be used if available
             - Provide a clear purpose and target_audience to help with content generation
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Validate required fields
         if not name or not name.strip():
@@ -354,9 +346,7 @@ class ProjectClient(BaseClient):
         Raises:
             ValueError: If parameters are invalid or org_id is missing
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Validate pagination
         if page < 1:
@@ -638,9 +628,7 @@ class ProjectClient(BaseClient):
             - Combining multiple filters creates an AND condition between them
             - search_fields determines which text fields are searched with the query parameter
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Validate status
         if status and status not in ["draft", "ongoing", "error", "completed"]:
@@ -761,9 +749,7 @@ class ProjectClient(BaseClient):
             - When folder_id is None, returns projects not assigned to any folder
             - Use generate_thumbnail_links=True to include thumbnail URLs in the response
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         # Validate pagination
         if page < 1:
@@ -821,9 +807,7 @@ class ProjectClient(BaseClient):
             - Combine with folder_id to get projects with specific status in a folder
             - Use for creating dashboards or tracking project progress
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         # Validate status
         valid_statuses = ["draft", "ongoing", "error", "completed"]
@@ -1271,9 +1255,7 @@ class ProjectClient(BaseClient):
         Notes:
             This is a convenience method that combines multiple API calls
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Create a folder if needed
         folder_id = None
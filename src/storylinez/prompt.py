@@ -573,9 +573,7 @@ class PromptClient(BaseClient):
         Raises:
             ValueError: If parameters are invalid or file extension is not MP4 (only MP4 files are supported)
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         if not filename or not filename.strip():
             raise ValueError("filename is required and cannot be empty")
@@ -602,7 +600,7 @@ class PromptClient(BaseClient):
             "file_size": file_size
         }
         
-        return self._make_request("GET", f"{self.prompts_url}/upload/create_link", params=params)
+        return self._make_request("GET", f"{self.prompts_url}/upload/create_link", params=params, coalesce=False)
     
     def complete_reference_video_upload(self, 
                                       upload_id: str = None, 
@@ -635,9 +633,7 @@ class PromptClient(BaseClient):
             ValueError: If required parameters are missing
                        Note: Only MP4 files are supported for reference videos
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         if not upload_id and not key:
             raise ValueError("Either upload_id or key must be provided")
@@ -711,9 +707,7 @@ class PromptClient(BaseClient):
         Raises:
             ValueError: If org_id is not provided or pagination parameters are invalid
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         # Normalize pagination parameters
         try:
@@ -828,9 +822,7 @@ class PromptClient(BaseClient):
         Raises:
             ValueError: If query is empty or org_id is not provided
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         if not query or not query.strip():
             raise ValueError("query is required and cannot be empty")
@@ -924,9 +916,7 @@ class PromptClient(BaseClient):
         Raises:
             ValueError: If file_ids is empty or org_id is not provided
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         if not file_ids:
             raise ValueError("file_ids list cannot be empty")
@@ -1017,9 +1007,7 @@ class PromptClient(BaseClient):
             FileNotFoundError: If file doesn't exist
             Note: Only MP4 files are supported for reference videos
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         # Validate file
         filename, file_size = self._validate_video_file(file_path)
@@ -1320,9 +1308,7 @@ class PromptClient(BaseClient):
         Raises:
             ValueError: If org_id is not provided
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         params = {"org_id": org_id}
         return self._make_request("GET", f"{self.prompts_url}/storage/usage", params=params)
@@ -1,12 +1,51 @@
 import os
+import copy
 import json
 import requests
-from typing import Dict, List, Optional, Union, Any, Tuple, TypeVar, cast
+from typing import Dict, List, Optional, Union, Any, Tuple, TypeVar, Callable, cast
 from datetime import datetime
-from .base_client import BaseClient
+from .base_client import BaseClient, _BOOL_STR
 import re
 import warnings
 import time
+import random
+import threading
+import functools
+import uuid
+
+# Render job states after which polling stops
+TERMINAL_RENDER_STATUSES = frozenset({"COMPLETED", "FAILED", "CANCELLED"})
+
+# Expiry fields of the signed links returned by get_render
+_LINK_EXPIRY_FIELDS = (
+    "download_expires_in",
+    "streamable_expires_in",
+    "thumbnail_streamable_expires_in",
+    "srt_download_expires_in"
+)
+
+# Render API endpoints, resolved to full URLs once per client
+_RENDER_ENDPOINTS = ("create", "get", "redo", "update", "selfupdate")
+
+# Identifier keys that **kwargs may not override in redo/update payloads
+_RESERVED_RENDER_KEYS = frozenset({"render_id", "project_id"})
+
+# Response fields read by get_render_status and get_render_download_links
+_STATUS_FIELDS = ("render_id", "project_id", "job_result", "created_at", "updated_at", "is_stale", "job_id")
+_LINK_FIELDS = ("render_id", "project_id", "job_result",
+                "download_url", "streamable_url", "thumbnail_streamable_url", "srt_download_url") + _LINK_EXPIRY_FIELDS
+
+# Upper bound on cached get_render responses per client
+_RENDER_CACHE_MAX_ENTRIES = 128
+
+def _require_render_or_project(method):
+    """Reject calls that identify neither a render nor a project"""
+    @functools.wraps(method)
+    def wrapper(self, render_id: Optional[str] = None, project_id: Optional[str] = None, *args, **kwargs):
+        if not render_id and not project_id:
+            raise ValueError("Either render_id or project_id must be provided")
+        return method(self, render_id, project_id, *args, **kwargs)
+    return wrapper
 
 # Type alias for RGB colors
 RGB = Tuple[int, int, int]
@@ -21,7 +60,9 @@ class RenderClient(BaseClient):
     Provides methods for creating and managing video renders based on sequences.
     """
     
-    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None):
+    __slots__ = ("render_url", "_urls", "_render_cache_ttl", "_render_cache", "_render_cache_lock")
+    
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None, render_cache_ttl: float = 2.0):
         """
         Initialize the RenderClient.
         
@@ -30,9 +71,15 @@ class RenderClient(BaseClient):
             api_secret: Your Storylinez API Secret
             base_url: Base URL for the API (defaults to production)
             default_org_id: Default organization ID to use for all API calls (optional)
+            render_cache_ttl: Seconds to reuse identical get_render responses (0 disables caching)
         """
         super().__init__(api_key, api_secret, base_url, default_org_id)
         self.render_url = f"{self.base_url}/render"
+        self._urls = {endpoint: f"{self.render_url}/{endpoint}" for endpoint in _RENDER_ENDPOINTS}
+        self._mount_idempotent_endpoints(self._urls["create"], self._urls["redo"])
+        self._render_cache_ttl = render_cache_ttl
+        self._render_cache: Dict[tuple, Tuple[float, Dict]] = {}
+        self._render_cache_lock = threading.Lock()
     
     # Utility functions for parameter handling
     
@@ -147,6 +194,131 @@ class RenderClient(BaseClient):
             
         return True
     
+    # Render settings grouped by how they are validated
+    _INT_SETTINGS = ("target_width", "target_height", "subtitle_font_size")
+    _VOLUME_SETTINGS = ("bg_music_volume", "video_audio_volume", "voiceover_volume")
+    _BOOL_SETTINGS = ("subtitle_enabled", "enable_cta", "color_balance_fix", "color_exposure_fix",
+                      "color_contrast_fix", "extend_short_clips")
+    _COLOR_SETTINGS = ("subtitle_color", "subtitle_bg_color")
+    _STRING_SETTINGS = ("company_name", "company_subtext", "call_to_action", "call_to_action_subtext")
+    _KNOWN_SETTINGS = frozenset(
+        _INT_SETTINGS + _VOLUME_SETTINGS + _BOOL_SETTINGS + _COLOR_SETTINGS + _STRING_SETTINGS +
+        ("subtitle_bg_opacity", "outro_duration", "extension_method")
+    ) | _RESERVED_RENDER_KEYS
+    
+    @classmethod
+    def _warn_unknown_settings(cls, keys) -> None:
+        """Warn about setting names the render API doesn't document (usually typos)"""
+        unknown = keys - cls._KNOWN_SETTINGS
+        if unknown:
+            warnings.warn(f"Unknown render parameters will be sent as-is: {', '.join(sorted(unknown))}")
+    
+    @classmethod
+    def _normalize_settings(cls, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate and coerce render settings for a request payload.
+        
+        Known settings left as None are dropped; unknown keys are passed through unchanged.
+        
+        Args:
+            settings: Mapping of render setting names to values
+            
+        Returns:
+            Dictionary ready to be merged into a request payload
+        """
+        data = {}
+        for key, value in settings.items():
+            if key in cls._INT_SETTINGS:
+                if value is not None:
+                    data[key] = int(value)
+            elif key in cls._VOLUME_SETTINGS:
+                if value is not None:
+                    data[key] = cls._validate_volume(value)
+            elif key in cls._BOOL_SETTINGS:
+                if value is not None:
+                    data[key] = bool(value)
+            elif key in cls._COLOR_SETTINGS:
+                if value is not None:
+                    data[key] = cls._normalize_color(value)
+            elif key in cls._STRING_SETTINGS:
+                if value is not None:
+                    data[key] = str(value)
+            elif key == "subtitle_bg_opacity":
+                if value is not None:
+                    if not 0.0 <= value <= 1.0:
+                        warnings.warn(f"subtitle_bg_opacity should be between 0.0 and 1.0, got {value}")
+                    data[key] = float(value)
+            elif key == "outro_duration":
+                if value is not None:
+                    if value < 0:
+                        raise ValueError("outro_duration cannot be negative")
+                    data[key] = float(value)
+            elif key == "extension_method":
+                if value is not None:
+                    if value not in ["freeze", "loop", "mirror"]:
+                        raise ValueError("extension_method must be 'freeze', 'loop', or 'mirror'")
+                    data[key] = str(value)
+            else:
+                data[key] = value
+        return data
+    
+    # Response caching
+    
+    def _get_cached_render(self, cache_key: tuple) -> Optional[Dict]:
+        """Return a copy of a cached get_render response if it hasn't expired"""
+        with self._render_cache_lock:
+            entry = self._render_cache.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.time():
+                self._render_cache.pop(cache_key, None)
+                return None
+            return copy.deepcopy(result)
+    
+    def _store_cached_render(self, cache_key: tuple, result: Dict, has_links: bool) -> None:
+        """Cache a get_render response, keeping signed links well within their expiry"""
+        ttl = self._render_cache_ttl
+        if has_links:
+            expiries = [result[field] for field in _LINK_EXPIRY_FIELDS
+                        if isinstance(result.get(field), (int, float))]
+            if not expiries:
+                return  # Unknown link lifetime, don't risk serving expired URLs
+            ttl = min([ttl] + [expiry / 2 for expiry in expiries])
+        if ttl <= 0:
+            return
+        
+        now = time.time()
+        with self._render_cache_lock:
+            if len(self._render_cache) >= _RENDER_CACHE_MAX_ENTRIES:
+                for key in [k for k, (expires_at, _) in self._render_cache.items() if expires_at <= now]:
+                    self._render_cache.pop(key, None)
+                while len(self._render_cache) >= _RENDER_CACHE_MAX_ENTRIES:
+                    self._render_cache.pop(next(iter(self._render_cache)))
+            self._render_cache[cache_key] = (now + ttl, copy.deepcopy(result))
+    
+    def invalidate_render_cache(self, render_id: Optional[str] = None, project_id: Optional[str] = None) -> None:
+        """
+        Drop cached get_render responses.
+        
+        Called automatically by methods that create or modify renders.
+        
+        Args:
+            render_id: Only drop entries for this render
+            project_id: Only drop entries for this project
+            
+        If neither ID is given, the whole cache is cleared.
+        """
+        with self._render_cache_lock:
+            if not render_id and not project_id:
+                self._render_cache.clear()
+                return
+            
+            for key, (_, result) in list(self._render_cache.items()):
+                if ((render_id and render_id in (key[0], result.get("render_id"))) or
+                        (project_id and project_id in (key[1], result.get("project_id")))):
+                    self._render_cache.pop(key, None)
+    
     # Render Creation and Management
     
     def create_render(
@@ -210,78 +382,41 @@ class RenderClient(BaseClient):
             raise ValueError("project_id is required")
             
         data = {"project_id": project_id}
-        
-        # Process specific parameters with validation
-        if target_width is not None:
-            data["target_width"] = int(target_width)
-        
-        if target_height is not None:
-            data["target_height"] = int(target_height)
-            
-        # Volume parameters
-        if bg_music_volume is not None:
-            data["bg_music_volume"] = self._validate_volume(bg_music_volume)
-            
-        if video_audio_volume is not None:
-            data["video_audio_volume"] = self._validate_volume(video_audio_volume)
-            
-        if voiceover_volume is not None:
-            data["voiceover_volume"] = self._validate_volume(voiceover_volume)
-        
-        # Boolean parameters
-        for param_name, param_value in [
-            ("subtitle_enabled", subtitle_enabled),
-            ("enable_cta", enable_cta),
-            ("color_balance_fix", color_balance_fix),
-            ("color_exposure_fix", color_exposure_fix),
-            ("color_contrast_fix", color_contrast_fix),
-            ("extend_short_clips", extend_short_clips)
-        ]:
-            if param_value is not None:
-                data[param_name] = bool(param_value)
-        
-        # Color parameters
-        if subtitle_color is not None:
-            data["subtitle_color"] = self._normalize_color(subtitle_color)
-            
-        if subtitle_bg_color is not None:
-            data["subtitle_bg_color"] = self._normalize_color(subtitle_bg_color)
-        
-        # Other numeric parameters
-        if subtitle_font_size is not None:
-            data["subtitle_font_size"] = int(subtitle_font_size)
-            
-        if subtitle_bg_opacity is not None:
-            if not 0.0 <= subtitle_bg_opacity <= 1.0:
-                warnings.warn(f"subtitle_bg_opacity should be between 0.0 and 1.0, got {subtitle_bg_opacity}")
-            data["subtitle_bg_opacity"] = float(subtitle_bg_opacity)
-            
-        if outro_duration is not None:
-            if outro_duration < 0:
-                raise ValueError("outro_duration cannot be negative")
-            data["outro_duration"] = float(outro_duration)
-        
-        # String parameters
-        for param_name, param_value in [
-            ("company_name", company_name),
-            ("company_subtext", company_subtext),
-            ("call_to_action", call_to_action),
-            ("call_to_action_subtext", call_to_action_subtext),
-            ("extension_method", extension_method)
-        ]:
-            if param_value is not None:
-                data[param_name] = str(param_value)
-                
-        # Validate extension method
-        if extension_method is not None and extension_method not in ["freeze", "loop", "mirror"]:
-            raise ValueError("extension_method must be 'freeze', 'loop', or 'mirror'")
+        data.update(self._normalize_settings({
+            "target_width": target_width,
+            "target_height": target_height,
+            "bg_music_volume": bg_music_volume,
+            "video_audio_volume": video_audio_volume,
+            "voiceover_volume": voiceover_volume,
+            "subtitle_enabled": subtitle_enabled,
+            "subtitle_font_size": subtitle_font_size,
+            "subtitle_color": subtitle_color,
+            "subtitle_bg_color": subtitle_bg_color,
+            "subtitle_bg_opacity": subtitle_bg_opacity,
+            "outro_duration": outro_duration,
+            "company_name": company_name,
+            "company_subtext": company_subtext,
+            "call_to_action": call_to_action,
+            "call_to_action_subtext": call_to_action_subtext,
+            "enable_cta": enable_cta,
+            "color_balance_fix": color_balance_fix,
+            "color_exposure_fix": color_exposure_fix,
+            "color_contrast_fix": color_contrast_fix,
+            "extend_short_clips": extend_short_clips,
+            "extension_method": extension_method
+        }))
         
         # Add any additional parameters from kwargs
-        for key, value in kwargs.items():
-            data[key] = value
+        self._warn_unknown_settings(kwargs.keys())
+        data.update(kwargs)
         
-        return self._make_request("POST", f"{self.render_url}/create", json_data=data)
+        # The key lets the server drop duplicates if a retried POST already went through
+        result = self._make_request("POST", self._urls["create"], json_data=data,
+                                    headers={"Idempotency-Key": str(uuid.uuid4())})
+        self.invalidate_render_cache(project_id=project_id)
+        return result
     
+    @_require_render_or_project
     def get_render(
         self, 
         render_id: Optional[str] = None, 
@@ -291,7 +426,8 @@ class RenderClient(BaseClient):
         include_subtitles: bool = False, 
         generate_download_link: bool = False,
         generate_streamable_link: bool = False, 
-        generate_thumbnail_stream_link: bool = False
+        generate_thumbnail_stream_link: bool = False,
+        fields: Optional[List[str]] = None
     ) -> Dict:
         """
         Get details of a render by either render ID or project ID.
@@ -305,29 +441,44 @@ class RenderClient(BaseClient):
             generate_download_link: Whether to generate a temporary download link
             generate_streamable_link: Whether to generate a temporary streamable link
             generate_thumbnail_stream_link: Whether to generate a thumbnail streamable link
+            fields: Optional list of top-level fields to return; the server omits everything else
             
         Returns:
             Dictionary with render details
         """
-        if not render_id and not project_id:
-            raise ValueError("Either render_id or project_id must be provided")
-            
         params = {
-            "include_results": str(include_results).lower(),
-            "include_sequence": str(include_sequence).lower(),
-            "include_subtitles": str(include_subtitles).lower(),
-            "generate_download_link": str(generate_download_link).lower(),
-            "generate_streamable_link": str(generate_streamable_link).lower(),
-            "generate_thumbnail_stream_link": str(generate_thumbnail_stream_link).lower()
+            "include_results": _BOOL_STR[bool(include_results)],
+            "include_sequence": _BOOL_STR[bool(include_sequence)],
+            "include_subtitles": _BOOL_STR[bool(include_subtitles)],
+            "generate_download_link": _BOOL_STR[bool(generate_download_link)],
+            "generate_streamable_link": _BOOL_STR[bool(generate_streamable_link)],
+            "generate_thumbnail_stream_link": _BOOL_STR[bool(generate_thumbnail_stream_link)]
         }
         
         if render_id:
             params["render_id"] = render_id
         if project_id:
             params["project_id"] = project_id
+        if fields:
+            params["fields"] = ",".join(fields)
+        
+        cache_key = (render_id, project_id, include_results, include_sequence, include_subtitles,
+                     generate_download_link, generate_streamable_link, generate_thumbnail_stream_link,
+                     params.get("fields"))
+        cached = self._get_cached_render(cache_key)
+        if cached is not None:
+            return cached
             
-        return self._make_request("GET", f"{self.render_url}/get", params=params)
+        has_links = generate_download_link or generate_streamable_link or generate_thumbnail_stream_link
+        
+        def fetch() -> Dict:
+            result = self._make_request("GET", self._urls["get"], params=params)
+            self._store_cached_render(cache_key, result, has_links)
+            return result
+        
+        return self._single_flight(cache_key, fetch)
     
+    @_require_render_or_project
     def redo_render(
         self, 
         render_id: Optional[str] = None, 
@@ -363,9 +514,6 @@ class RenderClient(BaseClient):
         Returns:
             Dictionary with the regeneration job details
         """
-        if not render_id and not project_id:
-            raise ValueError("Either render_id or project_id must be provided")
-            
         data = {}
         
         if render_id:
@@ -373,41 +521,28 @@ class RenderClient(BaseClient):
         if project_id:
             data["project_id"] = project_id
             
-        # Process specific parameters with validation
-        # Volume parameters
-        if bg_music_volume is not None:
-            data["bg_music_volume"] = self._validate_volume(bg_music_volume)
-            
-        if video_audio_volume is not None:
-            data["video_audio_volume"] = self._validate_volume(video_audio_volume)
-            
-        if voiceover_volume is not None:
-            data["voiceover_volume"] = self._validate_volume(voiceover_volume)
-        
-        # Boolean parameters
-        for param_name, param_value in [
-            ("subtitle_enabled", subtitle_enabled),
-            ("color_balance_fix", color_balance_fix),
-            ("color_exposure_fix", color_exposure_fix),
-            ("color_contrast_fix", color_contrast_fix),
-            ("extend_short_clips", extend_short_clips)
-        ]:
-            if param_value is not None:
-                data[param_name] = bool(param_value)
-                
-        # Validate extension method
-        if extension_method is not None:
-            if extension_method not in ["freeze", "loop", "mirror"]:
-                raise ValueError("extension_method must be 'freeze', 'loop', or 'mirror'")
-            data["extension_method"] = extension_method
+        data.update(self._normalize_settings({
+            "bg_music_volume": bg_music_volume,
+            "video_audio_volume": video_audio_volume,
+            "voiceover_volume": voiceover_volume,
+            "subtitle_enabled": subtitle_enabled,
+            "color_balance_fix": color_balance_fix,
+            "color_exposure_fix": color_exposure_fix,
+            "color_contrast_fix": color_contrast_fix,
+            "extend_short_clips": extend_short_clips,
+            "extension_method": extension_method
+        }))
         
         # Add any additional override parameters from kwargs
-        for key, value in kwargs.items():
-            if key not in ["render_id", "project_id"]:
-                data[key] = value
-            
-        return self._make_request("POST", f"{self.render_url}/redo", json_data=data)
+        self._warn_unknown_settings(kwargs.keys())
+        data.update((key, value) for key, value in kwargs.items() if key not in _RESERVED_RENDER_KEYS)
+        
+        result = self._make_request("POST", self._urls["redo"], json_data=data,
+                                    headers={"Idempotency-Key": str(uuid.uuid4())})
+        self.invalidate_render_cache(render_id, project_id)
+        return result
     
+    @_require_render_or_project
     def update_render_settings(
         self,
         render_id: Optional[str] = None,
@@ -459,9 +594,6 @@ class RenderClient(BaseClient):
         Returns:
             Dictionary with update confirmation
         """
-        if not render_id and not project_id:
-            raise ValueError("Either render_id or project_id must be provided")
-            
         data = {}
         
         if render_id:
@@ -469,70 +601,40 @@ class RenderClient(BaseClient):
         if project_id:
             data["project_id"] = project_id
             
-        # Process specific parameters with validation
-        # Volume parameters
-        if bg_music_volume is not None:
-            data["bg_music_volume"] = self._validate_volume(bg_music_volume)
-            
-        if video_audio_volume is not None:
-            data["video_audio_volume"] = self._validate_volume(video_audio_volume)
-            
-        if voiceover_volume is not None:
-            data["voiceover_volume"] = self._validate_volume(voiceover_volume)
-        
-        # Boolean parameters
-        for param_name, param_value in [
-            ("subtitle_enabled", subtitle_enabled),
-            ("enable_cta", enable_cta),
-            ("color_balance_fix", color_balance_fix),
-            ("color_exposure_fix", color_exposure_fix),
-            ("color_contrast_fix", color_contrast_fix)
-        ]:
-            if param_value is not None:
-                data[param_name] = bool(param_value)
-        
-        # Color parameters
-        if subtitle_color is not None:
-            data["subtitle_color"] = self._normalize_color(subtitle_color)
-            
-        if subtitle_bg_color is not None:
-            data["subtitle_bg_color"] = self._normalize_color(subtitle_bg_color)
-        
-        # Other numeric parameters
-        if subtitle_font_size is not None:
-            data["subtitle_font_size"] = int(subtitle_font_size)
-            
-        if subtitle_bg_opacity is not None:
-            if not 0.0 <= subtitle_bg_opacity <= 1.0:
-                warnings.warn(f"subtitle_bg_opacity should be between 0.0 and 1.0, got {subtitle_bg_opacity}")
-            data["subtitle_bg_opacity"] = float(subtitle_bg_opacity)
-            
-        if outro_duration is not None:
-            if outro_duration < 0:
-                raise ValueError("outro_duration cannot be negative")
-            data["outro_duration"] = float(outro_duration)
-        
-        # String parameters
-        for param_name, param_value in [
-            ("company_name", company_name),
-            ("company_subtext", company_subtext),
-            ("call_to_action", call_to_action),
-            ("call_to_action_subtext", call_to_action_subtext)
-        ]:
-            if param_value is not None:
-                data[param_name] = str(param_value)
+        updates = self._normalize_settings({
+            "bg_music_volume": bg_music_volume,
+            "video_audio_volume": video_audio_volume,
+            "voiceover_volume": voiceover_volume,
+            "subtitle_enabled": subtitle_enabled,
+            "subtitle_font_size": subtitle_font_size,
+            "subtitle_color": subtitle_color,
+            "subtitle_bg_color": subtitle_bg_color,
+            "subtitle_bg_opacity": subtitle_bg_opacity,
+            "outro_duration": outro_duration,
+            "company_name": company_name,
+            "company_subtext": company_subtext,
+            "call_to_action": call_to_action,
+            "call_to_action_subtext": call_to_action_subtext,
+            "enable_cta": enable_cta,
+            "color_balance_fix": color_balance_fix,
+            "color_exposure_fix": color_exposure_fix,
+            "color_contrast_fix": color_contrast_fix
+        })
         
         # Add any additional settings from kwargs
-        for key, value in kwargs.items():
-            if key not in ["render_id", "project_id"]:
-                data[key] = value
+        self._warn_unknown_settings(kwargs.keys())
+        updates.update((key, value) for key, value in kwargs.items() if key not in _RESERVED_RENDER_KEYS)
                 
         # Make sure at least one setting is being updated
-        if len(data) <= 1:  # Only has ID, no actual updates
+        if not updates:
             raise ValueError("At least one setting must be provided to update")
-            
-        return self._make_request("PUT", f"{self.render_url}/update", json_data=data)
+        data.update(updates)
+        
+        result = self._make_request("PUT", self._urls["update"], json_data=data)
+        self.invalidate_render_cache(render_id, project_id)
+        return result
     
+    @_require_render_or_project
     def update_render(
         self,
         render_id: Optional[str] = None,
@@ -553,9 +655,6 @@ class RenderClient(BaseClient):
         Returns:
             Dictionary with update confirmation
         """
-        if not render_id and not project_id:
-            raise ValueError("Either render_id or project_id must be provided")
-            
         data = {}
         
         if render_id:
@@ -566,8 +665,10 @@ class RenderClient(BaseClient):
             if not isinstance(fields_to_update, list):
                 raise TypeError("fields_to_update must be a list of strings")
             data["fields_to_update"] = fields_to_update
-            
-        return self._make_request("PUT", f"{self.render_url}/selfupdate", json_data=data)
+        
+        result = self._make_request("PUT", self._urls["selfupdate"], json_data=data)
+        self.invalidate_render_cache(render_id, project_id)
+        return result
     
     def get_render_status(
         self,
@@ -593,9 +694,13 @@ class RenderClient(BaseClient):
             - is_stale: Whether the render settings have been changed since the last render
         """
         result = self.get_render(render_id, project_id, include_results=True, 
-                               include_sequence=False, include_subtitles=False)
-        
-        # Extract status information for a cleaner response
+                               include_sequence=False, include_subtitles=False,
+                               fields=_STATUS_FIELDS)
+        return self._status_from_render(result)
+    
+    @staticmethod
+    def _status_from_render(result: Dict) -> Dict:
+        """Extract the simplified status view returned by get_render_status"""
         status = "UNKNOWN"
         job_result = result.get("job_result", {})
         
@@ -615,7 +720,8 @@ class RenderClient(BaseClient):
     def get_render_download_links(
         self,
         render_id: Optional[str] = None,
-        project_id: Optional[str] = None
+        project_id: Optional[str] = None,
+        render_data: Optional[Dict] = None
     ) -> Dict:
         """
         Get download and streaming links for a completed render.
@@ -626,6 +732,9 @@ class RenderClient(BaseClient):
         Args:
             render_id: ID of the render (either this or project_id must be provided)
             project_id: ID of the project whose render to access (either this or render_id must be provided)
+            render_data: Optional get_render response you already have (e.g. from create_and_wait_for_render).
+                If it belongs to a completed render and already contains a download_url, the links are
+                taken from it and no request is made.
             
         Returns:
             Dictionary with download and streaming URLs:
@@ -633,27 +742,44 @@ class RenderClient(BaseClient):
             - streamable_url: Link for streaming the video
             - thumbnail_streamable_url: Link for the video thumbnail
             - srt_download_url: Link for the SRT subtitle file
+            - job_result: The render job result the links were read from
             
         Raises:
             Exception: If the render is not yet complete
         """
-        result = self.get_render(
-            render_id, project_id, 
-            include_results=True,
-            generate_download_link=True, 
-            generate_streamable_link=True, 
-            generate_thumbnail_stream_link=True
-        )
-        
+        if self._has_download_links(render_data):
+            result = render_data
+        else:
+            result = self.get_render(
+                render_id, project_id, 
+                include_results=True,
+                generate_download_link=True, 
+                generate_streamable_link=True, 
+                generate_thumbnail_stream_link=True,
+                fields=_LINK_FIELDS
+            )
+        return self._links_from_render(result)
+    
+    @staticmethod
+    def _has_download_links(render_data: Optional[Dict]) -> bool:
+        """Check whether a get_render response belongs to a completed render and carries its links"""
+        return bool(render_data and render_data.get("download_url") and
+                    (render_data.get("job_result") or {}).get("status") == "COMPLETED")
+    
+    @staticmethod
+    def _links_from_render(result: Dict) -> Dict:
+        """Extract the links returned by get_render_download_links, failing if the render isn't complete"""
         # Check if render is complete
-        job_result = result.get("job_result", {})
-        if job_result.get("status") != "COMPLETED":
-            raise Exception(f"Render is not yet complete. Current status: {job_result.get('status', 'UNKNOWN')}")
+        job_result = result.get("job_result") or {}
+        status = job_result.get("status", "UNKNOWN")
+        if status != "COMPLETED":
+            raise Exception(f"Render is not yet complete. Current status: {status}")
             
         # Extract and return just the links
         links = {
             "render_id": result.get("render_id"),
             "project_id": result.get("project_id"),
+            "job_result": job_result,
             "download_url": result.get("download_url"),
             "download_expires_in": result.get("download_expires_in"),
             "streamable_url": result.get("streamable_url"),
@@ -666,8 +792,191 @@ class RenderClient(BaseClient):
         
         return links
         
+    def download_render(
+        self,
+        render_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        output_path: Optional[str] = None,
+        chunk_size: int = 1 << 20,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+        render_data: Optional[Dict] = None
+    ) -> str:
+        """
+        Download the rendered video to local storage.
+        
+        The video is streamed to disk in chunks, so memory use stays at chunk_size
+        regardless of how large the video is.
+        
+        Args:
+            render_id: ID of the render (either this or project_id must be provided)
+            project_id: ID of the project whose render to download (either this or render_id must be provided)
+            output_path: Local path where the video should be saved.
+                        If not provided, will create a file in the current directory.
+            chunk_size: Number of bytes to read and write at a time
+            progress_callback: Optional callback invoked as progress_callback(bytes_written, total_bytes)
+                        after each chunk; total_bytes is None if the server doesn't report a size
+            render_data: Optional get_render response with links, passed on to get_render_download_links
+            
+        Returns:
+            Path to the downloaded file
+            
+        Raises:
+            Exception: If the render is not yet complete or the download fails
+        """
+        links = self.get_render_download_links(render_id, project_id, render_data=render_data)
+        download_url = links.get("download_url")
+        if not download_url:
+            raise Exception("Render download URL is not available")
+        
+        if not output_path:
+            output_path = f"{links.get('render_id') or 'render'}.mp4"
+        
+        partial_path = f"{output_path}.part"
+        with self._session.get(download_url, stream=True, timeout=(10, 300)) as response:
+            if response.status_code >= 400:
+                raise Exception(f"Failed to download render: HTTP {response.status_code}")
+            
+            content_length = response.headers.get("Content-Length")
+            total_bytes = int(content_length) if content_length and content_length.isdigit() else None
+            bytes_written = 0
+            
+            try:
+                with open(partial_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if not chunk:
+                            continue
+                        f.write(chunk)
+                        bytes_written += len(chunk)
+                        if progress_callback:
+                            progress_callback(bytes_written, total_bytes)
+                os.replace(partial_path, output_path)
+            except BaseException:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+                raise
+        
+        return output_path
+    
+    # Bulk operations
+    
+    def _map_renders(
+        self,
+        fetch: Callable[[str], Dict],
+        render_ids: List[str],
+        max_workers: int
+    ) -> Dict[str, Dict]:
+        """
+        Run a per-render call concurrently over the shared connection pool.
+        
+        Failures are reported per render as {"render_id": ..., "error": ...}
+        so one bad ID doesn't discard the other results.
+        """
+        if not isinstance(render_ids, list):
+            raise TypeError("render_ids must be a list of strings")
+        unique_ids = list(dict.fromkeys(rid for rid in render_ids if rid))
+        if not unique_ids:
+            return {}
+        return dict(zip(unique_ids, self._fan_out(fetch, unique_ids, max_workers, error_key="render_id")))
+    
+    def get_render_statuses(self, render_ids: List[str], max_workers: int = 8) -> Dict[str, Dict]:
+        """
+        Get the status of several renders at once.
+        
+        Requests are issued concurrently instead of one after another, so checking
+        N renders takes roughly as long as the slowest single check.
+        
+        Args:
+            render_ids: List of render IDs to check
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            Dictionary mapping each render ID to its get_render_status result.
+            Renders that could not be fetched map to a dictionary with an "error" key.
+        """
+        return self._map_renders(
+            lambda render_id: self.get_render_status(render_id=render_id),
+            render_ids,
+            max_workers
+        )
+    
+    def get_render_download_links_bulk(self, render_ids: List[str], max_workers: int = 8) -> Dict[str, Dict]:
+        """
+        Get download and streaming links for several completed renders at once.
+        
+        Args:
+            render_ids: List of render IDs
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            Dictionary mapping each render ID to its get_render_download_links result.
+            Renders that are incomplete or could not be fetched map to a dictionary with an "error" key.
+        """
+        return self._map_renders(
+            lambda render_id: self.get_render_download_links(render_id=render_id),
+            render_ids,
+            max_workers
+        )
+    
     # Advanced workflows
     
+    @_require_render_or_project
+    def wait_for_render(
+        self,
+        render_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        timeout: float = 1800,
+        initial_interval: float = 2.0,
+        max_interval: float = 30.0,
+        on_progress: Optional[Callable[[Dict], None]] = None
+    ) -> Dict:
+        """
+        Wait for a render job to reach a terminal state (COMPLETED, FAILED or CANCELLED).
+        
+        Polls get_render_status with exponential backoff and jitter, so long renders
+        are checked less and less often instead of at a fixed tight interval.
+        
+        Args:
+            render_id: ID of the render to wait for (either this or project_id must be provided)
+            project_id: ID of the project whose render to wait for (either this or render_id must be provided)
+            timeout: Maximum time to wait in seconds
+            initial_interval: Delay before the second status check in seconds
+            max_interval: Upper bound for the delay between status checks in seconds
+            on_progress: Optional callback invoked with each status dictionary
+            
+        Returns:
+            The final status dictionary as returned by get_render_status
+            
+        Raises:
+            ValueError: If neither render_id nor project_id is provided
+            TimeoutError: If the render doesn't reach a terminal state within the timeout
+        """
+        deadline = time.time() + timeout
+        attempt = 0
+        while True:
+            status_result = self.get_render_status(render_id=render_id, project_id=project_id)
+            
+            if on_progress:
+                try:
+                    on_progress(status_result)
+                except Exception:
+                    pass  # Don't let callback errors break the polling
+            
+            if status_result.get("status") in TERMINAL_RENDER_STATUSES:
+                return status_result
+            
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutError(f"Render did not complete within the timeout of {timeout} seconds")
+            
+            delay = min(max_interval, initial_interval * (1.5 ** attempt)) + random.uniform(0, 0.5)
+            time.sleep(min(delay, remaining))
+            attempt += 1
+    
+    @staticmethod
+    def _print_render_progress(status_result: Dict) -> None:
+        """Print a one-line status update while waiting on a render"""
+        print(f"Render status: {status_result.get('status', 'UNKNOWN')}. Waiting...")
+    
     def create_and_wait_for_render(
         self,
         project_id: str,
@@ -706,31 +1015,30 @@ class RenderClient(BaseClient):
             raise ValueError("Failed to get render_id from response")
         
         # Poll for completion
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            status_result = self.get_render_status(render_id=render_id)
-            status = status_result.get("status", "UNKNOWN")
-            
-            if status == "COMPLETED":
-                if auto_generate_links:
-                    return self.get_render(
-                        render_id=render_id,
-                        include_results=True,
-                        generate_download_link=True,
-                        generate_streamable_link=True,
-                        generate_thumbnail_stream_link=True
-                    )
-                else:
-                    return self.get_render(render_id=render_id, include_results=True)
-            elif status == "FAILED":
-                details = self.get_render(render_id=render_id, include_results=True)
-                error_message = details.get("job_result", {}).get("error", "Unknown error")
-                raise Exception(f"Render failed: {error_message}")
-            
-            print(f"Render status: {status}. Waiting {poll_interval} seconds...")
-            time.sleep(poll_interval)
+        status_result = self.wait_for_render(
+            render_id=render_id,
+            timeout=timeout,
+            initial_interval=poll_interval,
+            max_interval=max(poll_interval, 30.0),
+            on_progress=self._print_render_progress
+        )
+        status = status_result.get("status", "UNKNOWN")
         
-        raise TimeoutError(f"Render did not complete within the timeout of {timeout} seconds")
+        if status == "COMPLETED":
+            if auto_generate_links:
+                return self.get_render(
+                    render_id=render_id,
+                    include_results=True,
+                    generate_download_link=True,
+                    generate_streamable_link=True,
+                    generate_thumbnail_stream_link=True
+                )
+            else:
+                return self.get_render(render_id=render_id, include_results=True)
+        
+        details = self.get_render(render_id=render_id, include_results=True)
+        error_message = details.get("job_result", {}).get("error", "Unknown error")
+        raise Exception(f"Render {status.lower()}: {error_message}")
     
     def update_settings_and_redo(
         self,
@@ -774,27 +1082,26 @@ class RenderClient(BaseClient):
         
         if wait_for_completion:
             # Poll for completion
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                status_result = self.get_render_status(render_id=render_id)
-                status = status_result.get("status", "UNKNOWN")
-                
-                if status == "COMPLETED":
-                    return self.get_render(
-                        render_id=render_id,
-                        include_results=True,
-                        generate_download_link=True,
-                        generate_streamable_link=True,
-                        generate_thumbnail_stream_link=True
-                    )
-                elif status == "FAILED":
-                    details = self.get_render(render_id=render_id, include_results=True)
-                    error_message = details.get("job_result", {}).get("error", "Unknown error")
-                    raise Exception(f"Render failed: {error_message}")
-                
-                print(f"Render status: {status}. Waiting {poll_interval} seconds...")
-                time.sleep(poll_interval)
-                
-            raise TimeoutError(f"Render did not complete within the timeout of {timeout} seconds")
+            status_result = self.wait_for_render(
+                render_id=render_id,
+                timeout=timeout,
+                initial_interval=poll_interval,
+                max_interval=max(poll_interval, 30.0),
+                on_progress=self._print_render_progress
+            )
+            status = status_result.get("status", "UNKNOWN")
+            
+            if status == "COMPLETED":
+                return self.get_render(
+                    render_id=render_id,
+                    include_results=True,
+                    generate_download_link=True,
+                    generate_streamable_link=True,
+                    generate_thumbnail_stream_link=True
+                )
+            
+            details = self.get_render(render_id=render_id, include_results=True)
+            error_message = details.get("job_result", {}).get("error", "Unknown error")
+            raise Exception(f"Render {status.lower()}: {error_message}")
         
         return result
@@ -1,12 +1,98 @@
 import os
 import json
+import copy
+import time
+import threading
 import requests
 import re
-from typing import Dict, List, Optional, Union, Any, Tuple
-from .base_client import BaseClient
+from collections import OrderedDict
+from typing import Dict, List, Optional, Union, Any, Tuple, Iterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from .base_client import BaseClient, _BOOL_STR
 import warnings
 import colorsys
 
+_SEARCH_CACHE_MAX_ENTRIES = 128
+_DEFAULT_MEDIA_TYPES = ('video', 'audio', 'image')
+
+# Endpoints under /search/files used by the search methods
+_SEARCH_SUBPATHS = (
+    "video/scenes", "video/objects", "audio", "combined", "audio/by-genre", "audio/by-mood",
+    "audio/by-instrument", "audio/by-transcription", "image/by-objects", "image/by-color",
+    "image/by-text", "by-tags", "video/by-tags", "audio/by-tags", "image/by-tags"
+)
+_VALID_MEDIA_TYPES = frozenset(_DEFAULT_MEDIA_TYPES)
+
+# Search methods that can be combined in one search_batch call
+_BATCH_SEARCH_METHODS = frozenset((
+    "search_video_scenes", "search_video_objects", "search_audio_content", "search_combined",
+    "search_audio_by_genre", "search_audio_by_mood", "search_audio_by_instrument",
+    "search_audio_by_transcription", "search_image_by_objects", "search_image_by_color",
+    "search_image_by_text", "search_by_tags", "search_video_by_tags", "search_audio_by_tags",
+    "search_image_by_tags"
+))
+
+# Search methods that accept a keyset pagination cursor
+_CURSOR_SEARCH_METHODS = frozenset(("search_video_by_tags", "search_audio_by_tags", "search_image_by_tags"))
+
+def _is_cursor_page(result: Dict) -> bool:
+    """Tell whether a search response uses keyset pagination (next_cursor/has_more)."""
+    pagination = result.get("pagination") or {}
+    return any(key in container for container in (result, pagination) for key in ("next_cursor", "has_more"))
+
+def _next_cursor(result: Dict) -> Optional[str]:
+    """Return the cursor for the results after this response, or None if there are no more."""
+    pagination = result.get("pagination") or {}
+    if result.get("has_more") is False or pagination.get("has_more") is False:
+        return None
+    return result.get("next_cursor") or pagination.get("next_cursor")
+
+def _split_batch_spec(spec: Dict) -> Tuple[str, Dict]:
+    """Split a search_batch entry into the search method name and its keyword arguments."""
+    if not isinstance(spec, dict) or "method" not in spec:
+        raise TypeError("Each batch entry must be a dictionary with a 'method' key")
+    method = spec["method"]
+    if method not in _BATCH_SEARCH_METHODS:
+        raise ValueError(f"Unsupported batch search method: {method}. Valid methods are: {', '.join(sorted(_BATCH_SEARCH_METHODS))}")
+    return method, {key: value for key, value in spec.items() if key != "method"}
+
+def _has_next_page(result: Dict, page: int, page_size: int) -> bool:
+    """Tell from a search response whether a page after `page` exists."""
+    pagination = result.get("pagination") or {}
+    if pagination.get("total_pages") is not None:
+        return page < pagination["total_pages"]
+    if pagination.get("total_results") is not None:
+        return page * page_size < pagination["total_results"]
+    # Results removed by dedup still came from the server's page
+    return len(result.get("results") or []) + result.get("duplicates_removed", 0) >= page_size
+
+def _tag_signature(item: Dict) -> Tuple:
+    """Default dedup key for tag searches: the item's sorted tags and its normalized title."""
+    tags = item.get("tags") or []
+    return tuple(sorted(str(tag) for tag in tags)), (item.get("title") or "").strip().lower()
+
+def _dedup_results(result: Dict, key: Callable[[Dict], Any]) -> Dict:
+    """
+    Collapse search results that share a signature, keeping the highest-scoring one.
+
+    Survivors keep the position of the first item with their signature. The response
+    itself is not modified; a shallow copy with the reduced "results" list is returned,
+    along with "duplicates_removed".
+    """
+    items = result.get("results")
+    if not items:
+        return result
+    best = {}
+    for item in items:
+        signature = key(item)
+        kept = best.get(signature)
+        if kept is None or (item.get("score") or 0) > (kept.get("score") or 0):
+            best[signature] = item  # Replacing a key keeps its original position
+    deduped = dict(result)
+    deduped["results"] = list(best.values())
+    deduped["duplicates_removed"] = len(items) - len(best)
+    return deduped
+
 class SearchClient(BaseClient):
     """
     Client for interacting with Storylinez Search API.
@@ -16,9 +102,11 @@ class SearchClient(BaseClient):
     - Advanced validation before API calls
     - Helper methods for complex workflows
     - Automatic conversion of formats (like hex to RGB)
+    - Connection reuse across searches (use as a context manager or call close() when done)
     """
     
-    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None):
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None,
+                 transport: str = "requests"):
         """
         Initialize the SearchClient.
         
@@ -27,9 +115,15 @@ class SearchClient(BaseClient):
             api_secret: Your Storylinez API Secret
             base_url: Base URL for the API (defaults to production)
             default_org_id: Default organization ID to use for all API calls (optional)
+            transport: "requests" (default) or "httpx" to send searches over a shared HTTP/2 connection
+                       (requires the 'async' extra)
         """
-        super().__init__(api_key, api_secret, base_url, default_org_id)
+        super().__init__(api_key, api_secret, base_url, default_org_id, transport)
         self.search_url = f"{self.base_url}/search"
+        self._search_urls = {subpath: f"{self.search_url}/files/{subpath}" for subpath in _SEARCH_SUBPATHS}
+        self._search_cache = OrderedDict()  # request key -> (stored_at, response)
+        self._search_etags = OrderedDict()  # request key -> {"etag": ..., "body": ...}
+        self._search_cache_lock = threading.Lock()
         
         # Validate API key format
         if not api_key.startswith("api_"):
@@ -49,6 +143,116 @@ class SearchClient(BaseClient):
         if not (1 <= page_size <= 100):
             raise ValueError("page_size must be between 1 and 100")
     
+    @staticmethod
+    def _validate_media_types(media_types: Optional[List[str]]) -> List[str]:
+        """Validate media types, defaulting to all of them if none are specified."""
+        if not media_types:
+            return _DEFAULT_MEDIA_TYPES
+        
+        invalid_types = [mt for mt in media_types if mt not in _VALID_MEDIA_TYPES]
+        if invalid_types:
+            raise ValueError(f"Invalid media types: {invalid_types}. Valid types are: {', '.join(_DEFAULT_MEDIA_TYPES)}")
+        return media_types
+    
+    @staticmethod
+    def _validate_hues(dominant_hues: Dict[str, int]) -> None:
+        """Validate a {"min": ..., "max": ...} hue range."""
+        if not isinstance(dominant_hues, dict):
+            raise TypeError("dominant_hues must be a dictionary with 'min' and 'max' keys")
+        try:
+            min_hue, max_hue = dominant_hues["min"], dominant_hues["max"]
+        except KeyError:
+            raise ValueError("dominant_hues must contain 'min' and 'max' keys")
+        if not (0 <= min_hue <= 360 and 0 <= max_hue <= 360):
+            raise ValueError("Hue values must be between 0 and 360")
+    
+    def _build_search_params(self, media_source: str, folder_path: Optional[str], page: int, page_size: int,
+                             generate_thumbnail: bool, generate_streamable: bool, generate_download: bool,
+                             org_id: Optional[str], extra_params: Dict) -> Dict:
+        """Validate the parameters shared by all search methods and build the query string."""
+        org_id = org_id or self.default_org_id
+        self._validate_common_params(media_source, org_id, page, page_size)
+        
+        params = {
+            "media_source": media_source,
+            "page": page,
+            "page_size": page_size,
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)]
+        }
+        
+        if media_source == "user":
+            params["org_id"] = org_id
+        
+        if folder_path:
+            params["folder_path"] = folder_path
+        
+        # Add any additional parameters
+        params.update({k: v for k, v in extra_params.items() if v is not None})
+        if params.get("starting_after"):
+            del params["page"]  # Keyset pagination replaces the page offset
+        return params
+    
+    def _search(self, subpath: str, data: Dict, media_source: str, folder_path: Optional[str], page: int,
+                page_size: int, generate_thumbnail: bool, generate_streamable: bool, generate_download: bool,
+                org_id: Optional[str], prefetch_next: bool, cache_ttl: float, extra_params: Dict) -> Dict:
+        """Run a search against /search/files/<subpath> with the given request body."""
+        params = self._build_search_params(media_source, folder_path, page, page_size, generate_thumbnail,
+                                           generate_streamable, generate_download, org_id, extra_params)
+        return self._paginated_post(self._search_urls[subpath], params, data, prefetch_next, cache_ttl)
+    
+    def _paginated_post(self, url: str, params: Dict, data: Dict, prefetch_next: bool, cache_ttl: float = 0) -> Dict:
+        """
+        POST a search request for one page of results, optionally prefetching the next page.
+        
+        With a positive cache_ttl, an identical request made within that many seconds is
+        answered from the in-process cache instead of the API. Otherwise, if the API sent an
+        ETag for an earlier identical request, it is revalidated with If-None-Match and an
+        unchanged page is not downloaded again.
+        """
+        cache_key = self._request_key("POST", url, params, data)
+        with self._search_cache_lock:
+            if cache_ttl > 0:
+                entry = self._search_cache.get(cache_key)
+                if entry is not None and time.monotonic() - entry[0] < cache_ttl:
+                    return copy.deepcopy(entry[1])
+            validator = self._search_validator(cache_key)
+        
+        page, page_size = params.get("page"), params["page_size"]
+        # Identical searches issued concurrently (e.g. from several threads) share one request
+        result = self._single_flight(cache_key, lambda: self._request_page(
+            "POST", url, params, data,
+            prefetch_next=prefetch_next,
+            has_next_page=lambda result: (page is not None and not _is_cursor_page(result)
+                                          and _has_next_page(result, page, page_size)),
+            validator=validator
+        ))
+        
+        if cache_ttl > 0:
+            with self._search_cache_lock:
+                self._search_cache.pop(cache_key, None)
+                self._search_cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
+                while len(self._search_cache) > _SEARCH_CACHE_MAX_ENTRIES:
+                    self._search_cache.popitem(last=False)
+        return result
+    
+    def _search_validator(self, cache_key: tuple) -> Dict:
+        """Return the ETag entry for a search request, creating it if needed (call with the cache lock held)."""
+        validator = self._search_etags.pop(cache_key, None)
+        if validator is None:
+            validator = {}
+        self._search_etags[cache_key] = validator
+        while len(self._search_etags) > _SEARCH_CACHE_MAX_ENTRIES:
+            self._search_etags.popitem(last=False)
+        return validator
+    
+    def invalidate_search_cache(self) -> None:
+        """Drop all cached search responses (see the cache_ttl parameter of the search methods)."""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+            self._search_etags.clear()
+    
     def _parse_hex_to_hue(self, hex_color: str) -> int:
         """Convert a hex color string to a hue value (0-360)."""
         if not hex_color.startswith("#"):
@@ -76,7 +280,8 @@ class SearchClient(BaseClient):
     def search_video_scenes(self, query: str, media_source: str = "user", 
                           folder_path: str = None, page: int = 1, page_size: int = 20,
                           generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                          generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                          generate_download: bool = False, org_id: str = None,
+                          prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for video scenes by description.
         
@@ -90,6 +295,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -105,39 +312,19 @@ class SearchClient(BaseClient):
         if not isinstance(query, str):
             raise TypeError("query must be a string")
             
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
         data = {
             "query": query
         }
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/video/scenes", params=params, json_data=data)
+        return self._search("video/scenes", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
     
     def search_video_objects(self, objects: List[str], media_source: str = "user", 
                            folder_path: str = None, page: int = 1, page_size: int = 20,
                            generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                           generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                           generate_download: bool = False, org_id: str = None,
+                           prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for objects in videos.
         
@@ -151,6 +338,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -167,40 +356,20 @@ class SearchClient(BaseClient):
         if not isinstance(objects, list) or not all(isinstance(obj, str) for obj in objects):
             raise TypeError("objects must be a list of strings")
             
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
         data = {
             "objects": objects
         }
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/video/objects", params=params, json_data=data)
+        return self._search("video/objects", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
     
     def search_audio_content(self, query: str = None, genre: str = None, mood: str = None,
                            instruments: List[str] = None, media_source: str = "user",
                            folder_path: str = None, page: int = 1, page_size: int = 20,
                            generate_thumbnail: bool = True, generate_streamable: bool = False,
-                           generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                           generate_download: bool = False, org_id: str = None,
+                           prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for audio content by text, genre, mood, or instruments.
         
@@ -217,6 +386,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -232,26 +403,6 @@ class SearchClient(BaseClient):
         if not any([query, genre, mood, instruments]):
             raise ValueError("At least one search parameter (query, genre, mood, or instruments) is required")
         
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
         data = {}
         if query:
             data["query"] = query
@@ -264,15 +415,15 @@ class SearchClient(BaseClient):
                 instruments = [instruments]  # Convert single string to list
             data["instruments"] = instruments
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/audio", params=params, json_data=data)
+        return self._search("audio", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
     
     def search_combined(self, query: str, media_types: List[str] = None, media_source: str = "user", 
                        folder_path: str = None, page: int = 1, page_size: int = 20,
                        generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                       generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                       generate_download: bool = False, org_id: str = None,
+                       prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Combined semantic search across different media types.
         
@@ -287,6 +438,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -305,51 +458,23 @@ class SearchClient(BaseClient):
         if not isinstance(query, str):
             raise TypeError("query must be a string")
         
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-        
-        # Default to all media types if none specified
-        if not media_types:
-            media_types = ['video', 'audio', 'image']
-        
-        # Validate media types
-        valid_types = ['video', 'audio', 'image']
-        invalid_types = [mt for mt in media_types if mt not in valid_types]
-        if invalid_types:
-            raise ValueError(f"Invalid media types: {invalid_types}. Valid types are: {', '.join(valid_types)}")
+        media_types = self._validate_media_types(media_types)
             
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
         data = {
             "query": query,
             "media_types": media_types
         }
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/combined", params=params, json_data=data)
+        return self._search("combined", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
     
     def search_audio_by_genre(self, genres: List[str], min_probability: float = 0.1,
                             media_source: str = "user", folder_path: str = None,
                             page: int = 1, page_size: int = 20,
                             generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                            generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                            generate_download: bool = False, org_id: str = None,
+                            prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for audio files by genre.
         
@@ -364,6 +489,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -386,26 +513,6 @@ class SearchClient(BaseClient):
         if not isinstance(min_probability, (int, float)) or not (0 <= min_probability <= 1):
             raise ValueError("min_probability must be a number between 0 and 1")
             
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
         # Normalize genres to lowercase
         genres = [g.lower() for g in genres]
         
@@ -414,15 +521,15 @@ class SearchClient(BaseClient):
             "min_probability": min_probability
         }
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/audio/by-genre", params=params, json_data=data)
+        return self._search("audio/by-genre", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
     
     def search_audio_by_mood(self, moods: List[str], media_source: str = "user", 
                            folder_path: str = None, page: int = 1, page_size: int = 20,
                            generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                           generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                           generate_download: bool = False, org_id: str = None,
+                           prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for audio files by mood.
         
@@ -436,6 +543,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -455,26 +564,6 @@ class SearchClient(BaseClient):
         if not all(isinstance(m, str) for m in moods):
             raise TypeError("moods must be a list of strings")
             
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
         # Normalize moods to lowercase
         moods = [m.lower() for m in moods]
         
@@ -482,16 +571,16 @@ class SearchClient(BaseClient):
             "moods": moods
         }
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/audio/by-mood", params=params, json_data=data)
+        return self._search("audio/by-mood", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
     
     def search_audio_by_instrument(self, instruments: List[str], min_confidence: float = 0.5,
                                 media_source: str = "user", folder_path: str = None,
                                 page: int = 1, page_size: int = 20,
                                 generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                                generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                                generate_download: bool = False, org_id: str = None,
+                                prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for audio files by instruments.
         
@@ -506,6 +595,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -528,40 +619,20 @@ class SearchClient(BaseClient):
         if not isinstance(min_confidence, (int, float)) or not (0 <= min_confidence <= 1):
             raise ValueError("min_confidence must be a number between 0 and 1")
             
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
         data = {
             "instruments": instruments,
             "min_confidence": min_confidence
         }
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/audio/by-instrument", params=params, json_data=data)
+        return self._search("audio/by-instrument", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
     
     def search_audio_by_transcription(self, query: str, media_source: str = "user", 
                                     folder_path: str = None, page: int = 1, page_size: int = 20,
                                     generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                                    generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                                    generate_download: bool = False, org_id: str = None,
+                                    prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for audio files by transcription content.
         
@@ -575,6 +646,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -591,39 +664,19 @@ class SearchClient(BaseClient):
         if not isinstance(query, str):
             raise TypeError("query must be a string")
             
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
         data = {
             "query": query
         }
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/audio/by-transcription", params=params, json_data=data)
+        return self._search("audio/by-transcription", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
     
     def search_image_by_objects(self, objects: List[str], media_source: str = "user", 
                               folder_path: str = None, page: int = 1, page_size: int = 20,
                               generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                              generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                              generate_download: bool = False, org_id: str = None,
+                              prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for images by objects in them.
         
@@ -637,6 +690,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -656,40 +711,20 @@ class SearchClient(BaseClient):
         if not all(isinstance(obj, str) for obj in objects):
             raise TypeError("objects must be a list of strings")
             
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
         data = {
             "objects": objects
         }
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/image/by-objects", params=params, json_data=data)
+        return self._search("image/by-objects", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
     
     def search_image_by_color(self, color_moods: List[str] = None, dominant_hues: Dict[str, int] = None,
                            hex_color: str = None, media_source: str = "user", folder_path: str = None,
                            page: int = 1, page_size: int = 20,
                            generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                           generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                           generate_download: bool = False, org_id: str = None,
+                           prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for images by color characteristics.
         
@@ -705,6 +740,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -733,32 +770,7 @@ class SearchClient(BaseClient):
             color_moods = [color_moods]  # Convert single string to list
         
         if dominant_hues:
-            if not isinstance(dominant_hues, dict):
-                raise TypeError("dominant_hues must be a dictionary with 'min' and 'max' keys")
-            if "min" not in dominant_hues or "max" not in dominant_hues:
-                raise ValueError("dominant_hues must contain 'min' and 'max' keys")
-            if not (0 <= dominant_hues["min"] <= 360 and 0 <= dominant_hues["max"] <= 360):
-                raise ValueError("Hue values must be between 0 and 360")
-        
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
+            self._validate_hues(dominant_hues)
         
         data = {}
         if color_moods:
@@ -766,15 +778,15 @@ class SearchClient(BaseClient):
         if dominant_hues:
             data["dominant_hues"] = dominant_hues
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/image/by-color", params=params, json_data=data)
+        return self._search("image/by-color", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
     
     def search_image_by_text(self, query: str, media_source: str = "user", 
                           folder_path: str = None, page: int = 1, page_size: int = 20,
                           generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                          generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                          generate_download: bool = False, org_id: str = None,
+                          prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for images by text content (OCR).
         
@@ -788,6 +800,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -804,40 +818,20 @@ class SearchClient(BaseClient):
         if not isinstance(query, str):
             raise TypeError("query must be a string")
             
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
         data = {
             "query": query
         }
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/image/by-text", params=params, json_data=data)
+        return self._search("image/by-text", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
     
     def search_by_tags(self, tags: List[str], match_all: bool = False, 
                      media_types: List[str] = None, media_source: str = "user", 
                      folder_path: str = None, page: int = 1, page_size: int = 20,
                      generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                     generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                     generate_download: bool = False, org_id: str = None,
+                     prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for files by tags across all media types.
         
@@ -853,6 +847,8 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -873,51 +869,71 @@ class SearchClient(BaseClient):
         if not all(isinstance(tag, str) for tag in tags):
             raise TypeError("tags must be a list of strings")
             
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-        
-        if not media_types:
-            media_types = ['video', 'audio', 'image']
-        
-        # Validate media types
-        valid_types = ['video', 'audio', 'image']
-        invalid_types = [mt for mt in media_types if mt not in valid_types]
-        if invalid_types:
-            raise ValueError(f"Invalid media types: {invalid_types}. Valid types are: {', '.join(valid_types)}")
+        media_types = self._validate_media_types(media_types)
             
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
         data = {
             "tags": tags,
             "match_all": match_all,
             "media_types": media_types
         }
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
+        return self._search("by-tags", data, media_source, folder_path, page, page_size,
+                            generate_thumbnail, generate_streamable, generate_download,
+                            org_id, prefetch_next, cache_ttl, kwargs)
+    
+    def _search_by_tags(self, kind: str, tags: List[str], match_all: bool, media_source: str,
+                        folder_path: Optional[str], page: int, page_size: int, generate_thumbnail: bool,
+                        generate_streamable: bool, generate_download: bool, org_id: Optional[str],
+                        cursor: Optional[str], limit: Optional[int], skip_total: bool, dedup: bool,
+                        dedup_key: Optional[Callable[[Dict], Any]], prefetch_next: bool, cache_ttl: float,
+                        extra_params: Dict) -> Dict:
+        """Search one media type ("video", "audio" or "image") by tags; shared by the search_*_by_tags methods."""
+        if kind not in _VALID_MEDIA_TYPES:
+            raise ValueError(f"Invalid media type: {kind}. Valid types are: {', '.join(_DEFAULT_MEDIA_TYPES)}")
+        
+        if not tags:
+            raise ValueError("tags list cannot be empty")
+            
+        if not isinstance(tags, list):
+            tags = [tags]  # Convert single string to list
+            
+        if not all(isinstance(tag, str) for tag in tags):
+            raise TypeError("tags must be a list of strings")
+            
+        data = {
+            "tags": tags,
+            "match_all": match_all
+        }
         
-        return self._make_request("POST", f"{self.search_url}/files/by-tags", params=params, json_data=data)
+        if cursor:
+            extra_params = dict(extra_params, starting_after=cursor, limit=limit or page_size)
+        if skip_total:
+            extra_params = dict(extra_params, skip_total=_BOOL_STR[True])
+        
+        if dedup_key is not None and not callable(dedup_key):
+            raise TypeError("dedup_key must be a callable taking a result dictionary")
+        
+        result = self._search(f"{kind}/by-tags", data, media_source, folder_path, page, page_size,
+                              generate_thumbnail, generate_streamable, generate_download,
+                              org_id, prefetch_next, cache_ttl, extra_params)
+        if not dedup and dedup_key is None:
+            return result
+        key = dedup_key or _tag_signature
+        return self._map_result(result, lambda response: _dedup_results(response, key))
+    
+    @staticmethod
+    def _map_result(result: Dict, transform: Callable[[Dict], Dict]) -> Dict:
+        """Apply a post-processing step to a _search result (AsyncSearchClient awaits it first)."""
+        return transform(result)
     
     def search_video_by_tags(self, tags: List[str], match_all: bool = False, 
                            media_source: str = "user", folder_path: str = None,
                            page: int = 1, page_size: int = 20,
                            generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                           generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                           generate_download: bool = False, org_id: str = None,
+                           cursor: str = None, limit: int = None, skip_total: bool = False,
+                           dedup: bool = False, dedup_key: Callable[[Dict], Any] = None,
+                           prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for videos by tags.
         
@@ -932,60 +948,40 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            cursor: Opaque cursor from a previous response's "next_cursor"; when given, results continue
+                    after it (keyset pagination) and page is ignored
+            limit: Number of results to return with cursor pagination (defaults to page_size)
+            skip_total: Ask the API not to count all matches (faster; pagination then has no total_results).
+                        Recommended for infinite scrolling and cursor pagination
+            dedup: Collapse near-duplicate results (same sorted tags and title), keeping the highest
+                   score. This shortens "results" but not the reported totals, so raise page_size
+                   if you need a full page of distinct items
+            dedup_key: Function returning the signature to dedup on instead (implies dedup=True)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
-            Dictionary with search results and pagination info
+            Dictionary with search results and pagination info. When the API supports keyset
+            pagination, it also includes "next_cursor" and "has_more"
             
         Tips:
             - Common video tags include: "interview", "presentation", "drone", "aerial"
             - Tags are generated automatically based on video content and metadata
             - For more specific searches, use match_all=True to require all tags match
         """
-        if not tags:
-            raise ValueError("tags list cannot be empty")
-            
-        if not isinstance(tags, list):
-            tags = [tags]  # Convert single string to list
-            
-        if not all(isinstance(tag, str) for tag in tags):
-            raise TypeError("tags must be a list of strings")
-            
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
-        data = {
-            "tags": tags,
-            "match_all": match_all
-        }
-        
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/video/by-tags", params=params, json_data=data)
+        return self._search_by_tags("video", tags, match_all, media_source, folder_path, page, page_size,
+                                    generate_thumbnail, generate_streamable, generate_download, org_id,
+                                    cursor, limit, skip_total, dedup, dedup_key, prefetch_next, cache_ttl, kwargs)
     
     def search_audio_by_tags(self, tags: List[str], match_all: bool = False, 
                            media_source: str = "user", folder_path: str = None,
                            page: int = 1, page_size: int = 20,
                            generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                           generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                           generate_download: bool = False, org_id: str = None,
+                           cursor: str = None, limit: int = None, skip_total: bool = False,
+                           dedup: bool = False, dedup_key: Callable[[Dict], Any] = None,
+                           prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for audio files by tags.
         
@@ -1000,60 +996,40 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            cursor: Opaque cursor from a previous response's "next_cursor"; when given, results continue
+                    after it (keyset pagination) and page is ignored
+            limit: Number of results to return with cursor pagination (defaults to page_size)
+            skip_total: Ask the API not to count all matches (faster; pagination then has no total_results).
+                        Recommended for infinite scrolling and cursor pagination
+            dedup: Collapse near-duplicate results (same sorted tags and title), keeping the highest
+                   score. This shortens "results" but not the reported totals, so raise page_size
+                   if you need a full page of distinct items
+            dedup_key: Function returning the signature to dedup on instead (implies dedup=True)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
-            Dictionary with search results and pagination info
+            Dictionary with search results and pagination info. When the API supports keyset
+            pagination, it also includes "next_cursor" and "has_more"
             
         Tips:
             - Common audio tags include: "podcast", "music", "interview", "speech"
             - Audio tags are typically related to content type and audio characteristics
             - For spoken word content, use search_audio_by_transcription for text searches
         """
-        if not tags:
-            raise ValueError("tags list cannot be empty")
-            
-        if not isinstance(tags, list):
-            tags = [tags]  # Convert single string to list
-            
-        if not all(isinstance(tag, str) for tag in tags):
-            raise TypeError("tags must be a list of strings")
-            
-        org_id = org_id or self.default_org_id
-        
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
-            
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
-        
-        if media_source == "user":
-            params["org_id"] = org_id
-        
-        if folder_path:
-            params["folder_path"] = folder_path
-        
-        data = {
-            "tags": tags,
-            "match_all": match_all
-        }
-        
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
-        
-        return self._make_request("POST", f"{self.search_url}/files/audio/by-tags", params=params, json_data=data)
+        return self._search_by_tags("audio", tags, match_all, media_source, folder_path, page, page_size,
+                                    generate_thumbnail, generate_streamable, generate_download, org_id,
+                                    cursor, limit, skip_total, dedup, dedup_key, prefetch_next, cache_ttl, kwargs)
     
     def search_image_by_tags(self, tags: List[str], match_all: bool = False, 
                            media_source: str = "user", folder_path: str = None,
                            page: int = 1, page_size: int = 20,
                            generate_thumbnail: bool = True, generate_streamable: bool = False, 
-                           generate_download: bool = False, org_id: str = None, **kwargs) -> Dict:
+                           generate_download: bool = False, org_id: str = None,
+                           cursor: str = None, limit: int = None, skip_total: bool = False,
+                           dedup: bool = False, dedup_key: Callable[[Dict], Any] = None,
+                           prefetch_next: bool = False, cache_ttl: float = 0, **kwargs) -> Dict:
         """
         Search for images by tags.
         
@@ -1068,54 +1044,148 @@ class SearchClient(BaseClient):
             generate_streamable: Whether to generate streamable URLs
             generate_download: Whether to generate download URLs
             org_id: Organization ID (uses default if not provided)
+            cursor: Opaque cursor from a previous response's "next_cursor"; when given, results continue
+                    after it (keyset pagination) and page is ignored
+            limit: Number of results to return with cursor pagination (defaults to page_size)
+            skip_total: Ask the API not to count all matches (faster; pagination then has no total_results).
+                        Recommended for infinite scrolling and cursor pagination
+            dedup: Collapse near-duplicate results (same sorted tags and title), keeping the highest
+                   score. This shortens "results" but not the reported totals, so raise page_size
+                   if you need a full page of distinct items
+            dedup_key: Function returning the signature to dedup on instead (implies dedup=True)
+            prefetch_next: Request the next page in the background so a following call for it returns immediately
+            cache_ttl: Seconds to reuse an identical earlier response from the in-process cache (0 disables caching)
             **kwargs: Additional parameters to pass to the API
             
         Returns:
-            Dictionary with search results and pagination info
+            Dictionary with search results and pagination info. When the API supports keyset
+            pagination, it also includes "next_cursor" and "has_more"
             
         Tips:
             - Common image tags include: "portrait", "landscape", "product", "nature"
             - Image tags are automatically generated based on image content
             - For object-specific searches, use search_image_by_objects instead
         """
-        if not tags:
-            raise ValueError("tags list cannot be empty")
-            
-        if not isinstance(tags, list):
-            tags = [tags]  # Convert single string to list
-            
-        if not all(isinstance(tag, str) for tag in tags):
-            raise TypeError("tags must be a list of strings")
-            
-        org_id = org_id or self.default_org_id
+        return self._search_by_tags("image", tags, match_all, media_source, folder_path, page, page_size,
+                                    generate_thumbnail, generate_streamable, generate_download, org_id,
+                                    cursor, limit, skip_total, dedup, dedup_key, prefetch_next, cache_ttl, kwargs)
         
-        # Validate parameters
-        self._validate_common_params(media_source, org_id, page, page_size)
+    def search_all_by_tags(self, tags: List[str], media_types: List[str] = None, **kwargs) -> Dict[str, Dict]:
+        """
+        Run the per-media-type tag searches concurrently.
+        
+        Args:
+            tags: List of tags to search for
+            media_types: Media types to search ['video', 'audio', 'image'] (defaults to all)
+            **kwargs: Arguments shared by search_video_by_tags, search_audio_by_tags and search_image_by_tags
             
-        params = {
-            "media_source": media_source,
-            "page": page,
-            "page_size": page_size,
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
-        }
+        Returns:
+            Dictionary mapping each media type to its search results
+            
+        Tips:
+            - Unlike search_by_tags, each media type gets its own result page and pagination info
+        """
+        media_types = self._validate_media_types(media_types)
+        with ThreadPoolExecutor(max_workers=len(media_types)) as executor:
+            futures = {
+                media_type: executor.submit(getattr(self, f"search_{media_type}_by_tags"), tags, **kwargs)
+                for media_type in media_types
+            }
+            return {media_type: future.result() for media_type, future in futures.items()}
+    
+    def iter_results(self, method: str, page: int = 1, **kwargs) -> Iterator[Dict]:
+        """
+        Iterate over every result of a search, fetching further pages as needed.
         
-        if media_source == "user":
-            params["org_id"] = org_id
+        While the results of one page are being consumed, the next page is already being
+        requested in the background (see the prefetch_next parameter of the search methods).
+        For the tag searches, a "next_cursor" in the response is followed instead of the
+        page number.
         
-        if folder_path:
-            params["folder_path"] = folder_path
+        Args:
+            method: Name of the search method to page through (e.g. "search_video_scenes")
+            page: Page to start from
+            **kwargs: Arguments for the search method, except page and prefetch_next
+            
+        Yields:
+            Individual result dictionaries, in the order the API returns them
+            
+        Example:
+            >>> for scene in client.iter_results("search_video_scenes", query="sunset", page_size=50):
+            ...     print(scene["file_id"])
+        """
+        if method not in _BATCH_SEARCH_METHODS:
+            raise ValueError(f"Unsupported search method: {method}. Valid methods are: {', '.join(sorted(_BATCH_SEARCH_METHODS))}")
+        search = getattr(self, method)
+        page_size = kwargs.get("page_size", 20)
+        cursor = None
+        
+        while True:
+            if cursor:
+                result = search(cursor=cursor, **kwargs)
+            else:
+                result = search(page=page, prefetch_next=True, **kwargs)
+            yield from result.get("results") or []
+            
+            if method in _CURSOR_SEARCH_METHODS and _is_cursor_page(result):
+                cursor = _next_cursor(result)
+                if not cursor:
+                    return
+                continue
+            if not _has_next_page(result, page, page_size):
+                return
+            page += 1
+    
+    def iter_tag_search(self, kind: str, tags: List[str], **kwargs) -> Iterator[Dict]:
+        """
+        Iterate over every tag-search result for one media type, one page in memory at a time.
         
-        data = {
-            "tags": tags,
-            "match_all": match_all
-        }
+        Follows the cursor returned by search_video/audio/image_by_tags and sends
+        skip_total=True unless told otherwise, so the API doesn't count the full result set.
+        On AsyncSearchClient this returns an async iterator.
         
-        # Add any additional parameters
-        params.update({k: v for k, v in kwargs.items() if v is not None})
+        Args:
+            kind: Media type to search ("video", "audio" or "image")
+            tags: List of tags to search for
+            **kwargs: Arguments for search_<kind>_by_tags, except page, cursor and prefetch_next
+            
+        Yields:
+            Individual result dictionaries, in the order the API returns them
+            
+        Example:
+            >>> for clip in client.iter_tag_search("video", ["drone", "beach"], page_size=100):
+            ...     print(clip["file_id"])
+        """
+        if kind not in _VALID_MEDIA_TYPES:
+            raise ValueError(f"Invalid media type: {kind}. Valid types are: {', '.join(_DEFAULT_MEDIA_TYPES)}")
+        kwargs.setdefault("skip_total", True)
+        return self.iter_results(f"search_{kind}_by_tags", tags=tags, **kwargs)
+    
+    def search_batch(self, searches: List[Dict], max_workers: int = 8) -> List[Dict]:
+        """
+        Run several searches concurrently over the shared connection pool.
         
-        return self._make_request("POST", f"{self.search_url}/files/image/by-tags", params=params, json_data=data)
+        Args:
+            searches: List of search specifications. Each is a dictionary with a "method" key naming
+                      a search method (e.g. "search_audio_by_genre") plus that method's keyword arguments
+            max_workers: Maximum number of searches in flight at once
+            
+        Returns:
+            List of search results in the same order as `searches`.
+            A search that failed is represented by a dictionary with an "error" key.
+            
+        Example:
+            >>> rock, jazz = client.search_batch([
+            ...     {"method": "search_audio_by_genre", "genres": ["rock"]},
+            ...     {"method": "search_audio_by_genre", "genres": ["jazz"]}
+            ... ])
+        """
+        if not isinstance(searches, list):
+            raise TypeError("searches must be a list of dictionaries")
+        calls = [_split_batch_spec(spec) for spec in searches]
+        if not calls:
+            return []
+        return self._fan_out(lambda call: getattr(self, call[0])(**call[1]), calls, max_workers)
         
     # Advanced workflow methods
     
@@ -1147,7 +1217,7 @@ class SearchClient(BaseClient):
             raise ValueError("Organization ID is required for user media. Either provide org_id parameter or set a default_org_id when initializing the client.")
         
         if not media_types:
-            media_types = ['video', 'audio', 'image']
+            media_types = _DEFAULT_MEDIA_TYPES
             
         # First, get content details to extract tags, summary, etc.
         # This would require a method to get content details by ID
@@ -1210,3 +1280,17 @@ class SearchClient(BaseClient):
             generate_thumbnail=True,
             org_id=org_id
         )
+
+
+def _make_result_iterator(method: str):
+    """Create an iter_<method> shortcut for SearchClient.iter_results."""
+    def iterate(self, **kwargs):
+        return self.iter_results(method, **kwargs)
+    iterate.__name__ = f"iter_{method}"
+    iterate.__qualname__ = f"SearchClient.iter_{method}"
+    iterate.__doc__ = f"Iterate over every result of {method}; shorthand for iter_results(\"{method}\", ...)."
+    return iterate
+
+for _method in _BATCH_SEARCH_METHODS:
+    setattr(SearchClient, f"iter_{_method}", _make_result_iterator(_method))
+del _method
@@ -1,10 +1,25 @@
-import os
-import json
-import requests
+import array
+import copy
+import time
+import threading
 import warnings
+from collections import OrderedDict
 from typing import Dict, List, Optional, Union, Any, Tuple
 from datetime import datetime
-from .base_client import BaseClient
+from .base_client import BaseClient, _BOOL_STR, _edit_supersedes
+
+# Valid targets of the manual edit endpoints
+_ARRAY_TYPES = frozenset(("clips", "audios"))
+_ITEM_TYPES = frozenset(("clips", "audios", "voiceover"))
+_ARRAY_TYPES_MSG = "array_type must be either 'clips' or 'audios'"
+_ITEM_TYPES_MSG = "item_type must be one of: 'clips', 'audios', 'voiceover'"
+
+# Valid generation settings for create_sequence and update_sequence_settings
+_GRADE_TYPES = frozenset(("single", "multi"))
+_ORIENTATIONS = frozenset(("landscape", "portrait", "square"))
+
+# Upper bound on cached read responses per client
+_SEQUENCE_CACHE_MAX_ENTRIES = 128
 
 class SequenceClient(BaseClient):
     """
@@ -18,7 +33,8 @@ class SequenceClient(BaseClient):
     - Alternate between precise manual edits and AI-guided creative changes
     """
     
-    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None):
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None, sequence_cache_ttl: float = 0,
+                 transport: str = "requests", compression_threshold: Optional[int] = None):
         """
         Initialize the SequenceClient.
         
@@ -27,12 +43,98 @@ class SequenceClient(BaseClient):
             api_secret: Your Storylinez API Secret
             base_url: Base URL for the API (defaults to production)
             default_org_id: Default organization ID to use for all API calls (optional)
+            sequence_cache_ttl: Seconds to reuse identical get_sequence, get_sequence_history and
+                                get_sequence_media responses (0 disables caching)
+            transport: "requests" (default) or "httpx" to multiplex requests over a shared HTTP/2 connection
+                       (requires the 'async' extra)
+            compression_threshold: Gzip JSON request bodies larger than this many bytes, e.g. 1024 for
+                                   update_sequence_settings calls carrying a full edited_sequence
+                                   (None, the default, sends bodies uncompressed)
         """
-        super().__init__(api_key, api_secret, base_url, default_org_id)
+        super().__init__(api_key, api_secret, base_url, default_org_id, transport)
+        self.compression_threshold = compression_threshold
         self.sequence_url = f"{self.base_url}/sequence"
+        self._sequence_cache_ttl = sequence_cache_ttl
+        self._sequence_cache = OrderedDict()  # request key -> (expires_at, response)
+        self._sequence_etags = OrderedDict()  # request key -> {"etag": ..., "body": ...}
+        self._sequence_cache_lock = threading.Lock()
+    
+    # Response caching
+    
+    def _cached_get(self, url: str, params: Dict) -> Dict:
+        """
+        GET a read-only endpoint, reusing a recent identical response when caching is enabled.
+        
+        Concurrent identical requests share one HTTP call either way, and a repeated request
+        sends the ETag of the previous response so an unchanged sequence isn't downloaded again.
+        """
+        cache_key = self._request_key("GET", url, params)
+        if self._sequence_cache_ttl > 0:
+            with self._sequence_cache_lock:
+                entry = self._sequence_cache.get(cache_key)
+                if entry is not None and entry[0] > time.monotonic():
+                    return copy.deepcopy(entry[1])
+        
+        def fetch() -> Dict:
+            with self._sequence_cache_lock:
+                validator = self._sequence_etags.pop(cache_key, None)
+                if validator is None:
+                    validator = {}
+                self._sequence_etags[cache_key] = validator
+                while len(self._sequence_etags) > _SEQUENCE_CACHE_MAX_ENTRIES:
+                    self._sequence_etags.popitem(last=False)
+            result = self._make_request("GET", url, params=params, validator=validator)
+            if self._sequence_cache_ttl > 0:
+                with self._sequence_cache_lock:
+                    self._sequence_cache.pop(cache_key, None)
+                    self._sequence_cache[cache_key] = (time.monotonic() + self._sequence_cache_ttl, copy.deepcopy(result))
+                    while len(self._sequence_cache) > _SEQUENCE_CACHE_MAX_ENTRIES:
+                        self._sequence_cache.popitem(last=False)
+            return result
+        
+        return self._single_flight(cache_key, fetch)
+    
+    def _send_change(self, method: str, url: str, data: Dict) -> Dict:
+        """Send a request that modifies a sequence, then drop cached reads that may now be stale."""
+        try:
+            return self._make_request(method, url, json_data=data)
+        finally:
+            self.invalidate_sequence_cache()
+    
+    def invalidate_sequence_cache(self) -> None:
+        """
+        Drop all cached sequence responses.
+        
+        Called automatically by the methods that create, regenerate or edit sequences. Stored
+        ETags are kept: the server only answers 304 for them while the sequence is unchanged.
+        """
+        with self._sequence_cache_lock:
+            self._sequence_cache.clear()
     
     # Sequence Creation and Retrieval
     
+    @staticmethod
+    def _validate_generation_params(grade_type: Optional[str], orientation: Optional[str],
+                                    temperature: Optional[float], iterations: Optional[int]) -> None:
+        """Check generation settings locally so invalid values fail before any request is sent (None skips a check)."""
+        if grade_type is not None and grade_type not in _GRADE_TYPES:
+            raise ValueError("grade_type must be either 'single' or 'multi'")
+        
+        if orientation is not None and orientation not in _ORIENTATIONS:
+            raise ValueError("orientation must be one of: 'landscape', 'portrait', 'square'")
+        
+        if temperature is not None:
+            if isinstance(temperature, bool) or not isinstance(temperature, (int, float)):
+                raise TypeError("temperature must be a number")
+            if not (0.0 <= temperature <= 1.0):
+                raise ValueError("temperature must be between 0.0 and 1.0")
+        
+        if iterations is not None:
+            if isinstance(iterations, bool) or not isinstance(iterations, int):
+                raise TypeError("iterations must be an integer")
+            if iterations < 1:
+                raise ValueError("iterations must be at least 1")
+    
     def create_sequence(
         self, 
         project_id: str, 
@@ -74,21 +176,7 @@ class SequenceClient(BaseClient):
         if not project_id:
             raise ValueError("project_id is required")
         
-        # Validate grade_type
-        if grade_type not in ["single", "multi"]:
-            raise ValueError("grade_type must be either 'single' or 'multi'")
-        
-        # Validate orientation if provided
-        if orientation and orientation not in ["landscape", "portrait", "square"]:
-            raise ValueError("orientation must be one of: 'landscape', 'portrait', 'square'")
-        
-        # Validate temperature range
-        if not (0.0 <= temperature <= 1.0):
-            raise ValueError("temperature must be between 0.0 and 1.0")
-        
-        # Validate iterations
-        if iterations < 1:
-            raise ValueError("iterations must be at least 1")
+        self._validate_generation_params(grade_type, orientation or None, temperature, iterations)
         
         # Display helpful tips based on settings
         if deepthink and temperature < 0.5:
@@ -116,7 +204,7 @@ class SequenceClient(BaseClient):
         # Add any additional kwargs for backward compatibility
         data.update(kwargs)
         
-        return self._make_request("POST", f"{self.sequence_url}/create", json_data=data)
+        return self._send_change("POST", f"{self.sequence_url}/create", data)
     
     def get_sequence(
         self, 
@@ -145,8 +233,8 @@ class SequenceClient(BaseClient):
             raise ValueError("Either sequence_id or project_id must be provided")
             
         params = {
-            "include_results": str(include_results).lower(),
-            "include_storyboard": str(include_storyboard).lower()
+            "include_results": _BOOL_STR[bool(include_results)],
+            "include_storyboard": _BOOL_STR[bool(include_storyboard)]
         }
         
         if sequence_id:
@@ -157,7 +245,7 @@ class SequenceClient(BaseClient):
         # Add any additional kwargs for backward compatibility
         params.update(kwargs)
             
-        return self._make_request("GET", f"{self.sequence_url}/get", params=params)
+        return self._cached_get(f"{self.sequence_url}/get", params)
     
     def redo_sequence(
         self, 
@@ -210,7 +298,7 @@ class SequenceClient(BaseClient):
         # Add any additional kwargs for backward compatibility
         data.update(kwargs)
             
-        return self._make_request("POST", f"{self.sequence_url}/redo", json_data=data)
+        return self._send_change("POST", f"{self.sequence_url}/redo", data)
     
     def update_sequence(
         self, 
@@ -252,7 +340,7 @@ class SequenceClient(BaseClient):
         # Add any additional kwargs for backward compatibility
         data.update(kwargs)
             
-        return self._make_request("PUT", f"{self.sequence_url}/selfupdate", json_data=data)
+        return self._send_change("PUT", f"{self.sequence_url}/selfupdate", data)
     
     def update_sequence_settings(
         self,
@@ -304,57 +392,38 @@ class SequenceClient(BaseClient):
             raise ValueError("Either sequence_id or project_id must be provided")
         
         # Validate parameters if provided
-        if grade_type is not None and grade_type not in ["single", "multi"]:
-            raise ValueError("grade_type must be either 'single' or 'multi'")
-        
-        if orientation is not None and orientation not in ["landscape", "portrait", "square"]:
-            raise ValueError("orientation must be one of: 'landscape', 'portrait', 'square'")
+        self._validate_generation_params(grade_type, orientation, temperature, iterations)
+            
+        updates = {key: value for key, value in (
+            ("apply_template", apply_template),
+            ("apply_grade", apply_grade),
+            ("grade_type", grade_type),
+            ("orientation", orientation),
+            ("deepthink", deepthink),
+            ("overdrive", overdrive),
+            ("web_search", web_search),
+            ("eco", eco),
+            ("temperature", None if temperature is None else float(temperature)),
+            ("iterations", None if iterations is None else int(iterations)),
+            ("regenerate_prompt", regenerate_prompt),
+            ("edited_sequence", edited_sequence)
+        ) if value is not None}
         
-        if temperature is not None and not (0.0 <= temperature <= 1.0):
-            raise ValueError("temperature must be between 0.0 and 1.0")
+        # Check if any settings are being updated
+        if not updates:
+            raise ValueError("At least one setting must be provided to update")
         
-        if iterations is not None and iterations < 1:
-            raise ValueError("iterations must be at least 1")
-            
         data = {}
-        
         if sequence_id:
             data["sequence_id"] = sequence_id
         if project_id:
             data["project_id"] = project_id
-        if apply_template is not None:
-            data["apply_template"] = apply_template
-        if apply_grade is not None:
-            data["apply_grade"] = apply_grade
-        if grade_type is not None:
-            data["grade_type"] = grade_type
-        if orientation is not None:
-            data["orientation"] = orientation
-        if deepthink is not None:
-            data["deepthink"] = deepthink
-        if overdrive is not None:
-            data["overdrive"] = overdrive
-        if web_search is not None:
-            data["web_search"] = web_search
-        if eco is not None:
-            data["eco"] = eco
-        if temperature is not None:
-            data["temperature"] = float(temperature)
-        if iterations is not None:
-            data["iterations"] = int(iterations)
-        if regenerate_prompt is not None:
-            data["regenerate_prompt"] = regenerate_prompt
-        if edited_sequence is not None:
-            data["edited_sequence"] = edited_sequence
-        
-        # Check if any settings are being updated
-        if len(data) <= 1:  # Just the ID
-            raise ValueError("At least one setting must be provided to update")
+        data.update(updates)
             
         # Add any additional kwargs for backward compatibility
         data.update(kwargs)
             
-        return self._make_request("PUT", f"{self.sequence_url}/update", json_data=data)
+        return self._send_change("PUT", f"{self.sequence_url}/update", data)
     
     def get_sequence_history(
         self,
@@ -363,6 +432,7 @@ class SequenceClient(BaseClient):
         limit: int = 10,
         history_type: str = None, 
         include_current: bool = False,
+        skip_total: bool = False,
         **kwargs
     ) -> Dict:
         """
@@ -374,6 +444,8 @@ class SequenceClient(BaseClient):
             limit: Number of items per page
             history_type: Filter by history type ("update", "generation", "prompt", "media_change", or "selfupdate")
             include_current: Whether to include the current state
+            skip_total: Ask the API not to count all history entries (faster for page > 1 or
+                        when only the entries themselves are needed)
             
         Returns:
             Dictionary with history entries
@@ -411,16 +483,18 @@ class SequenceClient(BaseClient):
             "sequence_id": sequence_id,
             "page": page,
             "limit": limit,
-            "include_current": str(include_current).lower()
+            "include_current": _BOOL_STR[bool(include_current)]
         }
         
         if history_type:
             params["history_type"] = history_type
+        if skip_total:
+            params["skip_total"] = _BOOL_STR[True]
             
         # Add any additional kwargs for backward compatibility
         params.update(kwargs)
             
-        return self._make_request("GET", f"{self.sequence_url}/history", params=params)
+        return self._cached_get(f"{self.sequence_url}/history", params)
     
     def get_sequence_media(
         self,
@@ -457,10 +531,10 @@ class SequenceClient(BaseClient):
             raise ValueError("Either sequence_id or project_id must be provided")
             
         params = {
-            "include_analysis": str(include_analysis).lower(),
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
+            "include_analysis": _BOOL_STR[bool(include_analysis)],
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)]
         }
         
         if sequence_id:
@@ -471,10 +545,108 @@ class SequenceClient(BaseClient):
         # Add any additional kwargs for backward compatibility
         params.update(kwargs)
             
-        return self._make_request("GET", f"{self.sequence_url}/media_involved", params=params)
+        return self._cached_get(f"{self.sequence_url}/media_involved", params)
     
     # Sequence Editing Operations
     
+    @staticmethod
+    def _reorder_payload(sequence_id: str, array_type: str, new_order: List[int], **kwargs) -> Dict:
+        """Validate a reorder operation and build its request body"""
+        if not sequence_id:
+            raise ValueError("sequence_id is required")
+            
+        if array_type not in _ARRAY_TYPES:
+            raise ValueError(_ARRAY_TYPES_MSG)
+            
+        if not isinstance(new_order, list):
+            raise ValueError("new_order must be a list of integers")
+        try:
+            array.array("q", new_order)  # Type-checks every element in C
+        except (TypeError, OverflowError):
+            raise ValueError("new_order must be a list of integers")
+            
+        data = {
+            "sequence_id": sequence_id,
+            "array_type": array_type,
+            "new_order": new_order
+        }
+        
+        # Add any additional kwargs for backward compatibility
+        data.update(kwargs)
+        return data
+    
+    @staticmethod
+    def _edit_item_payload(sequence_id: str, item_type: str, item_index: int = None, updated_item: Dict = None,
+                           file_id: str = None, stock_id: str = None, **kwargs) -> Dict:
+        """Validate an item edit and build its request body"""
+        if not sequence_id:
+            raise ValueError("sequence_id is required")
+            
+        if item_type not in _ITEM_TYPES:
+            raise ValueError(_ITEM_TYPES_MSG)
+            
+        if item_type != 'voiceover' and item_index is None:
+            raise ValueError(f"item_index is required for item_type '{item_type}'")
+            
+        if not updated_item and not (file_id or stock_id):
+            raise ValueError("Either updated_item, file_id, or stock_id must be provided")
+            
+        data = {
+            "sequence_id": sequence_id,
+            "item_type": item_type
+        }
+        
+        if item_index is not None:
+            data["item_index"] = item_index
+            
+        if updated_item:
+            data["updated_item"] = updated_item
+            
+        if file_id:
+            data["file_id"] = file_id
+            
+        if stock_id:
+            data["stock_id"] = stock_id
+        
+        # Add any additional kwargs for backward compatibility
+        data.update(kwargs)
+        return data
+    
+    @staticmethod
+    def _change_media_payload(sequence_id: str, item_type: str, item_index: int = None, file_id: str = None,
+                              stock_id: str = None, path: str = None, **kwargs) -> Dict:
+        """Validate a media change and build its request body"""
+        if not sequence_id:
+            raise ValueError("sequence_id is required")
+            
+        if item_type not in _ITEM_TYPES:
+            raise ValueError(_ITEM_TYPES_MSG)
+            
+        if item_type != 'voiceover' and item_index is None:
+            raise ValueError(f"item_index is required for item_type '{item_type}'")
+            
+        if not any([file_id, stock_id, path]):
+            raise ValueError("One of file_id, stock_id, or path must be provided")
+            
+        data = {
+            "sequence_id": sequence_id,
+            "item_type": item_type
+        }
+        
+        if item_index is not None:
+            data["item_index"] = item_index
+            
+        if file_id:
+            data["file_id"] = file_id
+        elif stock_id:
+            data["stock_id"] = stock_id
+        elif path:
+            data["path"] = path
+        
+        # Add any additional kwargs for backward compatibility
+        data.update(kwargs)
+        return data
+    
     def reorder_sequence_items(
         self,
         sequence_id: str, 
@@ -500,25 +672,8 @@ class SequenceClient(BaseClient):
             # Swap first and second clips
             reorder_sequence_items(sequence_id="seq_123", array_type="clips", new_order=[1, 0, 2, 3])
         """
-        if not sequence_id:
-            raise ValueError("sequence_id is required")
-            
-        if array_type not in ['clips', 'audios']:
-            raise ValueError("array_type must be either 'clips' or 'audios'")
-            
-        if not isinstance(new_order, list) or not all(isinstance(i, int) for i in new_order):
-            raise ValueError("new_order must be a list of integers")
-            
-        data = {
-            "sequence_id": sequence_id,
-            "array_type": array_type,
-            "new_order": new_order
-        }
-        
-        # Add any additional kwargs for backward compatibility
-        data.update(kwargs)
-        
-        return self._make_request("PUT", f"{self.sequence_url}/reorder", json_data=data)
+        data = self._reorder_payload(sequence_id, array_type, new_order, **kwargs)
+        return self._send_change("PUT", f"{self.sequence_url}/reorder", data)
     
     def edit_sequence_item(
         self,
@@ -547,39 +702,8 @@ class SequenceClient(BaseClient):
         Raises:
             ValueError: If parameters are invalid or missing
         """
-        if not sequence_id:
-            raise ValueError("sequence_id is required")
-            
-        if item_type not in ['clips', 'audios', 'voiceover']:
-            raise ValueError("item_type must be one of: 'clips', 'audios', 'voiceover'")
-            
-        if item_type != 'voiceover' and item_index is None:
-            raise ValueError(f"item_index is required for item_type '{item_type}'")
-            
-        if not updated_item and not (file_id or stock_id):
-            raise ValueError("Either updated_item, file_id, or stock_id must be provided")
-            
-        data = {
-            "sequence_id": sequence_id,
-            "item_type": item_type
-        }
-        
-        if item_index is not None:
-            data["item_index"] = item_index
-            
-        if updated_item:
-            data["updated_item"] = updated_item
-            
-        if file_id:
-            data["file_id"] = file_id
-            
-        if stock_id:
-            data["stock_id"] = stock_id
-        
-        # Add any additional kwargs for backward compatibility
-        data.update(kwargs)
-            
-        return self._make_request("PUT", f"{self.sequence_url}/edit/item", json_data=data)
+        data = self._edit_item_payload(sequence_id, item_type, item_index, updated_item, file_id, stock_id, **kwargs)
+        return self._send_change("PUT", f"{self.sequence_url}/edit/item", data)
     
     def change_sequence_media(
         self,
@@ -612,37 +736,75 @@ class SequenceClient(BaseClient):
             Use this method for simple media replacement. For more complex changes,
             use edit_sequence_item() instead.
         """
-        if not sequence_id:
-            raise ValueError("sequence_id is required")
-            
-        if item_type not in ['clips', 'audios', 'voiceover']:
-            raise ValueError("item_type must be one of: 'clips', 'audios', 'voiceover'")
+        data = self._change_media_payload(sequence_id, item_type, item_index, file_id, stock_id, path, **kwargs)
+        return self._send_change("PUT", f"{self.sequence_url}/change_media", data)
+        
+    def apply_sequence_edits(self, sequence_id: str, edits: List[Dict]) -> List[Dict]:
+        """
+        Apply several manual edits to a sequence in one call.
+        
+        Every edit is validated before anything is sent, so a malformed edit late in the
+        list doesn't leave the sequence half-modified. The edits are then applied in order
+        over the shared connection.
+        
+        Args:
+            sequence_id: ID of the sequence to modify
+            edits: List of edits. Each is a dictionary with an "op" key ("reorder", "edit" or
+                   "change_media") plus the arguments of reorder_sequence_items,
+                   edit_sequence_item or change_sequence_media respectively (without sequence_id)
             
-        if item_type != 'voiceover' and item_index is None:
-            raise ValueError(f"item_index is required for item_type '{item_type}'")
+        Returns:
+            List with the response of each edit, in order
             
-        if not any([file_id, stock_id, path]):
-            raise ValueError("One of file_id, stock_id, or path must be provided")
+        Raises:
+            ValueError: If any edit is invalid (nothing is sent in that case)
+            Exception: If an edit fails; edits before it have already been applied
             
-        data = {
-            "sequence_id": sequence_id,
-            "item_type": item_type
-        }
+        Example:
+            apply_sequence_edits("seq_123", [
+                {"op": "reorder", "array_type": "clips", "new_order": [1, 0, 2]},
+                {"op": "change_media", "item_type": "clips", "item_index": 0, "stock_id": "stock_456"}
+            ])
         
-        if item_index is not None:
-            data["item_index"] = item_index
-            
-        if file_id:
-            data["file_id"] = file_id
-        elif stock_id:
-            data["stock_id"] = stock_id
-        elif path:
-            data["path"] = path
+        Notes:
+            Edits run one after another rather than concurrently because a reorder changes
+            the indices that later edits refer to.
+        """
+        if not isinstance(edits, list):
+            raise TypeError("edits must be a list of dictionaries")
         
-        # Add any additional kwargs for backward compatibility
-        data.update(kwargs)
+        prepared = [self._build_edit(self.sequence_url, sequence_id, edit, index) for index, edit in enumerate(edits)]
+        return self._send_edits(prepared, self.invalidate_sequence_cache)
+    
+    def begin_batch(self, sequence_id: str, max_interval_ms: int = 25, max_size: int = 16) -> "SequenceEditBatch":
+        """
+        Start collecting edits for a sequence and send them in short bursts.
+        
+        Meant for interactive editors that produce many small edits in quick succession
+        (dragging, typing). Edits are validated when queued and sent by apply_sequence_edits
+        once max_interval_ms passes without a new edit, once max_size edits are queued, or
+        when the batch is closed. Consecutive full replacements of the same item are merged,
+        keeping only the last one.
+        
+        If a send fails, no further edits are sent (a failed reorder would shift the indices
+        later edits refer to) and the next call on the batch raises the error. If the `with`
+        block raises, edits still queued are discarded with a warning rather than sent.
+        
+        Args:
+            sequence_id: ID of the sequence to modify
+            max_interval_ms: Idle time in milliseconds after which queued edits are sent
+            max_size: Number of queued edits that triggers an immediate send
             
-        return self._make_request("PUT", f"{self.sequence_url}/change_media", json_data=data)
+        Returns:
+            A SequenceEditBatch to use as a context manager
+            
+        Example:
+            with client.sequence.begin_batch("seq_123") as batch:
+                batch.edit_item("clips", 0, updated_item=clip)
+                batch.reorder("clips", [1, 0, 2])
+            print(batch.results)
+        """
+        return SequenceEditBatch(self, sequence_id, max_interval_ms, max_size)
         
     # Convenience methods and workflows
     
@@ -733,8 +895,8 @@ class SequenceClient(BaseClient):
         if not sequence_id:
             raise ValueError("sequence_id is required")
             
-        if array_type not in ["clips", "audios"]:
-            raise ValueError("array_type must be either 'clips' or 'audios'")
+        if array_type not in _ARRAY_TYPES:
+            raise ValueError(_ARRAY_TYPES_MSG)
             
         # Get the sequence to determine the array length
         sequence = self.get_sequence(sequence_id=sequence_id)
@@ -1128,3 +1290,137 @@ class SequenceClient(BaseClient):
         )
         
         return regeneration_result
+
+
+class SequenceEditBatch:
+    """
+    Edits queued for one sequence and sent in bursts; created by SequenceClient.begin_batch.
+    
+    Responses of the sent edits are collected in `results`. Once a send fails, whether it ran
+    in the background or not, the batch stops sending: edits still queued are discarded, and
+    the next add(), flush() or close() raises the failure.
+    """
+    
+    def __init__(self, client: SequenceClient, sequence_id: str, max_interval_ms: int = 25, max_size: int = 16):
+        if not sequence_id:
+            raise ValueError("sequence_id is required")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.client = client
+        self.sequence_id = sequence_id
+        self.max_interval = max(0, max_interval_ms) / 1000.0
+        self.max_size = max_size
+        self.results: List[Dict] = []
+        self._queue: List[Tuple[str, str, Dict]] = []
+        self._error: Optional[Exception] = None  # First failed send; nothing is sent after it
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()  # Keeps bursts in order
+        self._timer = None
+    
+    def reorder(self, array_type: str, new_order: List[int], **kwargs) -> None:
+        """Queue a reorder_sequence_items call"""
+        self.add({"op": "reorder", "array_type": array_type, "new_order": new_order, **kwargs})
+    
+    def edit_item(self, item_type: str, item_index: int = None, updated_item: Dict = None,
+                  file_id: str = None, stock_id: str = None, **kwargs) -> None:
+        """Queue an edit_sequence_item call"""
+        self.add({"op": "edit", "item_type": item_type, "item_index": item_index, "updated_item": updated_item,
+                  "file_id": file_id, "stock_id": stock_id, **kwargs})
+    
+    def change_media(self, item_type: str, item_index: int = None, file_id: str = None,
+                     stock_id: str = None, path: str = None, **kwargs) -> None:
+        """Queue a change_sequence_media call"""
+        self.add({"op": "change_media", "item_type": item_type, "item_index": item_index,
+                  "file_id": file_id, "stock_id": stock_id, "path": path, **kwargs})
+    
+    def add(self, edit: Dict) -> None:
+        """
+        Queue an edit in apply_sequence_edits format.
+        
+        Raises:
+            ValueError: If the edit is invalid
+            Exception: If an earlier send of this batch failed
+        """
+        op, url, data = self.client._build_edit(self.client.sequence_url, self.sequence_id, edit)
+        with self._lock:
+            self._raise_if_failed()
+            if self._queue and _edit_supersedes(self._queue[-1], (op, url, data)):
+                self._queue[-1] = (op, url, data)
+            else:
+                self._queue.append((op, url, data))
+            send_now = len(self._queue) >= self.max_size
+            self._cancel_timer()
+            if not send_now:
+                self._timer = threading.Timer(self.max_interval, self._flush_in_background)
+                self._timer.daemon = True
+                self._timer.start()
+        if send_now:
+            self.flush()
+    
+    def flush(self) -> List[Dict]:
+        """
+        Send queued edits now.
+        
+        Returns:
+            Responses of the edits sent by this call
+            
+        Raises:
+            Exception: If an edit fails, or an earlier send of this batch failed
+        """
+        with self._send_lock:
+            with self._lock:
+                self._raise_if_failed()
+                self._cancel_timer()
+                queued, self._queue = self._queue, []
+            if not queued:
+                return []
+            try:
+                results = self.client._send_edits(queued, self.client.invalidate_sequence_cache)
+            except Exception as e:
+                with self._lock:
+                    self._error = e
+                    self._cancel_timer()
+                    self._queue = []  # Their indices may no longer match the sequence
+                raise
+            self.results.extend(results)
+            return results
+    
+    def _flush_in_background(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            pass  # Recorded in self._error and raised by the next add(), flush() or close()
+    
+    def _cancel_timer(self) -> None:
+        """Stop a pending background send (call with _lock held)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+    
+    def _raise_if_failed(self) -> None:
+        """Refuse to go on once a send has failed (call with _lock held)"""
+        if self._error is not None:
+            raise Exception(f"An earlier sequence edit failed, so no further edits are sent: {self._error}") from self._error
+    
+    def close(self) -> None:
+        """
+        Send any queued edits, waiting for them to complete.
+        
+        Raises:
+            Exception: If an edit fails, or an earlier send of this batch failed
+        """
+        self.flush()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+            return
+        # The block raised: don't apply edits queued by code that did not complete
+        with self._lock:
+            self._cancel_timer()
+            dropped, self._queue = len(self._queue), []
+        if dropped and self._error is None:
+            warnings.warn(f"Discarded {dropped} queued sequence edit(s) because the batch block raised an exception")
@@ -1,16 +1,93 @@
-import os
 import json
-import requests
-from typing import Dict, List, Optional, Union, Any, Literal, TypeVar, cast
+import copy
+import time
+import threading
+from typing import Dict, List, Optional, Any, Iterator
 from .base_client import BaseClient
 
+# Settings API endpoints, relative to /settings
+_SETTINGS_SUBPATHS = (
+    "get", "save", "update", "reset", "theme", "ai-defaults",
+    "jobs/add", "jobs/list", "jobs/delete", "jobs/fetch_results"
+)
+
+# Settings applied by apply_preset
+_SETTINGS_PRESETS = {
+    "default": {
+        "ai_params": {
+            "eco": False,
+            "deepthink": False,
+            "temperature": 0.7,
+            "iterations": 3,
+            "web_search": False,
+            "overdrive": False
+        },
+        "ui_preferences": {
+            "dark_mode": False,
+            "default_view": "grid"
+        }
+    },
+    "creative": {
+        "ai_params": {
+            "temperature": 0.9,
+            "iterations": 4,
+            "deepthink": True,
+            "web_search": True,
+            "eco": False
+        }
+    },
+    "precise": {
+        "ai_params": {
+            "temperature": 0.3,
+            "iterations": 5,
+            "deepthink": True,
+            "web_search": True,
+            "eco": False
+        }
+    },
+    "performance": {
+        "ai_params": {
+            "eco": True,
+            "deepthink": False,
+            "iterations": 2,
+            "web_search": False,
+            "overdrive": False
+        }
+    },
+    "quality": {
+        "ai_params": {
+            "eco": False,
+            "deepthink": True,
+            "iterations": 5,
+            "overdrive": True
+        }
+    },
+    "dark_theme": {
+        "ui_preferences": {
+            "dark_mode": True
+        }
+    },
+    "light_theme": {
+        "ui_preferences": {
+            "dark_mode": False
+        }
+    }
+}
+
+def _unique_job_ids(job_ids: List[str]) -> List[str]:
+    """Validate the job_ids argument of the bulk job methods and drop duplicates, keeping order."""
+    if not isinstance(job_ids, list) or not all(isinstance(job_id, str) and job_id for job_id in job_ids):
+        raise TypeError("job_ids must be a list of non-empty strings")
+    return list(dict.fromkeys(job_ids))
+
 class SettingsClient(BaseClient):
     """
     Client for interacting with Storylinez Settings API.
     Provides methods for managing user settings and temporary job storage.
     """
     
-    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None):
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None,
+                 transport: str = "requests", settings_cache_ttl: float = 0):
         """
         Initialize the SettingsClient.
         
@@ -19,16 +96,58 @@ class SettingsClient(BaseClient):
             api_secret: Your Storylinez API Secret
             base_url: Base URL for the API (defaults to production)
             default_org_id: Default organization ID to use for all API calls (optional)
+            transport: "requests" (default) or "httpx" to multiplex requests over a shared HTTP/2 connection
+                       (requires the 'async' extra)
+            settings_cache_ttl: Seconds to reuse the last get_settings response (0 disables caching).
+                                Settings changed through this client update the cached copy
         """
-        super().__init__(api_key, api_secret, base_url, default_org_id)
+        super().__init__(api_key, api_secret, base_url, default_org_id, transport)
         self.settings_url = f"{self.base_url}/settings"
+        self._settings_urls = {subpath: f"{self.settings_url}/{subpath}" for subpath in _SETTINGS_SUBPATHS}
+        self._settings_cache_ttl = settings_cache_ttl
+        self._settings_cache = None  # (expires_at, settings) or None
+        self._settings_cache_lock = threading.Lock()
+    
+    # Settings caching
+    
+    def _send_settings_change(self, method: str, path: str, data: Dict, updates: Optional[Dict] = None) -> Dict:
+        """
+        Send a request that modifies settings, then bring the cached settings up to date.
+        
+        updates is the partial settings document the change is known to produce; it is merged
+        into the cached copy. Without it, the cached copy is dropped.
+        """
+        try:
+            result = self._make_request(method, self._settings_urls[path], json_data=data)
+        except Exception:
+            self.invalidate_settings_cache()
+            raise
+        with self._settings_cache_lock:
+            if self._settings_cache is not None and updates is not None:
+                settings = self._settings_cache[1]
+                for category, values in updates.items():
+                    if isinstance(values, dict) and isinstance(settings.get(category), dict):
+                        settings[category].update(copy.deepcopy(values))
+                    else:
+                        settings[category] = copy.deepcopy(values)
+            else:
+                self._settings_cache = None
+        return result
+    
+    def invalidate_settings_cache(self) -> None:
+        """Drop the cached get_settings response (see settings_cache_ttl)."""
+        with self._settings_cache_lock:
+            self._settings_cache = None
     
     # User Settings Management
     
-    def get_settings(self) -> Dict:
+    def get_settings(self, force_refresh: bool = False) -> Dict:
         """
         Get all settings for the current user.
         
+        Args:
+            force_refresh: Fetch from the API even if a cached copy is available
+        
         Returns:
             Dictionary containing user settings (AI parameters, link preferences, UI preferences)
             
@@ -37,7 +156,16 @@ class SettingsClient(BaseClient):
             >>> dark_mode = settings.get('ui_preferences', {}).get('dark_mode', False)
             >>> temperature = settings.get('ai_params', {}).get('temperature', 0.7)
         """
-        return self._make_request("GET", f"{self.settings_url}/get")
+        if self._settings_cache_ttl > 0 and not force_refresh:
+            with self._settings_cache_lock:
+                if self._settings_cache is not None and self._settings_cache[0] > time.monotonic():
+                    return copy.deepcopy(self._settings_cache[1])
+        
+        result = self._make_request("GET", self._settings_urls["get"])
+        if self._settings_cache_ttl > 0:
+            with self._settings_cache_lock:
+                self._settings_cache = (time.monotonic() + self._settings_cache_ttl, copy.deepcopy(result))
+        return result
     
     def save_settings(
         self,
@@ -201,7 +329,7 @@ class SettingsClient(BaseClient):
         if not data:
             raise ValueError("At least one settings category (ai_params, link_preferences, or ui_preferences) must be provided")
             
-        return self._make_request("POST", f"{self.settings_url}/save", json_data=data)
+        return self._send_settings_change("POST", "save", data)
     
     def update_settings(
         self,
@@ -269,7 +397,8 @@ class SettingsClient(BaseClient):
             >>>     ui_preferences={"dark_mode": True}
             >>> )
             >>> 
-            >>> # Using individual parameters
+            >>> # Using individual parameters: one request instead of
+            >>> # update_theme(True) followed by update_ai_defaults(temperature=0.8)
             >>> client.settings.update_settings(
             >>>     temperature=0.8,
             >>>     dark_mode=True
@@ -364,7 +493,7 @@ class SettingsClient(BaseClient):
         if not data:
             raise ValueError("At least one settings category (ai_params, link_preferences, or ui_preferences) must be provided")
             
-        return self._make_request("PUT", f"{self.settings_url}/update", json_data=data)
+        return self._send_settings_change("PUT", "update", data, updates=data)
     
     def reset_settings(self, category: str = "all") -> Dict:
         """
@@ -391,7 +520,7 @@ class SettingsClient(BaseClient):
         if category not in valid_categories:
             raise ValueError(f"Invalid category. Must be one of: {', '.join(valid_categories)}")
             
-        return self._make_request("POST", f"{self.settings_url}/reset", json_data={"category": category})
+        return self._send_settings_change("POST", "reset", {"category": category})
     
     # Specialized Settings Updates
     
@@ -399,6 +528,10 @@ class SettingsClient(BaseClient):
         """
         Update UI theme preference (light/dark mode).
         
+        To change the theme together with other settings, pass everything to a single
+        update_settings call (e.g. update_settings(dark_mode=True, temperature=0.8)) instead of
+        making one request per helper.
+        
         Args:
             dark_mode: Whether to enable dark mode (True) or light mode (False)
             
@@ -416,7 +549,8 @@ class SettingsClient(BaseClient):
             dark_mode = bool(dark_mode)
             print(f"Warning: dark_mode parameter converted to boolean: {dark_mode}")
             
-        return self._make_request("PUT", f"{self.settings_url}/theme", json_data={"dark_mode": dark_mode})
+        return self._send_settings_change("PUT", "theme", {"dark_mode": dark_mode},
+                                          updates={"ui_preferences": {"dark_mode": dark_mode}})
     
     def update_ai_defaults(
         self, 
@@ -430,6 +564,9 @@ class SettingsClient(BaseClient):
         """
         Update default AI parameters for content generation.
         
+        To change AI defaults together with UI or link preferences, pass everything to a
+        single update_settings call instead of making one request per helper.
+        
         Args:
             temperature: AI temperature parameter (0.0-1.0)
             iterations: Number of refinement iterations
@@ -488,7 +625,7 @@ class SettingsClient(BaseClient):
         if not data:
             raise ValueError("At least one AI parameter must be provided")
             
-        return self._make_request("PUT", f"{self.settings_url}/ai-defaults", json_data=data)
+        return self._send_settings_change("PUT", "ai-defaults", data, updates={"ai_params": data})
     
     # Temporary Job Management
     
@@ -537,9 +674,7 @@ class SettingsClient(BaseClient):
             raise ValueError("job_id must be a non-empty string")
             
         # Use default org_id if not provided
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Validate job_type
         allowed_job_types = ["query_generation", "search_recommendations"]
@@ -561,7 +696,7 @@ class SettingsClient(BaseClient):
                 raise ValueError("metadata must be a dictionary")
             data["metadata"] = metadata
             
-        return self._make_request("POST", f"{self.settings_url}/jobs/add", json_data=data)
+        return self._make_request("POST", self._settings_urls["jobs/add"], json_data=data)
     
     def list_jobs(
         self, 
@@ -609,9 +744,7 @@ class SettingsClient(BaseClient):
             >>> )
         """
         # Use default org_id if not provided
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         # Validate page and limit
         if not isinstance(page, int) or page < 1:
@@ -642,7 +775,21 @@ class SettingsClient(BaseClient):
         if job_type:
             params["job_type"] = job_type
             
-        return self._make_request("GET", f"{self.settings_url}/jobs/list", params=params)
+        return self._make_request("GET", self._settings_urls["jobs/list"], params=params)
+    
+    def iter_jobs(self, limit: int = 50, page: int = 1, **kwargs) -> Iterator[Dict]:
+        """
+        Iterate over every temporary job, requesting the next page in the background.
+        
+        Args:
+            limit: Number of jobs per page
+            page: Page to start from
+            **kwargs: Additional arguments for list_jobs (org_id, project_id, job_type, sort_by, sort_order)
+            
+        Yields:
+            Individual job dictionaries
+        """
+        return self._iter_pages(lambda p: self.list_jobs(page=p, limit=limit, **kwargs), "jobs", page, limit)
     
     def delete_job(self, job_id: str, org_id: Optional[str] = None) -> Dict:
         """
@@ -670,16 +817,14 @@ class SettingsClient(BaseClient):
             raise ValueError("job_id must be a non-empty string")
             
         # Use default org_id if not provided
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         params = {
             "job_id": job_id,
             "org_id": org_id
         }
             
-        return self._make_request("DELETE", f"{self.settings_url}/jobs/delete", params=params)
+        return self._make_request("DELETE", self._settings_urls["jobs/delete"], params=params)
     
     def fetch_job_results(self, job_id: str, org_id: Optional[str] = None) -> Dict:
         """
@@ -710,16 +855,79 @@ class SettingsClient(BaseClient):
             raise ValueError("job_id must be a non-empty string")
             
         # Use default org_id if not provided
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
             
         params = {
             "job_id": job_id,
             "org_id": org_id
         }
             
-        return self._make_request("GET", f"{self.settings_url}/jobs/fetch_results", params=params)
+        return self._make_request("GET", self._settings_urls["jobs/fetch_results"], params=params)
+    
+    # Bulk job management
+    
+    def add_jobs(self, jobs: List[Dict], max_workers: int = 8) -> List[Dict]:
+        """
+        Add several temporary jobs concurrently.
+        
+        The API has no batch endpoint for jobs, so this issues one add_job request per job
+        over the shared connection pool.
+        
+        Args:
+            jobs: List of add_job keyword arguments, e.g. [{"job_id": "job_1", "job_type": "query_generation"}]
+            max_workers: Maximum number of requests in flight at once
+            
+        Returns:
+            List of add_job results in the same order as `jobs`.
+            A job that could not be added is represented by a dictionary with an "error" key.
+        """
+        if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+            raise TypeError("jobs must be a list of dictionaries")
+        return self._fan_out(lambda job: self.add_job(**job), jobs, max_workers)
+    
+    def delete_jobs(self, job_ids: List[str], org_id: Optional[str] = None, max_workers: int = 8) -> Dict[str, Dict]:
+        """
+        Delete several temporary jobs concurrently.
+        
+        Args:
+            job_ids: IDs of the jobs to delete
+            org_id: Organization ID (uses default if not provided)
+            max_workers: Maximum number of requests in flight at once
+            
+        Returns:
+            Dictionary mapping each job ID to its delete_job result, or to a dictionary with
+            an "error" key if it could not be deleted
+            
+        Raises:
+            TypeError: If job_ids is not a list of strings
+            ValueError: If no organization ID is available
+        """
+        unique_ids = _unique_job_ids(job_ids)
+        org_id = self._require_org_id(org_id)
+        results = self._fan_out(lambda job_id: self.delete_job(job_id, org_id), unique_ids, max_workers)
+        return dict(zip(unique_ids, results))
+    
+    def fetch_jobs_results(self, job_ids: List[str], org_id: Optional[str] = None, max_workers: int = 8) -> Dict[str, Dict]:
+        """
+        Fetch the results of several temporary jobs concurrently.
+        
+        Args:
+            job_ids: IDs of the jobs to fetch
+            org_id: Organization ID (uses default if not provided)
+            max_workers: Maximum number of requests in flight at once
+            
+        Returns:
+            Dictionary mapping each job ID to its fetch_job_results result, or to a dictionary
+            with an "error" key if it could not be fetched
+            
+        Raises:
+            TypeError: If job_ids is not a list of strings
+            ValueError: If no organization ID is available
+        """
+        unique_ids = _unique_job_ids(job_ids)
+        org_id = self._require_org_id(org_id)
+        results = self._fan_out(lambda job_id: self.fetch_job_results(job_id, org_id), unique_ids, max_workers)
+        return dict(zip(unique_ids, results))
     
     # Helper methods for common workflows
     
@@ -744,72 +952,10 @@ class SettingsClient(BaseClient):
             >>> # Apply dark theme preset
             >>> client.settings.apply_preset("dark_theme")
         """
-        presets = {
-            "default": {
-                "ai_params": {
-                    "eco": False,
-                    "deepthink": False,
-                    "temperature": 0.7,
-                    "iterations": 3,
-                    "web_search": False,
-                    "overdrive": False
-                },
-                "ui_preferences": {
-                    "dark_mode": False,
-                    "default_view": "grid"
-                }
-            },
-            "creative": {
-                "ai_params": {
-                    "temperature": 0.9,
-                    "iterations": 4,
-                    "deepthink": True,
-                    "web_search": True,
-                    "eco": False
-                }
-            },
-            "precise": {
-                "ai_params": {
-                    "temperature": 0.3,
-                    "iterations": 5,
-                    "deepthink": True,
-                    "web_search": True,
-                    "eco": False
-                }
-            },
-            "performance": {
-                "ai_params": {
-                    "eco": True,
-                    "deepthink": False,
-                    "iterations": 2,
-                    "web_search": False,
-                    "overdrive": False
-                }
-            },
-            "quality": {
-                "ai_params": {
-                    "eco": False,
-                    "deepthink": True,
-                    "iterations": 5,
-                    "overdrive": True
-                }
-            },
-            "dark_theme": {
-                "ui_preferences": {
-                    "dark_mode": True
-                }
-            },
-            "light_theme": {
-                "ui_preferences": {
-                    "dark_mode": False
-                }
-            }
-        }
-        
-        if preset_name not in presets:
-            raise ValueError(f"Invalid preset name. Must be one of: {', '.join(presets.keys())}")
+        if preset_name not in _SETTINGS_PRESETS:
+            raise ValueError(f"Invalid preset name. Must be one of: {', '.join(_SETTINGS_PRESETS.keys())}")
         
-        preset = presets[preset_name]
+        preset = _SETTINGS_PRESETS[preset_name]
         
         # Apply the preset using the update_settings method
         print(f"Applying '{preset_name}' preset...")
@@ -862,10 +1008,14 @@ class SettingsClient(BaseClient):
             >>> # Backup with custom filename
             >>> client.settings.backup_settings("my_settings_backup.json")
         """
-        import datetime
-        
         # Get current settings
         settings = self.get_settings()
+        return self._write_backup(settings, filename)
+    
+    @staticmethod
+    def _write_backup(settings: Dict, filename: Optional[str]) -> str:
+        """Write settings to a JSON backup file and return its name (see backup_settings)."""
+        import datetime
         
         # Create default filename if not provided
         if filename is None:
@@ -902,6 +1052,22 @@ class SettingsClient(BaseClient):
             >>> # Restore from backup file
             >>> client.settings.restore_settings("storylinez_settings_2023-11-01.json")
         """
+        settings = self._read_backup(filename)
+        
+        # Apply settings from backup
+        print(f"Restoring settings from {filename}...")
+        result = self.save_settings(
+            ai_params=settings.get("ai_params"),
+            link_preferences=settings.get("link_preferences"),
+            ui_preferences=settings.get("ui_preferences")
+        )
+        
+        print("Settings restored successfully!")
+        return result
+    
+    @staticmethod
+    def _read_backup(filename: str) -> Dict:
+        """Load and check a settings backup file (see restore_settings)."""
         # Load settings from file
         try:
             with open(filename, 'r') as f:
@@ -916,14 +1082,4 @@ class SettingsClient(BaseClient):
         missing_keys = [key for key in required_keys if key not in settings]
         if missing_keys:
             raise KeyError(f"Backup file is missing required settings: {', '.join(missing_keys)}")
-        
-        # Apply settings from backup
-        print(f"Restoring settings from {filename}...")
-        result = self.save_settings(
-            ai_params=settings.get("ai_params"),
-            link_preferences=settings.get("link_preferences"),
-            ui_preferences=settings.get("ui_preferences")
-        )
-        
-        print("Settings restored successfully!")
-        return result
+        return settings
@@ -1,9 +1,28 @@
-import os
-import json
-import requests
+import threading
 import warnings
-from typing import Dict, List, Optional, Union, Any, Tuple
-from .base_client import BaseClient
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Iterator
+from .base_client import BaseClient, _BOOL_STR, _merge_batches
+
+_MEDIA_TYPES = ('videos', 'audios', 'images')
+_VALID_MEDIA_TYPES = frozenset(_MEDIA_TYPES)
+_ORIENTATIONS = frozenset(('landscape', 'portrait'))
+_SORT_ORDERS = frozenset(('asc', 'desc'))
+_MEDIA_TYPE_MSG = f"media_type must be one of: {', '.join(_MEDIA_TYPES)}"
+
+# Stock API endpoints, relative to /stock
+_STOCK_SUBPATHS = ("search", "get_by_id", "list", "get_by_ids", "like", "dislike", "remove_interaction")
+
+# Upper bound on cached search/list responses per client
+_STOCK_CACHE_MAX_ENTRIES = 256
+
+def _fields_param(fields: List[str]) -> str:
+    """Encode a response field selection as the comma-separated `fields` query parameter."""
+    if (not isinstance(fields, (list, tuple)) or not fields
+            or not all(isinstance(field, str) and field for field in fields)):
+        raise ValueError("fields must be a non-empty list of field names")
+    return ",".join(fields)
 
 class StockClient(BaseClient):
     """
@@ -11,7 +30,8 @@ class StockClient(BaseClient):
     Provides methods for searching and fetching stock videos, audios, and images.
     """
     
-    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None):
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None,
+                 transport: str = "requests", stock_cache_ttl: float = 0, stock_cache_stale_ttl: float = 0):
         """
         Initialize the StockClient.
         
@@ -20,9 +40,34 @@ class StockClient(BaseClient):
             api_secret: Your Storylinez API Secret
             base_url: Base URL for the API (defaults to production)
             default_org_id: Default organization ID to use for all API calls (optional)
+            transport: "requests" (default) or "httpx" to multiplex requests over a shared HTTP/2 connection
+                       (requires the 'async' extra)
+            stock_cache_ttl: Seconds a search or list_media response is reused as-is (0 disables caching)
+            stock_cache_stale_ttl: Age in seconds up to which an older cached response is still returned
+                                   immediately while a fresh copy is fetched in the background
+                                   (stale-while-revalidate); must not be below stock_cache_ttl to have an effect
         """
-        super().__init__(api_key, api_secret, base_url, default_org_id)
+        super().__init__(api_key, api_secret, base_url, default_org_id, transport)
         self.stock_url = f"{self.base_url}/stock"
+        self._stock_urls = {subpath: f"{self.stock_url}/{subpath}" for subpath in _STOCK_SUBPATHS}
+        self._stock_cache_ttl = stock_cache_ttl
+        self._stock_cache_stale_ttl = stock_cache_stale_ttl
+        self._stock_cache = OrderedDict()  # request key -> (stored_at, response, signed URL expiry or None)
+        self._stock_refreshing = set()  # request keys with a background refresh in progress
+        self._stock_cache_lock = threading.Lock()
+    
+    # Response caching
+    
+    def _cached_request(self, method: str, url: str, params: Dict, data: Dict = None) -> Dict:
+        """Send a read-only request through the stale-while-revalidate cache (see BaseClient._swr_request)."""
+        return self._swr_request(self._stock_cache, self._stock_cache_lock, self._stock_refreshing,
+                                 self._stock_cache_ttl, self._stock_cache_stale_ttl, _STOCK_CACHE_MAX_ENTRIES,
+                                 method, url, params, data)
+    
+    def invalidate_stock_cache(self) -> None:
+        """Drop all cached search and list_media responses."""
+        with self._stock_cache_lock:
+            self._stock_cache.clear()
     
     def search(self, queries: List[str], collections: List[str] = None, 
               detailed: bool = False, generate_thumbnail: bool = False,
@@ -30,13 +75,14 @@ class StockClient(BaseClient):
               num_results: int = None, num_results_videos: int = 1, 
               num_results_audios: int = 1, num_results_images: int = 1,
               similarity_threshold: float = 0.5, orientation: str = None,
-              **kwargs) -> Dict:
+              fields: Optional[List[str]] = None, **kwargs) -> Dict:
         """
         Search for stock media items across videos, audios, and/or images collections using semantic search.
         
         Args:
             queries: List of natural language search queries
             collections: List of collections to search ('videos', 'audios', 'images'). Defaults to all.
+                         Several collections are searched in one request, e.g. collections=['videos', 'images']
             detailed: Whether to include full analysis data in results
             generate_thumbnail: Whether to generate thumbnail URLs
             generate_streamable: Whether to generate streamable media URLs
@@ -47,6 +93,8 @@ class StockClient(BaseClient):
             num_results_images: Maximum number of image results per query
             similarity_threshold: Minimum similarity score (0.0-1.0)
             orientation: Filter videos by orientation ('landscape' or 'portrait')
+            fields: Only return these fields of each item, e.g. ['id', 'media_type', 'similarity'] when
+                    the results are only needed to call get_by_ids afterwards
             
         Returns:
             Dictionary containing search results grouped by media type
@@ -63,21 +111,20 @@ class StockClient(BaseClient):
             raise ValueError("All queries must be strings")
             
         # Validate collections
-        valid_collections = ['videos', 'audios', 'images']
         if collections:
             if not isinstance(collections, list):
                 raise TypeError("collections must be a list of strings")
                 
-            invalid_collections = [c for c in collections if c not in valid_collections]
+            invalid_collections = [c for c in collections if c not in _VALID_MEDIA_TYPES]
             if invalid_collections:
-                raise ValueError(f"Invalid collection(s): {', '.join(invalid_collections)}. Valid values are: {', '.join(valid_collections)}")
+                raise ValueError(f"Invalid collection(s): {', '.join(invalid_collections)}. Valid values are: {', '.join(_MEDIA_TYPES)}")
         
         # Validate similarity_threshold
         if similarity_threshold < 0 or similarity_threshold > 1:
             raise ValueError("similarity_threshold must be between 0.0 and 1.0")
             
         # Validate orientation
-        if orientation and orientation not in ['landscape', 'portrait']:
+        if orientation and orientation not in _ORIENTATIONS:
             raise ValueError("orientation must be either 'landscape' or 'portrait'")
             
         if orientation and (not collections or 'videos' not in collections):
@@ -85,17 +132,16 @@ class StockClient(BaseClient):
             
         # Build query parameters
         params = {
-            "detailed": str(detailed).lower(),
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower(),
+            "detailed": _BOOL_STR[bool(detailed)],
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)],
             "similarity_threshold": similarity_threshold,
         }
         
         # Add optional parameters
         if collections:
-            for collection in collections:
-                params["collections"] = collection
+            params["collections"] = list(collections)  # Sent as repeated collections=... parameters
                 
         if num_results is not None:
             params["num_results"] = num_results
@@ -107,6 +153,9 @@ class StockClient(BaseClient):
         if orientation:
             params["orientation"] = orientation
         
+        if fields is not None:
+            params["fields"] = _fields_param(fields)
+        
         # Add any additional parameters from kwargs (for backward compatibility)
         params.update({k: v for k, v in kwargs.items() if v is not None})
         
@@ -115,14 +164,16 @@ class StockClient(BaseClient):
             "queries": queries
         }
         
-        return self._make_request("POST", f"{self.stock_url}/search", params=params, json_data=data)
+        return self._cached_request("POST", self._stock_urls["search"], params, data)
     
     def get_by_id(self, stock_id: str, media_type: str, detailed: bool = True,
                  generate_thumbnail: bool = True, generate_streamable: bool = False,
-                 generate_download: bool = False, **kwargs) -> Dict:
+                 generate_download: bool = False, fields: Optional[List[str]] = None, **kwargs) -> Dict:
         """
         Get a specific stock media item by ID.
         
+        To fetch several items, use get_many rather than calling this in a loop.
+        
         Args:
             stock_id: ID of the stock item to retrieve
             media_type: Type of media ('videos', 'audios', or 'images')
@@ -130,6 +181,7 @@ class StockClient(BaseClient):
             generate_thumbnail: Whether to generate thumbnail URL
             generate_streamable: Whether to generate streamable media URL
             generate_download: Whether to generate download URL
+            fields: Only return these fields of the item (defaults to all)
             
         Returns:
             Dictionary containing the stock item details
@@ -139,29 +191,32 @@ class StockClient(BaseClient):
             raise ValueError("stock_id is required")
             
         # Validate media_type
-        valid_media_types = ['videos', 'audios', 'images']
-        if media_type not in valid_media_types:
-            raise ValueError(f"media_type must be one of: {', '.join(valid_media_types)}")
+        if media_type not in _VALID_MEDIA_TYPES:
+            raise ValueError(_MEDIA_TYPE_MSG)
             
         params = {
             "id": stock_id,
             "media_type": media_type,
-            "detailed": str(detailed).lower(),
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
+            "detailed": _BOOL_STR[bool(detailed)],
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)]
         }
         
+        if fields is not None:
+            params["fields"] = _fields_param(fields)
+        
         # Add any additional parameters from kwargs (for backward compatibility)
         params.update({k: v for k, v in kwargs.items() if v is not None})
         
-        return self._make_request("GET", f"{self.stock_url}/get_by_id", params=params)
+        return self._make_request("GET", self._stock_urls["get_by_id"], params=params)
     
     def list_media(self, media_type: str, page: int = 1, limit: int = 20, 
                  sort_by: str = "processed_at", sort_order: str = "desc",
                  detailed: bool = False, generate_thumbnail: bool = False,
                  generate_streamable: bool = False, generate_download: bool = False,
-                 orientation: str = None, search: str = None, **kwargs) -> Dict:
+                 orientation: str = None, search: str = None, fields: Optional[List[str]] = None,
+                 **kwargs) -> Dict:
         """
         List stock media items with pagination.
         
@@ -177,22 +232,55 @@ class StockClient(BaseClient):
             generate_download: Whether to generate download URLs
             orientation: Filter videos by orientation ('landscape' or 'portrait')
             search: Optional text search within title/metadata
+            fields: Only return these fields of each item (defaults to all)
             
         Returns:
             Dictionary containing paginated media items and pagination info
         """
+        params = self._list_media_params(
+            media_type, page=page, limit=limit, sort_by=sort_by, sort_order=sort_order, detailed=detailed,
+            generate_thumbnail=generate_thumbnail, generate_streamable=generate_streamable,
+            generate_download=generate_download, orientation=orientation, search=search, fields=fields, **kwargs
+        )
+        return self._cached_request("GET", self._stock_urls["list"], params)
+    
+    def iter_list_media(self, media_type: str, **kwargs) -> Iterator[Dict]:
+        """
+        Stream the items of one list_media page, parsing them as they are downloaded.
+        
+        Useful for large pages (limit=100, detailed=True): the first item is available before
+        the whole response has arrived, and the full response is never held in memory.
+        Requires the optional 'stream' extra (ijson). Responses are not cached.
+        
+        Args:
+            media_type: Type of media to list ('videos', 'audios', or 'images')
+            **kwargs: The other arguments of list_media (page, limit, detailed, ...)
+            
+        Yields:
+            Individual media item dictionaries
+        """
+        params = self._list_media_params(media_type, **kwargs)
+        return self._stream_items("GET", self._stock_urls["list"], "results.item", params)
+    
+    @staticmethod
+    def _list_media_params(media_type: str, page: int = 1, limit: int = 20,
+                           sort_by: str = "processed_at", sort_order: str = "desc",
+                           detailed: bool = False, generate_thumbnail: bool = False,
+                           generate_streamable: bool = False, generate_download: bool = False,
+                           orientation: str = None, search: str = None, fields: Optional[List[str]] = None,
+                           **kwargs) -> Dict:
+        """Validate list_media arguments and build its query parameters."""
         # Input validation
-        valid_media_types = ['videos', 'audios', 'images']
-        if media_type not in valid_media_types:
-            raise ValueError(f"media_type must be one of: {', '.join(valid_media_types)}")
+        if media_type not in _VALID_MEDIA_TYPES:
+            raise ValueError(_MEDIA_TYPE_MSG)
             
         # Validate sort_order
-        if sort_order not in ['asc', 'desc']:
+        if sort_order not in _SORT_ORDERS:
             raise ValueError("sort_order must be either 'asc' or 'desc'")
             
         # Validate orientation if provided
         if orientation:
-            if orientation not in ['landscape', 'portrait']:
+            if orientation not in _ORIENTATIONS:
                 raise ValueError("orientation must be either 'landscape' or 'portrait'")
             if media_type != 'videos':
                 warnings.warn("orientation filter only applies to videos and will be ignored")
@@ -214,10 +302,10 @@ class StockClient(BaseClient):
             "limit": limit,
             "sort_by": sort_by,
             "sort_order": sort_order,
-            "detailed": str(detailed).lower(),
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
+            "detailed": _BOOL_STR[bool(detailed)],
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)]
         }
         
         # Add optional parameters
@@ -227,15 +315,18 @@ class StockClient(BaseClient):
         if search:
             params["search"] = search
             
+        if fields is not None:
+            params["fields"] = _fields_param(fields)
+            
         # Add any additional parameters from kwargs (for backward compatibility)
         params.update({k: v for k, v in kwargs.items() if v is not None})
         
-        return self._make_request("GET", f"{self.stock_url}/list", params=params)
+        return params
     
     def get_by_ids(self, ids: List[str], media_types: List[str], 
                   detailed: bool = True, generate_thumbnail: bool = True,
                   generate_streamable: bool = False, generate_download: bool = False,
-                  **kwargs) -> Dict:
+                  fields: Optional[List[str]] = None, **kwargs) -> Dict:
         """
         Get multiple stock media items by their IDs.
         
@@ -246,6 +337,7 @@ class StockClient(BaseClient):
             generate_thumbnail: Whether to generate thumbnail URLs
             generate_streamable: Whether to generate streamable media URLs
             generate_download: Whether to generate download URLs
+            fields: Only return these fields of each item (defaults to all)
             
         Returns:
             Dictionary containing the requested stock items
@@ -264,18 +356,20 @@ class StockClient(BaseClient):
             raise ValueError("Cannot request more than 100 items at once")
             
         # Validate media types
-        valid_media_types = ['videos', 'audios', 'images']
-        invalid_types = [mt for mt in media_types if mt not in valid_media_types]
+        invalid_types = set(media_types) - _VALID_MEDIA_TYPES
         if invalid_types:
-            raise ValueError(f"Invalid media type(s): {', '.join(set(invalid_types))}. Valid values are: {', '.join(valid_media_types)}")
+            raise ValueError(f"Invalid media type(s): {', '.join(sorted(map(str, invalid_types)))}. Valid values are: {', '.join(_MEDIA_TYPES)}")
         
         params = {
-            "detailed": str(detailed).lower(),
-            "generate_thumbnail": str(generate_thumbnail).lower(),
-            "generate_streamable": str(generate_streamable).lower(),
-            "generate_download": str(generate_download).lower()
+            "detailed": _BOOL_STR[bool(detailed)],
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)]
         }
         
+        if fields is not None:
+            params["fields"] = _fields_param(fields)
+        
         # Add any additional parameters from kwargs (for backward compatibility)
         params.update({k: v for k, v in kwargs.items() if v is not None})
         
@@ -284,7 +378,68 @@ class StockClient(BaseClient):
             "media_types": media_types
         }
         
-        return self._make_request("POST", f"{self.stock_url}/get_by_ids", params=params, json_data=data)
+        return self._make_request("POST", self._stock_urls["get_by_ids"], params=params, json_data=data)
+    
+    def iter_media(self, media_type: str, limit: int = 100, page: int = 1, **kwargs) -> Iterator[Dict]:
+        """
+        Iterate over every stock item of a media type, one page in memory at a time.
+        
+        While the items of one page are being consumed, the next page is already being
+        requested in the background.
+        
+        Args:
+            media_type: Type of media to list ('videos', 'audios', or 'images')
+            limit: Number of items per page (max 100)
+            page: Page to start from
+            **kwargs: Additional arguments for list_media (sort_by, orientation, search, ...)
+            
+        Yields:
+            Individual media item dictionaries
+            
+        Example:
+            >>> for video in client.stock.iter_media("videos", orientation="portrait"):
+            ...     print(video["id"])
+        """
+        return self._iter_pages(lambda p: self.list_media(media_type, page=p, limit=limit, **kwargs),
+                                "results", page, min(limit, 100))
+    
+    @staticmethod
+    def _shard_ids(ids: List[str], media_types: List[str], chunk_size: int) -> List[Tuple[List[str], List[str]]]:
+        """Split parallel id and media type lists into get_by_ids-sized batches."""
+        if len(ids) != len(media_types):
+            raise ValueError("The ids and media_types lists must be the same length")
+        if not 1 <= chunk_size <= 100:
+            raise ValueError("chunk_size must be between 1 and 100")
+        return [(ids[i:i + chunk_size], media_types[i:i + chunk_size]) for i in range(0, len(ids), chunk_size)]
+    
+    def get_many(self, ids: List[str], media_types: List[str], chunk_size: int = 100,
+                 max_workers: int = 8, **kwargs) -> Dict:
+        """
+        Get any number of stock media items, using as few get_by_ids requests as possible.
+        
+        Use this instead of calling get_by_id in a loop: N items cost ceil(N / chunk_size)
+        requests, and the batches are fetched concurrently over the shared connection pool.
+        
+        Args:
+            ids: List of stock item IDs
+            media_types: Corresponding media types for each ID ('videos', 'audios', 'images')
+            chunk_size: Number of items per get_by_ids request (at most 100)
+            max_workers: Maximum number of batches fetched at once
+            **kwargs: Additional arguments for get_by_ids (detailed, generate_thumbnail, ...)
+            
+        Returns:
+            Dictionary with the same shape as a get_by_ids response, with the "items" of all
+            batches in request order
+        """
+        if not ids:
+            raise ValueError("ids list cannot be empty")
+        batches = self._shard_ids(ids, media_types, chunk_size)
+        if len(batches) == 1:
+            return self.get_by_ids(ids, media_types, **kwargs)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            results = list(executor.map(lambda batch: self.get_by_ids(batch[0], batch[1], **kwargs), batches))
+        return _merge_batches(results)
     
     # Utility methods for common workflows
     
@@ -387,7 +542,19 @@ class StockClient(BaseClient):
         # Get the reference item
         item = self.get_by_id(stock_id=stock_id, media_type=media_type, detailed=True)
         
-        # Extract description from analysis results
+        # Search for similar media using the description
+        return self.search(
+            queries=[self._description_of(item)],
+            detailed=False,
+            generate_thumbnail=True,
+            num_results_videos=num_results,
+            num_results_audios=num_results,
+            num_results_images=num_results
+        )
+    
+    @staticmethod
+    def _description_of(item: Dict) -> str:
+        """Extract a searchable description from a detailed stock item."""
         description = ""
         if 'analysis_data' in item and 'results' in item['analysis_data']:
             results = item['analysis_data']['results']
@@ -400,16 +567,34 @@ class StockClient(BaseClient):
                 
         if not description:
             raise ValueError("Could not extract description from the reference item")
-            
-        # Search for similar media using the description
-        return self.search(
-            queries=[description],
-            detailed=False,
-            generate_thumbnail=True,
-            num_results_videos=num_results,
-            num_results_audios=num_results,
-            num_results_images=num_results
-        )
+        return description
+    
+    @staticmethod
+    def _flatten_ids_by_media_type(ids_by_media_type: Dict[str, List[str]]) -> Tuple[List[str], List[str]]:
+        """Validate a {media_type: [ids]} mapping and flatten it into parallel id and media type lists."""
+        for media_type in ids_by_media_type:
+            if media_type not in _VALID_MEDIA_TYPES:
+                raise ValueError(f"Invalid media type: {media_type}. Valid values are: {', '.join(_MEDIA_TYPES)}")
+        
+        flat_ids = []
+        flat_media_types = []
+        
+        for media_type, ids in ids_by_media_type.items():
+            flat_ids.extend(ids)
+            flat_media_types.extend([media_type] * len(ids))
+        return flat_ids, flat_media_types
+    
+    @staticmethod
+    def _group_items_by_media_type(result: Dict) -> Dict[str, List[Dict]]:
+        """Group the items of a get_by_ids response by media type."""
+        items_by_type = {'videos': [], 'audios': [], 'images': []}
+        
+        for item in result.get('items', []):
+            media_type = item.get('media_type')
+            if media_type in items_by_type:
+                items_by_type[media_type].append(item)
+                
+        return items_by_type
     
     def batch_get_items(self, ids_by_media_type: Dict[str, List[str]],
                        detailed: bool = True, generate_thumbnail: bool = True) -> Dict[str, List[Dict]]:
@@ -425,25 +610,14 @@ class StockClient(BaseClient):
         Returns:
             Dictionary of items grouped by media type
         """
-        # Validate input
-        valid_media_types = ['videos', 'audios', 'images']
-        for media_type in ids_by_media_type:
-            if media_type not in valid_media_types:
-                raise ValueError(f"Invalid media type: {media_type}. Valid values are: {', '.join(valid_media_types)}")
-        
-        # Flatten IDs and media types for the API call
-        flat_ids = []
-        flat_media_types = []
-        
-        for media_type, ids in ids_by_media_type.items():
-            flat_ids.extend(ids)
-            flat_media_types.extend([media_type] * len(ids))
+        # Validate input and flatten IDs and media types for the API call
+        flat_ids, flat_media_types = self._flatten_ids_by_media_type(ids_by_media_type)
             
         if not flat_ids:
             return {'videos': [], 'audios': [], 'images': []}
             
         # Call the API
-        result = self.get_by_ids(
+        result = self.get_many(
             ids=flat_ids,
             media_types=flat_media_types,
             detailed=detailed,
@@ -451,14 +625,7 @@ class StockClient(BaseClient):
         )
         
         # Reorganize results by media type
-        items_by_type = {'videos': [], 'audios': [], 'images': []}
-        
-        for item in result.get('items', []):
-            media_type = item.get('media_type')
-            if media_type in items_by_type:
-                items_by_type[media_type].append(item)
-                
-        return items_by_type
+        return self._group_items_by_media_type(result)
     
     # User Interaction Methods
     
@@ -474,8 +641,8 @@ class StockClient(BaseClient):
             Dictionary containing success status and interaction type
         """
         # Validate media_type
-        if media_type not in ['videos', 'audios', 'images']:
-            raise ValueError("media_type must be one of: videos, audios, images")
+        if media_type not in _VALID_MEDIA_TYPES:
+            raise ValueError(_MEDIA_TYPE_MSG)
         
         payload = {
             'stock_id': stock_id,
@@ -484,7 +651,7 @@ class StockClient(BaseClient):
         
         return self._make_request(
             'POST',
-            f"{self.stock_url}/like",
+            self._stock_urls["like"],
             data=payload,
             **kwargs
         )
@@ -501,8 +668,8 @@ class StockClient(BaseClient):
             Dictionary containing success status and interaction type
         """
         # Validate media_type
-        if media_type not in ['videos', 'audios', 'images']:
-            raise ValueError("media_type must be one of: videos, audios, images")
+        if media_type not in _VALID_MEDIA_TYPES:
+            raise ValueError(_MEDIA_TYPE_MSG)
         
         payload = {
             'stock_id': stock_id,
@@ -511,7 +678,7 @@ class StockClient(BaseClient):
         
         return self._make_request(
             'POST',
-            f"{self.stock_url}/dislike",
+            self._stock_urls["dislike"],
             data=payload,
             **kwargs
         )
@@ -528,8 +695,8 @@ class StockClient(BaseClient):
             Dictionary containing success status and interaction type (null)
         """
         # Validate media_type
-        if media_type not in ['videos', 'audios', 'images']:
-            raise ValueError("media_type must be one of: videos, audios, images")
+        if media_type not in _VALID_MEDIA_TYPES:
+            raise ValueError(_MEDIA_TYPE_MSG)
         
         payload = {
             'stock_id': stock_id,
@@ -538,7 +705,7 @@ class StockClient(BaseClient):
         
         return self._make_request(
             'POST',
-            f"{self.stock_url}/remove_interaction",
+            self._stock_urls["remove_interaction"],
             data=payload,
             **kwargs
         )
@@ -1,12 +1,59 @@
 import os
-import json
-import requests
+import copy
+import base64
+import hashlib
 import time
-from typing import Dict, List, Optional, Union, Any, Tuple, BinaryIO
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, BinaryIO, Iterator
 import mimetypes
-from urllib.parse import urljoin
-import warnings
-from .base_client import BaseClient
+from concurrent.futures import ThreadPoolExecutor
+from .base_client import BaseClient, _BOOL_STR, _json_key, _merge_batches, _signed_urls_expiry, _SIGNED_URL_MIN_VALIDITY
+
+# Storage API endpoints, relative to /storage
+_STORAGE_SUBPATHS = (
+    "upload/create_link", "upload/complete", "folder/contents", "folder/create", "folder/delete",
+    "folder/rename", "tree", "folder/list", "folder/search-by-name", "folder/vector-search",
+    "file/analysis", "file/delete", "file/rename", "file/move", "file/download", "file/download/original",
+    "file/reprocess", "files/get_by_ids", "storage/usage"
+)
+
+def _file_sha256(file_path: str) -> str:
+    """Base64-encoded SHA-256 digest of a file, as S3 expects in x-amz-checksum-sha256."""
+    with open(file_path, 'rb') as file_data:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+, hashes in C without Python-level copies
+            digest = hashlib.file_digest(file_data, "sha256")
+        else:
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: file_data.read(1024 * 1024), b""):
+                digest.update(chunk)
+    return base64.b64encode(digest.digest()).decode("ascii")
+
+# Methods that search_batch can run
+_BATCH_SEARCH_METHODS = ("search_files_by_name", "vector_search")
+
+# Default seconds a response of each read method is reused when the storage cache is enabled
+_STORAGE_CACHE_TTLS = {
+    "get_folder_contents": 5.0,
+    "get_folder_tree": 5.0,
+    "list_folders": 5.0,
+    "get_file_analysis": 5.0,
+    "get_storage_usage": 60.0,
+}
+
+# Upper bound on cached storage responses per client
+_STORAGE_CACHE_MAX_ENTRIES = 256
+
+# File extensions accepted for upload, by media kind
+_ALLOWED_FORMATS = {
+    'VIDEO': ['mp4'],
+    'AUDIO': ['mp3', 'wav'],
+    'IMAGE': ['jpg', 'jpeg', 'png']
+}
+
+def _analysis_finished(analysis: Dict) -> bool:
+    """Whether a file analysis response is final, i.e. safe to cache while processing is not polled."""
+    return (analysis.get("analysis_data") or {}).get("status") in ("COMPLETED", "FAILED")
 
 class StorageClient(BaseClient):
     """
@@ -14,7 +61,9 @@ class StorageClient(BaseClient):
     Provides methods for managing files, folders, and storage resources.
     """
     
-    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None):
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinezads.com", default_org_id: str = None,
+                 transport: str = "requests", storage_cache: bool = False, cache_ttl_overrides: Optional[Dict[str, float]] = None,
+                 compression_threshold: Optional[int] = None):
         """
         Initialize the StorageClient.
         
@@ -23,16 +72,37 @@ class StorageClient(BaseClient):
             api_secret: Your Storylinez API Secret
             base_url: Base URL for the API (defaults to production)
             default_org_id: Default organization ID to use for all API calls (optional)
+            transport: "requests" (default) or "httpx" to send the upload link, completion and other API
+                       calls over one multiplexed HTTP/2 connection (transfers to the pre-signed
+                       upload URL always use requests)
+            storage_cache: Reuse recent responses of get_folder_contents, get_folder_tree, list_folders,
+                           get_file_analysis and get_storage_usage for a few seconds (60 for storage usage).
+                           Any change made through this client clears the cache.
+            cache_ttl_overrides: Seconds to cache each of those methods for, by method name
+                                 (e.g. {"get_storage_usage": 300}); 0 disables caching for a method
+            compression_threshold: Gzip JSON request bodies larger than this many bytes, e.g. 1024 for
+                                   vector_search calls with many queries or large get_files_by_ids
+                                   batches (None, the default, sends bodies uncompressed)
         """
-        super().__init__(api_key, api_secret, base_url, default_org_id)
+        super().__init__(api_key, api_secret, base_url, default_org_id, transport)
+        self.compression_threshold = compression_threshold
         self.storage_url = f"{self.base_url}/storage"
+        self._storage_urls = {subpath: f"{self.storage_url}/{subpath}" for subpath in _STORAGE_SUBPATHS}
+        # These lookups are sent as POSTs but change nothing, so a rate-limited one can be resent
+        self._mount_idempotent_endpoints(self._storage_urls["files/get_by_ids"],
+                                         self._storage_urls["folder/vector-search"])
+        
+        unknown = set(cache_ttl_overrides or {}) - set(_STORAGE_CACHE_TTLS)
+        if unknown:
+            raise ValueError(f"Unknown cache_ttl_overrides method(s): {', '.join(sorted(unknown))}. "
+                             f"Valid values are: {', '.join(_STORAGE_CACHE_TTLS)}")
+        self._cache_ttls = dict(_STORAGE_CACHE_TTLS, **(cache_ttl_overrides or {})) if storage_cache else {}
+        self._storage_cache = OrderedDict()  # request key -> (stored_at, response, signed URL expiry or None)
+        self._storage_etags = OrderedDict()  # request key -> {"etag": ..., "body": ...}
+        self._storage_cache_lock = threading.Lock()
         
         # Define allowed media formats
-        self.allowed_formats = {
-            'VIDEO': ['mp4'],
-            'AUDIO': ['mp3', 'wav'], 
-            'IMAGE': ['jpg', 'jpeg', 'png']
-        }
+        self.allowed_formats = {kind: list(extensions) for kind, extensions in _ALLOWED_FORMATS.items()}
     
     # Helper method to validate file extensions
     def _validate_file_extension(self, filename: str) -> str:
@@ -62,14 +132,73 @@ class StorageClient(BaseClient):
             
         return extension
     
-    # Helper methods
-    def _require_org_id(self, org_id: str = None) -> str:
-        """Helper to require an org_id, using default if available"""
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
-        return org_id
+    # Response caching
+    
+    def _cached_get(self, name: str, subpath: str, params: Dict, cacheable=None) -> Dict:
+        """
+        Send a read-only GET, reusing a response younger than the TTL configured for method `name`.
+        
+        As with the stock cache, a response containing signed URLs is only reused while all of
+        them stay valid for at least _SIGNED_URL_MIN_VALIDITY seconds, and one with streamable or
+        download links of unknown expiry is not cached. Neither are responses for which
+        cacheable(response) returns False.
+        
+        Whether or not the cache is enabled, a repeated request without signed links sends the
+        ETag of the previous response, so an unchanged listing isn't downloaded again.
+        """
+        url = self._storage_urls[subpath]
+        ttl = self._cache_ttls.get(name, 0)
+        key = self._request_key("GET", url, params)
+        signed = params.get("generate_streamable") == "true" or params.get("generate_download") == "true"
+        validator = None
+        with self._storage_cache_lock:
+            entry = self._storage_cache.get(key) if ttl > 0 else None
+            if entry is not None:
+                if entry[2] is not None and entry[2] - time.time() < _SIGNED_URL_MIN_VALIDITY:
+                    del self._storage_cache[key]
+                elif time.monotonic() - entry[0] < ttl:
+                    self._storage_cache.move_to_end(key)
+                    return copy.deepcopy(entry[1])
+            # A 304 would hand back the stored body, whose signed links may have expired since
+            if not signed:
+                validator = self._storage_validator(key)
+        
+        result = self._make_request("GET", url, params=params, validator=validator)
+        if ttl <= 0:
+            return result
+        expiry = _signed_urls_expiry(result)
+        if (cacheable is None or cacheable(result)) and not (signed and expiry is None):
+            with self._storage_cache_lock:
+                self._storage_cache.pop(key, None)
+                self._storage_cache[key] = (time.monotonic(), copy.deepcopy(result), expiry)
+                while len(self._storage_cache) > _STORAGE_CACHE_MAX_ENTRIES:
+                    self._storage_cache.popitem(last=False)
+        return result
+    
+    def _storage_validator(self, key: tuple) -> Dict:
+        """Return the ETag entry for a read request, creating it if needed (call with the cache lock held)."""
+        validator = self._storage_etags.pop(key, None)
+        if validator is None:
+            validator = {}
+        self._storage_etags[key] = validator
+        while len(self._storage_etags) > _STORAGE_CACHE_MAX_ENTRIES:
+            self._storage_etags.popitem(last=False)
+        return validator
+    
+    def _send_change(self, method: str, subpath: str, **kwargs) -> Dict:
+        """Send a request that modifies storage, then drop cached responses it may have made stale."""
+        try:
+            return self._make_request(method, self._storage_urls[subpath], **kwargs)
+        finally:
+            self.invalidate_storage_cache()
     
+    def invalidate_storage_cache(self) -> None:
+        """Drop all cached storage responses and ETags (see the storage_cache constructor argument)."""
+        with self._storage_cache_lock:
+            self._storage_cache.clear()
+            self._storage_etags.clear()
+    
+    # Helper methods
     def _validate_path(self, path: str) -> str:
         """Ensure path starts with / and doesn't end with / unless it's the root"""
         if not path:
@@ -183,7 +312,7 @@ class StorageClient(BaseClient):
     
     def _convert_bool_to_str(self, value: bool) -> str:
         """Convert boolean to lowercase string for API"""
-        return str(value).lower()
+        return _BOOL_STR[bool(value)]
     
     # File Upload Methods
     def generate_upload_link(self, 
@@ -227,7 +356,7 @@ class StorageClient(BaseClient):
             "folder_path": folder_path
         }
         
-        return self._make_request("GET", f"{self.storage_url}/upload/create_link", params=params)
+        return self._make_request("GET", self._storage_urls["upload/create_link"], params=params, coalesce=False)
     
     def upload_file(self, 
                 file_path: str, 
@@ -243,6 +372,8 @@ class StorageClient(BaseClient):
                 eco: bool = False,
                 temperature: float = 0.7,
                 org_id: str = None,
+                upload_info: Dict = None,
+                verify_integrity: bool = False,
                 **kwargs) -> Dict:
         """
         Upload a file to Storylinez storage.
@@ -262,6 +393,9 @@ class StorageClient(BaseClient):
             eco: Use eco-friendly processing
             temperature: AI temperature (0.0-1.0)
             org_id: Organization ID (uses default if not provided)
+            upload_info: Response of generate_upload_link for this file, if it was requested in advance
+            verify_integrity: Send the file's SHA-256 checksum with the upload (x-amz-checksum-sha256),
+                              so storage rejects the transfer if any byte arrived corrupted
             **kwargs: Additional parameters for backwards compatibility
         
         Returns:
@@ -284,12 +418,13 @@ class StorageClient(BaseClient):
             raise ValueError("Temperature must be between 0.0 and 1.0")
             
         # Generate upload link
-        upload_info = self.generate_upload_link(
-            filename=filename,
-            file_size=file_size,
-            folder_path=folder_path,
-            org_id=org_id
-        )
+        if upload_info is None:
+            upload_info = self.generate_upload_link(
+                filename=filename,
+                file_size=file_size,
+                folder_path=folder_path,
+                org_id=org_id
+            )
         
         # Upload the file to the pre-signed URL
         upload_link = upload_info.get("upload_link")
@@ -298,6 +433,8 @@ class StorageClient(BaseClient):
         if not upload_link or not upload_id:
             raise Exception("Failed to generate upload link")
         
+        checksum = _file_sha256(file_path) if verify_integrity and file_size > 0 else None
+        
         # Handle S3 presigned POST uploads (most common case)
         if isinstance(upload_link, dict):
             # S3 presigned POST format: {"url": "...", "fields": {...}}
@@ -307,11 +444,14 @@ class StorageClient(BaseClient):
             if not s3_url:
                 raise Exception("Invalid upload link format: missing URL")
             
+            if checksum:
+                s3_fields = dict(s3_fields, **{'x-amz-checksum-sha256': checksum})
+            
             # Prepare multipart form data for S3 POST
             with open(file_path, 'rb') as file_data:
                 # S3 requires the file field to be last in the form
                 files = {'file': (filename, file_data, s3_fields.get('Content-Type', 'application/octet-stream'))}
-                upload_response = requests.post(s3_url, data=s3_fields, files=files)
+                upload_response = self._upload_session().post(s3_url, data=s3_fields, files=files)
                 
                 if upload_response.status_code not in [200, 204]:
                     raise Exception(f"File upload failed with status {upload_response.status_code}: {upload_response.text}")
@@ -323,7 +463,9 @@ class StorageClient(BaseClient):
             
             with open(file_path, 'rb') as file_data:
                 headers = {'Content-Type': content_type}
-                upload_response = requests.put(upload_link, data=file_data, headers=headers)
+                if checksum:
+                    headers['x-amz-checksum-sha256'] = checksum
+                upload_response = self._upload_session().put(upload_link, data=file_data, headers=headers)
                 
                 if upload_response.status_code not in [200, 204]:
                     raise Exception(f"File upload failed with status {upload_response.status_code}: {upload_response.text}")
@@ -352,7 +494,74 @@ class StorageClient(BaseClient):
                 completion_data[key] = value
         
         # Mark upload as complete and start processing
-        return self._make_request("POST", f"{self.storage_url}/upload/complete", json_data=completion_data)
+        return self._send_change("POST", "upload/complete", json_data=completion_data)
+    
+    def upload_files(self, file_paths: List[str], max_workers: int = 4, **kwargs) -> List[Dict]:
+        """
+        Upload several files concurrently with upload_file.
+        
+        Unlike upload_and_process_files_bulk, this does not wait for processing to finish.
+        
+        Args:
+            file_paths: Paths of the files on local disk
+            max_workers: Maximum number of uploads in flight at once
+            **kwargs: Arguments for upload_file shared by every file (folder_path, context, tags, ...)
+            
+        Returns:
+            List of upload results in the same order as `file_paths`.
+            A file that could not be uploaded is represented by a dictionary with an "error" key.
+        """
+        if not isinstance(file_paths, list):
+            raise TypeError("file_paths must be a list of strings")
+        return self._fan_out(lambda file_path: self.upload_file(file_path, **kwargs), file_paths, max_workers,
+                             error_key="file_path")
+    
+    def upload_files_prefetch(self, file_paths: List[str], folder_path: str = "/", org_id: str = None,
+                              **kwargs) -> List[Dict]:
+        """
+        Upload files one after another, requesting each file's upload link while the previous
+        file is still being transferred.
+        
+        Use this instead of upload_files when uploads should not compete for bandwidth or must
+        complete in order; the link request no longer adds a round trip between files.
+        
+        Args:
+            file_paths: Paths of the files on local disk
+            folder_path: Target folder path (defaults to root)
+            org_id: Organization ID (uses default if not provided)
+            **kwargs: Arguments for upload_file shared by every file (context, tags, ...)
+            
+        Returns:
+            List of upload results in the same order as `file_paths`.
+            A file that could not be uploaded is represented by a dictionary with an "error" key.
+        """
+        if not isinstance(file_paths, list):
+            raise TypeError("file_paths must be a list of strings")
+        org_id = self._require_org_id(org_id)
+        folder_path = self._validate_path(folder_path)
+        
+        def presign(file_path: str) -> Dict:
+            return self.generate_upload_link(
+                filename=os.path.basename(file_path),
+                file_size=self._validate_file_exists(file_path),
+                folder_path=folder_path,
+                org_id=org_id
+            )
+        
+        results = []
+        pending = None
+        for index, file_path in enumerate(file_paths):
+            current, pending = pending, None
+            if index + 1 < len(file_paths):
+                with self._prefetch_lock:
+                    pending = self._background_pool().submit(presign, file_paths[index + 1])
+            try:
+                upload_info = current.result() if current is not None else presign(file_path)
+                results.append(self.upload_file(file_path, folder_path=folder_path, org_id=org_id,
+                                                upload_info=upload_info, **kwargs))
+            except Exception as e:
+                results.append({"file_path": file_path, "error": str(e)})
+        return results
     
     def upload_and_process_files_bulk(
         self,
@@ -753,14 +962,14 @@ class StorageClient(BaseClient):
             
             # Prepare multipart form data for S3 POST
             files = {'file': (filename, file_data, s3_fields.get('Content-Type', content_type))}
-            upload_response = requests.post(s3_url, data=s3_fields, files=files)
+            upload_response = self._upload_session().post(s3_url, data=s3_fields, files=files)
             
             if upload_response.status_code not in [200, 204]:
                 raise Exception(f"File upload failed with status {upload_response.status_code}: {upload_response.text}")
         else:
             # Simple PUT upload (fallback for simple presigned URLs)
             headers = {'Content-Type': content_type}
-            upload_response = requests.put(upload_link, data=file_data, headers=headers)
+            upload_response = self._upload_session().put(upload_link, data=file_data, headers=headers)
             
             if upload_response.status_code not in [200, 204]:
                 raise Exception(f"File upload failed with status {upload_response.status_code}: {upload_response.text}")
@@ -785,7 +994,7 @@ class StorageClient(BaseClient):
         }
         
         # Mark upload as complete and start processing
-        return self._make_request("POST", f"{self.storage_url}/upload/complete", json_data=completion_data)
+        return self._send_change("POST", "upload/complete", json_data=completion_data)
     
     def mark_upload_complete(self, 
                         upload_id: str, 
@@ -888,7 +1097,7 @@ class StorageClient(BaseClient):
             if key not in data:
                 data[key] = value
         
-        return self._make_request("POST", f"{self.storage_url}/upload/complete", json_data=data)
+        return self._send_change("POST", "upload/complete", json_data=data)
     
     # Folder Methods
     def get_folder_contents(self, 
@@ -919,21 +1128,49 @@ class StorageClient(BaseClient):
         Raises:
             ValueError: If org_id is not provided
         """
+        params = self._folder_contents_params(path, recursive, detailed, generate_thumbnail,
+                                              generate_streamable, generate_download, include_protected, org_id)
+        return self._cached_get("get_folder_contents", "folder/contents", params)
+    
+    def iter_folder_contents(self, path: str = "/", recursive: bool = True, **kwargs) -> Iterator[Tuple[str, Dict]]:
+        """
+        Stream the folders and files of a folder, parsing them as they are downloaded.
+        
+        Useful for walking large hierarchies: entries are available before the whole response
+        has arrived, and the full listing is never held in memory. Requires the optional
+        'stream' extra (ijson). Responses are not cached.
+        
+        Args:
+            path: Folder path
+            recursive: If True (the default), include files from subfolders
+            **kwargs: The other arguments of get_folder_contents (detailed, generate_thumbnail, org_id, ...)
+            
+        Yields:
+            ("folder", folder) and ("file", file) pairs, in the order the API returns them
+        """
+        params = self._folder_contents_params(path, recursive, **kwargs)
+        stream = self._stream_items("GET", self._storage_urls["folder/contents"],
+                                    ("folders.item", "files.item"), params)
+        return (("folder" if prefix == "folders.item" else "file", entry) for prefix, entry in stream)
+    
+    def _folder_contents_params(self, path: str = "/", recursive: bool = False, detailed: bool = False,
+                                generate_thumbnail: bool = True, generate_streamable: bool = False,
+                                generate_download: bool = False, include_protected: bool = False,
+                                org_id: str = None) -> Dict:
+        """Validate get_folder_contents arguments and build its query parameters."""
         org_id = self._require_org_id(org_id)
         path = self._validate_path(path)
             
-        params = {
+        return {
             "org_id": org_id,
             "path": path,
-            "recursive": self._convert_bool_to_str(recursive),
-            "detailed": self._convert_bool_to_str(detailed),
-            "generate_thumbnail": self._convert_bool_to_str(generate_thumbnail),
-            "generate_streamable": self._convert_bool_to_str(generate_streamable),
-            "generate_download": self._convert_bool_to_str(generate_download),
-            "include_protected": self._convert_bool_to_str(include_protected)
+            "recursive": _BOOL_STR[bool(recursive)],
+            "detailed": _BOOL_STR[bool(detailed)],
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)],
+            "include_protected": _BOOL_STR[bool(include_protected)]
         }
-        
-        return self._make_request("GET", f"{self.storage_url}/folder/contents", params=params)
     
     def create_folder(self, 
                     folder_name: str, 
@@ -969,7 +1206,7 @@ class StorageClient(BaseClient):
             "parent_path": parent_path
         }
         
-        return self._make_request("POST", f"{self.storage_url}/folder/create", json_data=data)
+        return self._send_change("POST", "folder/create", json_data=data)
     
     def delete_folder(self, 
                     folder_id: str, 
@@ -992,10 +1229,10 @@ class StorageClient(BaseClient):
             
         params = {
             "folder_id": folder_id,
-            "delete_contents": self._convert_bool_to_str(delete_contents)
+            "delete_contents": _BOOL_STR[bool(delete_contents)]
         }
         
-        return self._make_request("DELETE", f"{self.storage_url}/folder/delete", params=params)
+        return self._send_change("DELETE", "folder/delete", params=params)
     
     def rename_folder(self, 
                     folder_id: str, 
@@ -1027,7 +1264,7 @@ class StorageClient(BaseClient):
             "new_name": new_name
         }
         
-        return self._make_request("PUT", f"{self.storage_url}/folder/rename", json_data=data)
+        return self._send_change("PUT", "folder/rename", json_data=data)
     
     def get_folder_tree(self, 
                     path: str = "/", 
@@ -1053,10 +1290,10 @@ class StorageClient(BaseClient):
         params = {
             "org_id": org_id,
             "path": path,
-            "include_protected": self._convert_bool_to_str(include_protected)
+            "include_protected": _BOOL_STR[bool(include_protected)]
         }
         
-        return self._make_request("GET", f"{self.storage_url}/tree", params=params)
+        return self._cached_get("get_folder_tree", "tree", params)
     
     def list_folders(self, 
                 path: str = "/", 
@@ -1082,10 +1319,10 @@ class StorageClient(BaseClient):
         params = {
             "org_id": org_id,
             "path": path,
-            "recursive": self._convert_bool_to_str(recursive)
+            "recursive": _BOOL_STR[bool(recursive)]
         }
         
-        return self._make_request("GET", f"{self.storage_url}/folder/list", params=params)
+        return self._cached_get("list_folders", "folder/list", params)
     
     def search_files_by_name(self, 
                           query: str, 
@@ -1126,14 +1363,14 @@ class StorageClient(BaseClient):
             "org_id": org_id,
             "path": path,
             "query": query,
-            "recursive": self._convert_bool_to_str(recursive),
-            "detailed": self._convert_bool_to_str(detailed),
-            "generate_thumbnail": self._convert_bool_to_str(generate_thumbnail),
-            "generate_streamable": self._convert_bool_to_str(generate_streamable),
-            "generate_download": self._convert_bool_to_str(generate_download)
+            "recursive": _BOOL_STR[bool(recursive)],
+            "detailed": _BOOL_STR[bool(detailed)],
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)]
         }
         
-        return self._make_request("GET", f"{self.storage_url}/folder/search-by-name", params=params)
+        return self._make_request("GET", self._storage_urls["folder/search-by-name"], params=params)
     
     def vector_search(self, 
                     queries: List[str], 
@@ -1197,10 +1434,10 @@ class StorageClient(BaseClient):
         # Prepare path param - only add if explicitly provided
         params = {
             "org_id": org_id,
-            "detailed": self._convert_bool_to_str(detailed),
-            "generate_thumbnail": self._convert_bool_to_str(generate_thumbnail),
-            "generate_streamable": self._convert_bool_to_str(generate_streamable),
-            "generate_download": self._convert_bool_to_str(generate_download),
+            "detailed": _BOOL_STR[bool(detailed)],
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)],
             "num_results": num_results,
             "similarity_threshold": similarity_threshold,
             "file_types": file_types
@@ -1221,7 +1458,62 @@ class StorageClient(BaseClient):
             "queries": queries
         }
         
-        return self._make_request("POST", f"{self.storage_url}/folder/vector-search", params=params, json_data=data)
+        return self._make_request("POST", self._storage_urls["folder/vector-search"], params=params, json_data=data)
+    
+    @staticmethod
+    def _search_batch_calls(searches: List[Dict]) -> Tuple[List[Tuple[str, Dict]], List[int]]:
+        """Validate search_batch entries; return the distinct (method, kwargs) calls and the call index of each entry."""
+        if not isinstance(searches, list):
+            raise TypeError("searches must be a list of dictionaries")
+        calls, call_index, positions = [], {}, []
+        for spec in searches:
+            if not isinstance(spec, dict) or "method" not in spec:
+                raise TypeError("Each batch entry must be a dictionary with a 'method' key")
+            if spec["method"] not in _BATCH_SEARCH_METHODS:
+                raise ValueError(f"Unsupported batch search method: {spec['method']}. "
+                                 f"Valid methods are: {', '.join(_BATCH_SEARCH_METHODS)}")
+            key = _json_key(spec)
+            if key not in call_index:
+                call_index[key] = len(calls)
+                calls.append((spec["method"], {name: value for name, value in spec.items() if name != "method"}))
+            positions.append(call_index[key])
+        return calls, positions
+    
+    @staticmethod
+    def _spread_results(results: List[Dict], positions: List[int]) -> List[Dict]:
+        """Map the results of the distinct calls back onto the batch entries (repeats get their own copy)."""
+        spread, used = [], set()
+        for position in positions:
+            spread.append(copy.deepcopy(results[position]) if position in used else results[position])
+            used.add(position)
+        return spread
+    
+    def search_batch(self, searches: List[Dict], max_workers: int = 8) -> List[Dict]:
+        """
+        Run several filename and vector searches concurrently over the shared connection pool.
+        
+        Identical entries are searched once and share the result.
+        
+        Args:
+            searches: List of search specifications. Each is a dictionary with a "method" key
+                      ("search_files_by_name" or "vector_search") plus that method's keyword arguments
+            max_workers: Maximum number of searches in flight at once
+            
+        Returns:
+            List of search results in the same order as `searches`.
+            A search that failed is represented by a dictionary with an "error" key.
+            
+        Example:
+            >>> by_name, by_meaning = client.search_batch([
+            ...     {"method": "search_files_by_name", "query": "intro", "path": "/videos"},
+            ...     {"method": "vector_search", "queries": ["sunset over the sea"], "path": "/videos"}
+            ... ])
+        """
+        calls, positions = self._search_batch_calls(searches)
+        if not calls:
+            return []
+        results = self._fan_out(lambda call: getattr(self, call[0])(**call[1]), calls, max_workers)
+        return self._spread_results(results, positions)
     
     # File Methods
     def get_file_analysis(self, 
@@ -1251,13 +1543,13 @@ class StorageClient(BaseClient):
             
         params = {
             "file_id": file_id,
-            "detailed": self._convert_bool_to_str(detailed),
-            "generate_thumbnail": self._convert_bool_to_str(generate_thumbnail),
-            "generate_streamable": self._convert_bool_to_str(generate_streamable),
-            "generate_download": self._convert_bool_to_str(generate_download)
+            "detailed": _BOOL_STR[bool(detailed)],
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)]
         }
         
-        return self._make_request("GET", f"{self.storage_url}/file/analysis", params=params)
+        return self._cached_get("get_file_analysis", "file/analysis", params, cacheable=_analysis_finished)
     
     def delete_file(self, file_id: str) -> Dict:
         """
@@ -1279,7 +1571,7 @@ class StorageClient(BaseClient):
             "file_id": file_id
         }
         
-        return self._make_request("DELETE", f"{self.storage_url}/file/delete", params=params)
+        return self._send_change("DELETE", "file/delete", params=params)
     
     def rename_file(self, 
                   file_id: str, 
@@ -1308,7 +1600,7 @@ class StorageClient(BaseClient):
             "new_name": new_name
         }
         
-        return self._make_request("PUT", f"{self.storage_url}/file/rename", json_data=data)
+        return self._send_change("PUT", "file/rename", json_data=data)
     
     def move_file(self, 
                 file_id: str, 
@@ -1339,7 +1631,7 @@ class StorageClient(BaseClient):
             "target_folder_path": target_folder_path
         }
         
-        return self._make_request("PUT", f"{self.storage_url}/file/move", json_data=data)
+        return self._send_change("PUT", "file/move", json_data=data)
     
     def get_download_link(self, file_id: str) -> Dict:
         """
@@ -1361,7 +1653,7 @@ class StorageClient(BaseClient):
             "file_id": file_id
         }
         
-        return self._make_request("GET", f"{self.storage_url}/file/download", params=params)
+        return self._make_request("GET", self._storage_urls["file/download"], params=params)
     
     def get_original_download_link(self, file_id: str) -> Dict:
         """
@@ -1383,7 +1675,7 @@ class StorageClient(BaseClient):
             "file_id": file_id
         }
         
-        return self._make_request("GET", f"{self.storage_url}/file/download/original", params=params)
+        return self._make_request("GET", self._storage_urls["file/download/original"], params=params)
     
     def reprocess_file(self, 
                      file_id: str,
@@ -1464,7 +1756,7 @@ class StorageClient(BaseClient):
             if key not in data:
                 data[key] = value
         
-        return self._make_request("POST", f"{self.storage_url}/file/reprocess?file_id={file_id}", json_data=data)
+        return self._send_change("POST", "file/reprocess", params={"file_id": file_id}, json_data=data)
     
     def get_files_by_ids(self, 
                        file_ids: List[str], 
@@ -1476,6 +1768,8 @@ class StorageClient(BaseClient):
         """
         Get details for multiple files by their IDs.
         
+        To fetch more than 100 files, use get_many_files.
+        
         Args:
             file_ids: List of file IDs to retrieve
             detailed: If True, include full analysis data
@@ -1503,17 +1797,52 @@ class StorageClient(BaseClient):
             
         params = {
             "org_id": org_id,
-            "detailed": self._convert_bool_to_str(detailed),
-            "generate_thumbnail": self._convert_bool_to_str(generate_thumbnail),
-            "generate_streamable": self._convert_bool_to_str(generate_streamable),
-            "generate_download": self._convert_bool_to_str(generate_download)
+            "detailed": _BOOL_STR[bool(detailed)],
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)]
         }
         
         data = {
             "file_ids": file_ids
         }
         
-        return self._make_request("POST", f"{self.storage_url}/files/get_by_ids", params=params, json_data=data)
+        return self._make_request("POST", self._storage_urls["files/get_by_ids"], params=params, json_data=data)
+    
+    @staticmethod
+    def _file_id_batches(file_ids: List[str], chunk_size: int) -> List[List[str]]:
+        """De-duplicate file IDs (keeping first occurrences) and split them into get_files_by_ids batches."""
+        if not isinstance(file_ids, list) or not file_ids:
+            raise ValueError("file_ids must be a non-empty list")
+        if not 1 <= chunk_size <= 100:
+            raise ValueError("chunk_size must be between 1 and 100")
+        unique_ids = list(dict.fromkeys(file_ids))
+        return [unique_ids[i:i + chunk_size] for i in range(0, len(unique_ids), chunk_size)]
+    
+    def get_many_files(self, file_ids: List[str], chunk_size: int = 100, max_workers: int = 4, **kwargs) -> Dict:
+        """
+        Get details for any number of files, using as few get_files_by_ids requests as possible.
+        
+        Duplicate IDs are requested once, and the batches are fetched concurrently over the
+        shared connection pool.
+        
+        Args:
+            file_ids: List of file IDs to retrieve
+            chunk_size: Number of files per get_files_by_ids request (at most 100)
+            max_workers: Maximum number of batches fetched at once
+            **kwargs: Additional arguments for get_files_by_ids (detailed, generate_thumbnail, org_id, ...)
+            
+        Returns:
+            Dictionary with the same shape as a get_files_by_ids response, with the list fields of
+            all batches concatenated in request order
+        """
+        batches = self._file_id_batches(file_ids, chunk_size)
+        if len(batches) == 1:
+            return self.get_files_by_ids(batches[0], **kwargs)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            results = list(executor.map(lambda batch: self.get_files_by_ids(batch, **kwargs), batches))
+        return _merge_batches(results)
     
     def get_storage_usage(self, org_id: str = None) -> Dict:
         """
@@ -1534,7 +1863,7 @@ class StorageClient(BaseClient):
             "org_id": org_id
         }
         
-        return self._make_request("GET", f"{self.storage_url}/storage/usage", params=params)
+        return self._cached_get("get_storage_usage", "storage/usage", params)
 
     # Advanced helper methods and workflows
 
@@ -1,10 +1,19 @@
 import os
 import json
-import requests
+import threading
 import warnings
+from collections import OrderedDict
 from typing import Dict, List, Optional, Union, Any, Tuple
 from datetime import datetime
-from .base_client import BaseClient
+from .base_client import BaseClient, _BOOL_STR, _json_loads, _edit_supersedes
+
+_VOICEOVER_MODES = frozenset(("generated", "uploaded"))
+_ARRAY_TYPES = frozenset(("videos", "background_music"))
+_ITEM_TYPES = frozenset(("videos", "background_music", "voiceover"))
+_HISTORY_TYPES = frozenset(("update", "generation", "prompt", "selfupdate", "media_change"))
+
+# Maximum number of responses kept by the storyboard cache
+_STORYBOARD_CACHE_MAX_ENTRIES = 256
 
 class StoryboardClient(BaseClient):
     """
@@ -18,7 +27,8 @@ class StoryboardClient(BaseClient):
     - Alternate between manual edits and AI-guided changes
     """
     
-    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinez.com", default_org_id: str = None):
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.storylinez.com", default_org_id: str = None,
+                 transport: str = "requests", storyboard_cache_ttl: float = 0, storyboard_cache_stale_ttl: float = 0):
         """
         Initialize the StoryboardClient.
         
@@ -27,9 +37,43 @@ class StoryboardClient(BaseClient):
             api_secret: Your Storylinez API Secret
             base_url: Base URL for the API (defaults to production)
             default_org_id: Default organization ID to use for all API calls (optional)
+            transport: "requests" (default) or "httpx" to multiplex concurrent storyboard calls over a shared
+                       HTTP/2 connection (requires the 'async' extra)
+            storyboard_cache_ttl: Seconds a get_storyboard, get_storyboard_history or get_storyboard_media
+                                  response is reused as-is (0 disables caching). Any change made through
+                                  this client, or a generation job seen completing, clears the cache.
+            storyboard_cache_stale_ttl: Age in seconds up to which an older cached response is still returned
+                                        immediately while a fresh copy is fetched in the background
+                                        (stale-while-revalidate); must not be below storyboard_cache_ttl
+                                        to have an effect
         """
-        super().__init__(api_key, api_secret, base_url, default_org_id)
+        super().__init__(api_key, api_secret, base_url, default_org_id, transport)
         self.storyboard_url = f"{self.base_url}/storyboard"
+        self._storyboard_cache_ttl = storyboard_cache_ttl
+        self._storyboard_cache_stale_ttl = storyboard_cache_stale_ttl
+        self._storyboard_cache = OrderedDict()  # request key -> (stored_at, response, signed URL expiry or None)
+        self._storyboard_refreshing = set()  # request keys with a background refresh in progress
+        self._storyboard_cache_lock = threading.Lock()
+    
+    # Response caching
+    
+    def _cached_get(self, url: str, params: Dict) -> Dict:
+        """Send a read-only GET through the stale-while-revalidate cache (see BaseClient._swr_request)."""
+        return self._swr_request(self._storyboard_cache, self._storyboard_cache_lock, self._storyboard_refreshing,
+                                 self._storyboard_cache_ttl, self._storyboard_cache_stale_ttl,
+                                 _STORYBOARD_CACHE_MAX_ENTRIES, "GET", url, params)
+    
+    def _send_change(self, method: str, url: str, **kwargs) -> Dict:
+        """Send a request that modifies a storyboard, then drop cached reads that may now be stale."""
+        try:
+            return self._make_request(method, url, **kwargs)
+        finally:
+            self.invalidate_storyboard_cache()
+    
+    def invalidate_storyboard_cache(self) -> None:
+        """Drop all cached storyboard responses (see the storyboard_cache_ttl constructor argument)."""
+        with self._storyboard_cache_lock:
+            self._storyboard_cache.clear()
     
     # Storyboard Creation and Management
     
@@ -103,7 +147,7 @@ class StoryboardClient(BaseClient):
                 raise ValueError("full_length must be a positive integer")
                 
         voiceover_mode = str(voiceover_mode).lower()
-        if voiceover_mode not in ["generated", "uploaded"]:
+        if voiceover_mode not in _VOICEOVER_MODES:
             raise ValueError("voiceover_mode must be either 'generated' or 'uploaded'")
             
         if voiceover_mode == "uploaded":
@@ -140,7 +184,7 @@ class StoryboardClient(BaseClient):
                 data[key] = value
         
         params = {"include_details": "false"}
-        return self._make_request("POST", f"{self.storyboard_url}/create", params=params, json_data=data)
+        return self._send_change("POST", f"{self.storyboard_url}/create", params=params, json_data=data)
     
     def get_storyboard(
         self, 
@@ -171,8 +215,8 @@ class StoryboardClient(BaseClient):
             raise ValueError("Either storyboard_id or project_id must be provided")
             
         params = {
-            "include_results": str(bool(include_results)).lower(),
-            "include_details": str(bool(include_details)).lower()
+            "include_results": _BOOL_STR[bool(include_results)],
+            "include_details": _BOOL_STR[bool(include_details)]
         }
         
         if storyboard_id:
@@ -185,7 +229,7 @@ class StoryboardClient(BaseClient):
             if key not in params:
                 params[key] = value
             
-        return self._make_request("GET", f"{self.storyboard_url}/get", params=params)
+        return self._cached_get(f"{self.storyboard_url}/get", params)
     
     def update_storyboard(
         self, 
@@ -229,7 +273,7 @@ class StoryboardClient(BaseClient):
             if key not in data:
                 data[key] = value
             
-        return self._make_request("PUT", f"{self.storyboard_url}/selfupdate", json_data=data)
+        return self._send_change("PUT", f"{self.storyboard_url}/selfupdate", json_data=data)
     
     def update_storyboard_values(
         self, 
@@ -301,17 +345,11 @@ class StoryboardClient(BaseClient):
                 warnings.warn("Empty regeneration_prompt was provided. This may not have the expected effect.")
             data["regeneration_prompt"] = str(regeneration_prompt)
             
-        if deepthink is not None:
-            data["deepthink"] = bool(deepthink)
-            
-        if overdrive is not None:
-            data["overdrive"] = bool(overdrive)
-            
-        if web_search is not None:
-            data["web_search"] = bool(web_search)
-            
-        if eco is not None:
-            data["eco"] = bool(eco)
+        # Plain on/off settings are only sent when given
+        data.update({key: bool(value) for key, value in (
+            ("deepthink", deepthink), ("overdrive", overdrive), ("web_search", web_search),
+            ("eco", eco), ("skip_voiceover", skip_voiceover)
+        ) if value is not None})
             
         if temperature is not None:
             try:
@@ -344,12 +382,9 @@ class StoryboardClient(BaseClient):
             except (TypeError, ValueError):
                 raise ValueError("full_length must be a positive integer")
             
-        if skip_voiceover is not None:
-            data["skip_voiceover"] = bool(skip_voiceover)
-            
         if voiceover_mode is not None:
             voiceover_mode = str(voiceover_mode).lower()
-            if voiceover_mode not in ["generated", "uploaded"]:
+            if voiceover_mode not in _VOICEOVER_MODES:
                 raise ValueError("voiceover_mode must be either 'generated' or 'uploaded'")
             data["voiceover_mode"] = voiceover_mode
             
@@ -369,7 +404,7 @@ class StoryboardClient(BaseClient):
             if key not in data:
                 data[key] = value
             
-        return self._make_request("PUT", f"{self.storyboard_url}/update", json_data=data)
+        return self._send_change("PUT", f"{self.storyboard_url}/update", json_data=data)
     
     def redo_storyboard(
         self, 
@@ -426,40 +461,16 @@ class StoryboardClient(BaseClient):
             if key not in data:
                 data[key] = value
             
-        return self._make_request("POST", f"{self.storyboard_url}/redo", json_data=data)
+        return self._send_change("POST", f"{self.storyboard_url}/redo", json_data=data)
     
-    def reorder_storyboard_items(
-        self, 
-        storyboard_id: str, 
-        array_type: str, 
-        new_order: List[int],
-        **kwargs
-    ) -> Dict:
-        """
-        Reorder items in a storyboard array.
-        
-        Args:
-            storyboard_id: ID of the storyboard to update
-            array_type: Type of array to reorder ('videos' or 'background_music')
-            new_order: List of indices in the new order
-            **kwargs: Additional parameters to pass to the API
-            
-        Returns:
-            Dictionary with operation result
-            
-        Raises:
-            ValueError: If parameters are invalid
-            requests.exceptions.RequestException: If the API request fails
-            
-        Note:
-            The new_order must contain all indices from 0 to n-1 where n is the 
-            number of items in the array, with no duplicates.
-        """
+    @staticmethod
+    def _reorder_payload(storyboard_id: str, array_type: str, new_order: List[int], **kwargs) -> Dict:
+        """Validate a reorder operation and build its request body"""
         if not storyboard_id:
             raise ValueError("storyboard_id is required")
             
         array_type = str(array_type).lower()
-        if array_type not in ['videos', 'background_music']:
+        if array_type not in _ARRAY_TYPES:
             raise ValueError("array_type must be either 'videos' or 'background_music'")
             
         if not isinstance(new_order, list):
@@ -487,25 +498,23 @@ class StoryboardClient(BaseClient):
         for key, value in kwargs.items():
             if key not in data:
                 data[key] = value
-            
-        return self._make_request("PUT", f"{self.storyboard_url}/reorder", json_data=data)
+        
+        return data
     
-    def edit_storyboard_item(
+    def reorder_storyboard_items(
         self, 
         storyboard_id: str, 
-        item_type: str, 
-        updated_item: Dict,
-        item_index: Optional[int] = None,
+        array_type: str, 
+        new_order: List[int],
         **kwargs
     ) -> Dict:
         """
-        Edit an item in a storyboard.
+        Reorder items in a storyboard array.
         
         Args:
             storyboard_id: ID of the storyboard to update
-            item_type: Type of item to edit ('videos', 'background_music', or 'voiceover')
-            updated_item: Updated item data structure
-            item_index: Index of the item to update (required for 'videos' and 'background_music')
+            array_type: Type of array to reorder ('videos' or 'background_music')
+            new_order: List of indices in the new order
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -516,9 +525,16 @@ class StoryboardClient(BaseClient):
             requests.exceptions.RequestException: If the API request fails
             
         Note:
-            For 'videos' and 'background_music', item_index is required.
-            For 'voiceover', item_index is not used as there is only one voiceover object.
+            The new_order must contain all indices from 0 to n-1 where n is the 
+            number of items in the array, with no duplicates.
         """
+        data = self._reorder_payload(storyboard_id, array_type, new_order, **kwargs)
+        return self._send_change("PUT", f"{self.storyboard_url}/reorder", json_data=data)
+    
+    @staticmethod
+    def _edit_item_payload(storyboard_id: str, item_type: str, updated_item: Dict, item_index: Optional[int] = None,
+                           **kwargs) -> Dict:
+        """Validate an item edit and build its request body"""
         if not storyboard_id:
             raise ValueError("storyboard_id is required")
             
@@ -526,7 +542,7 @@ class StoryboardClient(BaseClient):
             raise ValueError("updated_item is required and cannot be empty")
             
         item_type = str(item_type).lower()
-        if item_type not in ['videos', 'background_music', 'voiceover']:
+        if item_type not in _ITEM_TYPES:
             raise ValueError("item_type must be one of: 'videos', 'background_music', 'voiceover'")
             
         if item_type != 'voiceover' and item_index is None:
@@ -536,7 +552,7 @@ class StoryboardClient(BaseClient):
             raise ValueError("updated_item must be a dictionary")
             
         # Validate required fields for different item types
-        if item_type in ['videos', 'background_music']:
+        if item_type in _ARRAY_TYPES:
             if 'dir' not in updated_item:
                 raise ValueError(f"updated_item for {item_type} must contain a 'dir' field with the media path")
                 
@@ -559,29 +575,25 @@ class StoryboardClient(BaseClient):
         for key, value in kwargs.items():
             if key not in data:
                 data[key] = value
-            
-        return self._make_request("PUT", f"{self.storyboard_url}/edit/item", json_data=data)
+        
+        return data
     
-    def change_storyboard_media(
+    def edit_storyboard_item(
         self, 
         storyboard_id: str, 
         item_type: str, 
-        item_index: int,
-        file_id: Optional[str] = None, 
-        stock_id: Optional[str] = None, 
-        path: Optional[str] = None,
+        updated_item: Dict,
+        item_index: Optional[int] = None,
         **kwargs
     ) -> Dict:
         """
-        Change media for an item in a storyboard.
+        Edit an item in a storyboard.
         
         Args:
             storyboard_id: ID of the storyboard to update
-            item_type: Type of item to update ('videos' or 'background_music')
-            item_index: Index of the item to update
-            file_id: ID of the file to use (one of file_id, stock_id, or path must be provided)
-            stock_id: ID of the stock media to use (one of file_id, stock_id, or path must be provided)
-            path: Direct path to the media file (one of file_id, stock_id, or path must be provided)
+            item_type: Type of item to edit ('videos', 'background_music', or 'voiceover')
+            updated_item: Updated item data structure
+            item_index: Index of the item to update (required for 'videos' and 'background_music')
             **kwargs: Additional parameters to pass to the API
             
         Returns:
@@ -592,15 +604,21 @@ class StoryboardClient(BaseClient):
             requests.exceptions.RequestException: If the API request fails
             
         Note:
-            Exactly one of file_id, stock_id, or path must be provided.
-            For 'videos', both video and image files are accepted.
-            For 'background_music', only audio files are accepted.
+            For 'videos' and 'background_music', item_index is required.
+            For 'voiceover', item_index is not used as there is only one voiceover object.
         """
+        data = self._edit_item_payload(storyboard_id, item_type, updated_item, item_index, **kwargs)
+        return self._send_change("PUT", f"{self.storyboard_url}/edit/item", json_data=data)
+    
+    @staticmethod
+    def _change_media_payload(storyboard_id: str, item_type: str, item_index: int, file_id: Optional[str] = None,
+                              stock_id: Optional[str] = None, path: Optional[str] = None, **kwargs) -> Dict:
+        """Validate a media change and build its request body"""
         if not storyboard_id:
             raise ValueError("storyboard_id is required")
             
         item_type = str(item_type).lower()
-        if item_type not in ['videos', 'background_music']:
+        if item_type not in _ARRAY_TYPES:
             raise ValueError("item_type must be either 'videos' or 'background_music'")
             
         try:
@@ -634,8 +652,113 @@ class StoryboardClient(BaseClient):
         for key, value in kwargs.items():
             if key not in data:
                 data[key] = value
+        
+        return data
+    
+    def change_storyboard_media(
+        self, 
+        storyboard_id: str, 
+        item_type: str, 
+        item_index: int,
+        file_id: Optional[str] = None, 
+        stock_id: Optional[str] = None, 
+        path: Optional[str] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        Change media for an item in a storyboard.
+        
+        Args:
+            storyboard_id: ID of the storyboard to update
+            item_type: Type of item to update ('videos' or 'background_music')
+            item_index: Index of the item to update
+            file_id: ID of the file to use (one of file_id, stock_id, or path must be provided)
+            stock_id: ID of the stock media to use (one of file_id, stock_id, or path must be provided)
+            path: Direct path to the media file (one of file_id, stock_id, or path must be provided)
+            **kwargs: Additional parameters to pass to the API
             
-        return self._.make_request("PUT", f"{self.storyboard_url}/change_media", json_data=data)
+        Returns:
+            Dictionary with operation result
+            
+        Raises:
+            ValueError: If parameters are invalid
+            requests.exceptions.RequestException: If the API request fails
+            
+        Note:
+            Exactly one of file_id, stock_id, or path must be provided.
+            For 'videos', both video and image files are accepted.
+            For 'background_music', only audio files are accepted.
+        """
+        data = self._change_media_payload(storyboard_id, item_type, item_index, file_id, stock_id, path, **kwargs)
+        return self._send_change("PUT", f"{self.storyboard_url}/change_media", json_data=data)
+    
+    def apply_storyboard_edits(self, storyboard_id: str, edits: List[Dict]) -> List[Dict]:
+        """
+        Apply several manual edits to a storyboard in one call.
+        
+        Every edit is validated before anything is sent, so a malformed edit late in the
+        list doesn't leave the storyboard half-modified. Consecutive edits that fully replace
+        the same item are merged, keeping only the last one, and the rest are applied in order
+        over the shared connection.
+        
+        Args:
+            storyboard_id: ID of the storyboard to modify
+            edits: List of edits. Each is a dictionary with an "op" key ("reorder", "edit" or
+                   "change_media") plus the arguments of reorder_storyboard_items,
+                   edit_storyboard_item or change_storyboard_media respectively (without storyboard_id)
+            
+        Returns:
+            List with the response of each edit sent, in order
+            
+        Raises:
+            ValueError: If any edit is invalid (nothing is sent in that case)
+            Exception: If an edit fails; edits before it have already been applied
+            
+        Example:
+            apply_storyboard_edits("sb_123", [
+                {"op": "change_media", "item_type": "videos", "item_index": 0, "stock_id": "stock_456"},
+                {"op": "change_media", "item_type": "videos", "item_index": 1, "file_id": "file_789"}
+            ])
+        
+        Notes:
+            Edits run one after another rather than concurrently because a reorder changes
+            the indices that later edits refer to.
+        """
+        return self._send_edits(self._prepare_edits(storyboard_id, edits), self.invalidate_storyboard_cache)
+    
+    def _prepare_edits(self, storyboard_id: str, edits: List[Dict]) -> List[Tuple[str, str, Dict]]:
+        """Validate apply_storyboard_edits entries and return their (op, url, request body), merging superseded ones"""
+        if not isinstance(edits, list):
+            raise TypeError("edits must be a list of dictionaries")
+        
+        prepared = []
+        for index, edit in enumerate(edits):
+            current = self._build_edit(self.storyboard_url, storyboard_id, edit, index)
+            if prepared and _edit_supersedes(prepared[-1], current):
+                prepared[-1] = current
+            else:
+                prepared.append(current)
+        return prepared
+    
+    def get_storyboards(self, storyboard_ids: List[str], max_workers: int = 8, **kwargs) -> Dict[str, Dict]:
+        """
+        Get several storyboards concurrently over the shared connection pool.
+        
+        Args:
+            storyboard_ids: IDs of the storyboards to retrieve (duplicates are fetched once)
+            max_workers: Maximum number of requests in flight at once
+            **kwargs: Arguments for get_storyboard shared by every call (include_results, include_details, ...)
+            
+        Returns:
+            Dictionary mapping each storyboard ID to its get_storyboard response.
+            A storyboard that could not be retrieved maps to a dictionary with an "error" key.
+        """
+        if not isinstance(storyboard_ids, list):
+            raise TypeError("storyboard_ids must be a list of strings")
+        unique_ids = list(dict.fromkeys(storyboard_ids))
+        results = self._fan_out(lambda storyboard_id: self.get_storyboard(storyboard_id=storyboard_id, **kwargs),
+                                unique_ids, max_workers)
+        return dict(zip(unique_ids, results))
     
     # Storyboard History and Media
     
@@ -701,14 +824,14 @@ class StoryboardClient(BaseClient):
             
         if history_type is not None:
             history_type = str(history_type).lower()
-            if history_type not in ['update', 'generation', 'prompt', 'selfupdate', 'media_change']:
+            if history_type not in _HISTORY_TYPES:
                 warnings.warn(f"history_type '{history_type}' is not a standard type. Filter may not work as expected.")
             
         params = {
             "storyboard_id": storyboard_id,
             "page": page,
             "limit": limit,
-            "include_current": str(bool(include_current)).lower()
+            "include_current": _BOOL_STR[bool(include_current)]
         }
         
         if history_type:
@@ -719,7 +842,7 @@ class StoryboardClient(BaseClient):
             if key not in params:
                 params[key] = value
             
-        return self._make_request("GET", f"{self.storyboard_url}/history", params=params)
+        return self._cached_get(f"{self.storyboard_url}/history", params)
     
     def get_storyboard_media(
         self, 
@@ -757,10 +880,10 @@ class StoryboardClient(BaseClient):
             raise ValueError("Either storyboard_id or project_id must be provided")
             
         params = {
-            "include_analysis": str(bool(include_analysis)).lower(),
-            "generate_thumbnail": str(bool(generate_thumbnail)).lower(),
-            "generate_streamable": str(bool(generate_streamable)).lower(),
-            "generate_download": str(bool(generate_download)).lower()
+            "include_analysis": _BOOL_STR[bool(include_analysis)],
+            "generate_thumbnail": _BOOL_STR[bool(generate_thumbnail)],
+            "generate_streamable": _BOOL_STR[bool(generate_streamable)],
+            "generate_download": _BOOL_STR[bool(generate_download)]
         }
         
         if storyboard_id:
@@ -773,7 +896,7 @@ class StoryboardClient(BaseClient):
             if key not in params:
                 params[key] = value
             
-        return self._make_request("GET", f"{self.storyboard_url}/media_involved", params=params)
+        return self._cached_get(f"{self.storyboard_url}/media_involved", params)
     
     # Convenience and Workflow Methods
     
@@ -858,18 +981,19 @@ class StoryboardClient(BaseClient):
         start_time = time.time()
         
         while time.time() - start_time < timeout:
-            # Use a direct API call to the job status endpoint
-            response = requests.get(
+            # Use a direct API call to the job status endpoint, over the pooled connections
+            response = (self._http2_client or self._session).get(
                 f"{self.base_url}/build/getjob", 
                 params={'job_id': job_id},
                 headers=self._get_headers()
             )
             
             if response.status_code == 200:
-                job_data = response.json()
+                job_data = _json_loads(response.content)
                 status = job_data.get('status')
                 
                 if status == "COMPLETED":
+                    self.invalidate_storyboard_cache()  # The job has rewritten the storyboard
                     return job_data
                 elif status in ["FAILED", "ERROR"]:
                     raise Exception(f"Job failed with status: {status}, message: {job_data.get('message', 'No message')}")
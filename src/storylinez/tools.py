@@ -73,10 +73,7 @@ class ToolsClient(BaseClient):
         Raises:
             ValueError: If no valid organization ID is available
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
-        return org_id
+        return self._require_org_id(org_id)
     
     def _validate_temperature(self, temperature: float) -> float:
         """
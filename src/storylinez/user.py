@@ -195,9 +195,7 @@ class UserClient(BaseClient):
             ValueError: If org_id is not provided and no default is set
             requests.RequestException: If the API call fails
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Validate org_id format
         if not org_id.startswith('org_'):
@@ -239,9 +237,7 @@ class UserClient(BaseClient):
             ValueError: If org_id is not provided and no default is set
             requests.RequestException: If the API call fails
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Validate org_id format
         if not org_id.startswith('org_'):
@@ -302,9 +298,7 @@ class UserClient(BaseClient):
             ValueError: If org_id is not provided and no default is set
             requests.RequestException: If the API call fails
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Validate org_id format
         if not org_id.startswith('org_'):
@@ -342,9 +336,7 @@ class UserClient(BaseClient):
             ValueError: If org_id is not provided and no default is set
             requests.RequestException: If the API call fails
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Validate org_id format
         if not org_id.startswith('org_'):
@@ -398,9 +390,7 @@ class UserClient(BaseClient):
             ValueError: If org_id is not provided and no default is set
             requests.RequestException: If the API call fails
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Validate org_id format
         if not org_id.startswith('org_'):
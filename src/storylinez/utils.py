@@ -188,9 +188,7 @@ class UtilsClient(BaseClient):
             >>> # Wait for job to complete
             >>> job_result = client.utils.get_job_result(job_id)
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         if not old_prompt:
             raise ValueError("old_prompt is required and cannot be empty")
@@ -316,9 +314,7 @@ class UtilsClient(BaseClient):
             >>> # Wait for job to complete
             >>> job_result = client.utils.get_job_result(job_id)
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         if not user_query:
             raise ValueError("user_query is required and cannot be empty")
@@ -415,9 +411,7 @@ class UtilsClient(BaseClient):
             >>> # Wait for job to complete
             >>> job_result = client.utils.get_job_result(job_id)
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Validate website URL
         if not website_url:
@@ -533,9 +527,7 @@ class UtilsClient(BaseClient):
             >>> # Wait for job to complete
             >>> job_result = client.utils.get_job_result(job_id)
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         if not website_url:
             raise ValueError("website_url is required")
         if not website_url.startswith(("http://", "https://")):
@@ -622,9 +614,7 @@ class UtilsClient(BaseClient):
             >>> for job in jobs.get('jobs', []):
             ...     print(f"{job.get('job_name')} - {job.get('created_at')}")
         """
-        org_id = org_id or self.default_org_id
-        if not org_id:
-            raise ValueError("Organization ID is required. Either provide org_id parameter or set a default_org_id when initializing the client.")
+        org_id = self._require_org_id(org_id)
         
         # Validate job_type if provided
         if job_type and job_type not in ["alter_prompt", "search_recommendations", "organization_info"]: